@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+ENSEMBLE BENCHMARK - Ensemble Kalman filter cost and accuracy
+Times EnsembleKalmanFilter steps for N members at d = 256 ... 4096 (full
+state observed) and, on a small linear system, compares the ensemble mean
+and spread against the exact Kalman filter
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.error_model import EnsembleKalmanFilter
+
+logging.disable(logging.INFO)
+
+def time_steps(state_dim: int, ensemble_size: int, steps: int) -> float:
+    """Milliseconds per forecast + analysis step"""
+    enkf = EnsembleKalmanFilter(state_dim, ensemble_size)
+    generator = torch.Generator().manual_seed(0)
+    observations = [torch.randn(state_dim, generator=generator) for _ in range(steps + 1)]
+    enkf.step(observations[0])
+    started = time.perf_counter()
+    for z in observations[1:]:
+        enkf.step(z)
+    return (time.perf_counter() - started) / steps * 1000.0
+
+def linear_accuracy(ensemble_size: int, steps: int = 20, state_dim: int = 4, q: float = 0.01, r: float = 0.1):
+    """Ensemble vs exact filter for x_t = x_{t-1} + w, z = x + v"""
+    enkf = EnsembleKalmanFilter(state_dim, ensemble_size, process_noise=q, measurement_noise=r, inflation=1.0)
+    x = torch.zeros(state_dim)
+    P = torch.eye(state_dim)
+    I = torch.eye(state_dim)
+    generator = torch.Generator().manual_seed(1)
+    for _ in range(steps):
+        z = torch.randn(state_dim, generator=generator)
+        P = P + q * I
+        K = torch.matmul(P, torch.inverse(P + r * I))
+        x = x + torch.matmul(K, z - x)
+        P = torch.matmul(I - torch.matmul(K, I), P)
+        enkf.step(z)
+    trace, _ = enkf._covariance_stats()
+    return {
+        'mean_max_abs_diff': (enkf.x_est - x).abs().max().item(),
+        'ensemble_trace': trace - q * state_dim,
+        'exact_trace': torch.trace(P).item()
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--state-dim', type=int, nargs='+', default=[256, 1024, 4096])
+    parser.add_argument('--ensemble-size', type=int, nargs='+', default=[32, 64, 128])
+    parser.add_argument('--steps', type=int, default=20)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = {'timing': [], 'accuracy': {}}
+    for state_dim in args.state_dim:
+        line = f"d={state_dim:5d}"
+        for ensemble_size in args.ensemble_size:
+            step_ms = time_steps(state_dim, ensemble_size, args.steps)
+            results['timing'].append({'state_dim': state_dim, 'ensemble_size': ensemble_size, 'step_ms': step_ms})
+            line += f"  N={ensemble_size:4d} {step_ms:8.3f}ms"
+        print(line)
+    
+    for ensemble_size in args.ensemble_size:
+        accuracy = linear_accuracy(ensemble_size)
+        results['accuracy'][ensemble_size] = accuracy
+        print(
+            f"linear d=4  N={ensemble_size:4d}  mean diff {accuracy['mean_max_abs_diff']:.3f}"
+            f"  trace {accuracy['ensemble_trace']:.4f} (exact {accuracy['exact_trace']:.4f})"
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
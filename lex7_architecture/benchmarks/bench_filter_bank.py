@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+FILTER BANK BENCHMARK - Per-object Kalman loop vs KalmanFilterBank
+Steps n independent level/trend filters, once as a Python loop over
+KalmanFilter objects and once as a single batched KalmanFilterBank, and
+reports the time per tick along with the largest estimate difference
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.error_model import KalmanFilter, KalmanFilterBank
+
+logging.disable(logging.INFO)
+
+def make_filters(n_filters: int):
+    """Per-object filters configured like the bank defaults (2D state, 1D observation)"""
+    bank = KalmanFilterBank(n_filters, 2, 1)
+    filters = []
+    for _ in range(n_filters):
+        kf = KalmanFilter(2, 2)
+        kf.observation_dim = 1
+        kf.A, kf.B, kf.H = bank.A[0].clone(), torch.zeros(2, 1), bank.H[0].clone()
+        kf.Q, kf.R = bank.Q[0].clone(), bank.R[0].clone()
+        filters.append(kf)
+    return bank, filters
+
+def run(n_filters: int, ticks: int, missing: float = 0.3, seed: int = 0):
+    generator = torch.Generator().manual_seed(seed)
+    observations = [torch.randn(n_filters, 1, generator=generator) for _ in range(ticks)]
+    masks = [torch.rand(n_filters, generator=generator) >= missing for _ in range(ticks)]
+    bank, filters = make_filters(n_filters)
+    
+    started = time.perf_counter()
+    for z, mask in zip(observations, masks):
+        for i, kf in enumerate(filters):
+            x_pred, P_pred = kf.predict(torch.zeros(1))
+            if mask[i]:
+                kf.x_est, kf.P, _ = kf.update(x_pred, P_pred, z[i])
+            else:
+                kf.x_est, kf.P = x_pred, P_pred
+    loop_time = (time.perf_counter() - started) / ticks
+    
+    started = time.perf_counter()
+    for z, mask in zip(observations, masks):
+        bank.step(z, mask=mask)
+    bank_time = (time.perf_counter() - started) / ticks
+    
+    max_diff = max((bank.x_est[i] - kf.x_est).abs().max().item() for i, kf in enumerate(filters))
+    return {
+        'n_filters': n_filters,
+        'loop_tick_ms': loop_time * 1000.0,
+        'bank_tick_ms': bank_time * 1000.0,
+        'speedup': loop_time / bank_time,
+        'max_abs_diff': max_diff
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--filters', type=int, nargs='+', default=[16, 64, 256, 1024])
+    parser.add_argument('--ticks', type=int, default=50)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    for n_filters in args.filters:
+        result = run(n_filters, args.ticks)
+        results.append(result)
+        print(
+            f"n={n_filters:5d}  loop {result['loop_tick_ms']:9.3f}ms  bank {result['bank_tick_ms']:7.3f}ms"
+            f"  speedup {result['speedup']:6.1f}x  max diff {result['max_abs_diff']:.1e}"
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
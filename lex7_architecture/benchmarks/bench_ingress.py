@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+INGRESS BENCHMARK - Per-message vs batched BARK signature verification
+Verifies the same set of signed messages one at a time (hmac.new per
+message, as process_incoming_message used to) and in batches through the
+BatchVerifier, inline and across a worker pool, reporting messages/second
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.communication.bark_protocol import BARKMessage, MessageType
+from src.communication.ingress import BatchVerifier
+
+logging.disable(logging.INFO)
+
+def make_messages(count: int, payload_bytes: int, senders: int):
+    messages = []
+    for i in range(count):
+        sender = f'node_{i % senders}'
+        message = BARKMessage(
+            message_type=MessageType.STATE_SYNC,
+            sender_id=sender,
+            payload={'sequence': i, 'state': 'x' * payload_bytes}
+        )
+        message.sign(f'key_{sender}')
+        # As received: decoded from the wire, canonical bytes cached
+        messages.append(BARKMessage.from_bytes(message.to_bytes()))
+    return messages
+
+def per_message(messages) -> int:
+    return sum(message.verify_signature(f'key_{message.sender_id}') for message in messages)
+
+async def batched(messages, verifier: BatchVerifier, batch_size: int) -> int:
+    verified = 0
+    for start in range(0, len(messages), batch_size):
+        batch = messages[start:start + batch_size]
+        results = await verifier.verify([
+            (message.canonical_bytes(), message.signature, f'key_{message.sender_id}') for message in batch
+        ])
+        verified += sum(results)
+    return verified
+
+def rate(fn, count: int, repeats: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        assert fn() == count
+        best = min(best, time.perf_counter() - started)
+    return count / best
+
+def run(count: int, payload_bytes: int, batch_size: int, workers: int):
+    messages = make_messages(count, payload_bytes, senders=8)
+    inline = BatchVerifier(workers=1)
+    pooled = BatchVerifier(workers=workers, parallel_threshold=0)
+    try:
+        result = {
+            'payload_bytes': payload_bytes,
+            'messages': count,
+            'per_message': rate(lambda: per_message(messages), count),
+            'batched_inline': rate(lambda: asyncio.run(batched(messages, inline, batch_size)), count),
+            'batched_pool': rate(lambda: asyncio.run(batched(messages, pooled, batch_size)), count),
+            'workers': pooled.workers
+        }
+    finally:
+        pooled.shutdown()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--payload-bytes', type=int, nargs='+', default=[64, 4096, 65536])
+    parser.add_argument('--messages', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    for payload_bytes in args.payload_bytes:
+        result = run(args.messages, payload_bytes, args.batch_size, args.workers)
+        results.append(result)
+        print(
+            f"payload {payload_bytes:6d}B  per-message {result['per_message']:9.0f}/s  "
+            f"batched {result['batched_inline']:9.0f}/s  "
+            f"pool x{result['workers']} {result['batched_pool']:9.0f}/s"
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+KALMAN BENCHMARK - Dense vs structured Kalman filter steps
+Runs KalmanFilter and the structured, square-root and information-form
+filters on the same input stream, checks that estimates, covariances and
+error metrics agree, and reports the time per step for d = 256 ... 4096.
+A long float32 run checks that each variant's covariance stays symmetric
+and positive semi-definite, and the steady-state gain mode is compared
+against the full structured filter on the same stream
+"""
+
+import argparse
+import json
+import logging
+import math
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.error_model import KalmanFilter, StructuredKalmanFilter, KALMAN_VARIANTS
+
+logging.disable(logging.INFO)
+
+def make_inputs(steps: int, observation_dim: int, seed: int = 0):
+    generator = torch.Generator().manual_seed(seed)
+    return [
+        (torch.randn(observation_dim, generator=generator), torch.randn(observation_dim, generator=generator))
+        for _ in range(steps)
+    ]
+
+def time_filter(kf, inputs):
+    """Seconds per step and the last (error_state, control_signal)"""
+    result = None
+    started = time.perf_counter()
+    for u, z in inputs:
+        result = kf.step(u, z)
+    return (time.perf_counter() - started) / len(inputs), result
+
+def close(a: float, b: float, rtol: float = 1e-4) -> bool:
+    if math.isinf(a) or math.isinf(b):
+        return a == b
+    return abs(a - b) <= rtol * max(1.0, abs(a), abs(b))
+
+def check_parity(dense, structured, dense_result, structured_result, atol: float = 1e-5):
+    """Compare the two filters after identical input streams"""
+    dense_error, _ = dense_result
+    structured_error, _ = structured_result
+    return {
+        'x_max_abs_diff': (dense.x_est - structured.x_est).abs().max().item(),
+        'P_max_abs_diff': (dense.P - structured.P).abs().max().item(),
+        'error_magnitude': close(dense_error.error_magnitude, structured_error.error_magnitude),
+        'convergence_rate': close(dense_error.convergence_rate, structured_error.convergence_rate),
+        'covariance_logdet': close(dense_error.covariance_logdet, structured_error.covariance_logdet),
+        'ok': (
+            torch.allclose(dense.x_est, structured.x_est, atol=atol)
+            and torch.allclose(dense.P, structured.P, atol=atol)
+            and close(dense_error.error_magnitude, structured_error.error_magnitude)
+            and close(dense_error.convergence_rate, structured_error.convergence_rate)
+            and close(dense_error.covariance_logdet, structured_error.covariance_logdet)
+        )
+    }
+
+def run(state_dim: int, steps: int, dense_steps: int, observation_dim: int = 2):
+    result = {'state_dim': state_dim, 'variants': {}}
+    
+    dense_result = None
+    if dense_steps > 0:
+        # Parity: identical streams through the dense filter and each variant
+        parity_inputs = make_inputs(dense_steps, observation_dim, seed=2)
+        dense = KalmanFilter(state_dim, observation_dim)
+        dense_time, dense_result = time_filter(dense, parity_inputs)
+        result['dense_step_ms'] = dense_time * 1000.0
+    
+    for method, variant in KALMAN_VARIANTS.items():
+        kf = variant(state_dim, observation_dim)
+        step_time, _ = time_filter(kf, make_inputs(steps, observation_dim, seed=1))
+        entry = {
+            'active_dim': len(kf.active_idx) if kf.active_idx is not None else state_dim,
+            'step_ms': step_time * 1000.0
+        }
+        
+        if dense_result is not None:
+            kf = variant(state_dim, observation_dim)
+            _, variant_result = time_filter(kf, parity_inputs)
+            entry['speedup'] = dense_time / step_time
+            entry['parity'] = check_parity(dense, kf, dense_result, variant_result)
+        
+        result['variants'][method.value] = entry
+    
+    # Steady-state gain: full vs fixed-gain structured filter on one stream
+    inputs = make_inputs(steps, observation_dim, seed=4)
+    full = StructuredKalmanFilter(state_dim, observation_dim)
+    steady = StructuredKalmanFilter(state_dim, observation_dim, steady_state=True)
+    full_time, full_result = time_filter(full, inputs)
+    steady_time, steady_result = time_filter(steady, inputs)
+    result['steady_state'] = {
+        'step_ms': steady_time * 1000.0,
+        'speedup': full_time / steady_time,
+        'locked': steady.steady_state_locked,
+        'parity': check_parity(full, steady, full_result, steady_result)
+    }
+    
+    return result
+
+def run_stability(steps: int, state_dim: int = 8, observation_dim: int = 2):
+    """
+    Long float32 run with a tight measurement noise and correlated states
+    
+    Reports the covariance asymmetry and smallest eigenvalue at the end of
+    the run; a healthy filter keeps both near zero / non-negative.
+    """
+    results = {}
+    inputs = make_inputs(1000, observation_dim, seed=3)
+    for method, variant in KALMAN_VARIANTS.items():
+        kf = variant(state_dim, observation_dim)
+        # Couple the observed states to the rest and make measurements precise
+        kf.A[0, observation_dim:] = 0.05
+        kf.R = torch.eye(observation_dim) * 1e-6
+        
+        for i in range(steps):
+            u, z = inputs[i % len(inputs)]
+            kf.step(u, z)
+        
+        P = kf.P
+        asymmetry = (P - P.T).abs().max().item()
+        min_eigenvalue = torch.linalg.eigvalsh((P + P.T) / 2).min().item()
+        results[method.value] = {
+            'asymmetry': asymmetry,
+            'min_eigenvalue': min_eigenvalue,
+            'ok': asymmetry <= 1e-6 and min_eigenvalue >= -1e-6 and bool(torch.isfinite(P).all())
+        }
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--state-dim', type=int, nargs='+', default=[256, 512, 1024, 2048, 4096])
+    parser.add_argument('--steps', type=int, default=200, help="Structured filter steps per size")
+    parser.add_argument('--dense-steps', type=int, default=5, help="Dense steps per size (0 skips parity)")
+    parser.add_argument('--stability-steps', type=int, default=100000, help="Long-run steps (0 skips)")
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    failed = False
+    for state_dim in args.state_dim:
+        result = run(state_dim, args.steps, args.dense_steps)
+        results.append(result)
+        
+        line = f"d={state_dim:5d}"
+        if 'dense_step_ms' in result:
+            line += f"  dense {result['dense_step_ms']:10.2f}ms"
+        for name, entry in result['variants'].items():
+            line += f"  {name} {entry['step_ms']:7.3f}ms"
+            if 'parity' in entry:
+                line += f" ({'ok' if entry['parity']['ok'] else 'MISMATCH'})"
+                failed |= not entry['parity']['ok']
+        steady = result['steady_state']
+        line += (
+            f"  steady_state {steady['step_ms']:7.3f}ms"
+            f" ({'ok' if steady['parity']['ok'] and steady['locked'] else 'MISMATCH'})"
+        )
+        failed |= not (steady['parity']['ok'] and steady['locked'])
+        print(line)
+    
+    stability = None
+    if args.stability_steps > 0:
+        stability = run_stability(args.stability_steps)
+        for name, entry in stability.items():
+            print(
+                f"{args.stability_steps} steps  {name:20s} asymmetry {entry['asymmetry']:.2e}"
+                f"  min eigenvalue {entry['min_eigenvalue']:+.2e}  {'ok' if entry['ok'] else 'DEGRADED'}"
+            )
+    
+    if args.json:
+        args.json.write_text(json.dumps({'sizes': results, 'stability': stability}, indent=2))
+    
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+PID BANK BENCHMARK - Per-object PID loop vs PIDBank
+Steps n error channels, once as a Python loop over PIDController objects
+and once as a single PIDBank call, and reports the time per tick with the
+largest output difference (filtering and limits off for comparability)
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.error_model import PIDController, PIDBank
+
+logging.disable(logging.INFO)
+
+def run(n_channels: int, ticks: int, seed: int = 0):
+    errors = np.random.default_rng(seed).normal(size=(ticks, n_channels)).astype(np.float32)
+    controllers = [PIDController() for _ in range(n_channels)]
+    bank = PIDBank(n_channels, integral_limit=None, derivative_tau=0.0)
+    
+    started = time.perf_counter()
+    for row in errors:
+        outputs = [controller.step(float(error)).correction_magnitude for controller, error in zip(controllers, row)]
+    loop_time = (time.perf_counter() - started) / ticks
+    
+    # Same first step as PIDController (derivative against a zero previous error)
+    bank.initialized = True
+    started = time.perf_counter()
+    for row in errors:
+        output = bank.step(torch.from_numpy(row))
+    bank_time = (time.perf_counter() - started) / ticks
+    
+    return {
+        'n_channels': n_channels,
+        'loop_tick_ms': loop_time * 1000.0,
+        'bank_tick_ms': bank_time * 1000.0,
+        'speedup': loop_time / bank_time,
+        'max_abs_diff': float(np.abs(np.abs(output.numpy()) - np.array(outputs)).max())
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--channels', type=int, nargs='+', default=[16, 256, 4096])
+    parser.add_argument('--ticks', type=int, default=50)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    for n_channels in args.channels:
+        result = run(n_channels, args.ticks)
+        results.append(result)
+        print(
+            f"n={n_channels:5d}  loop {result['loop_tick_ms']:9.3f}ms  bank {result['bank_tick_ms']:7.3f}ms"
+            f"  speedup {result['speedup']:7.1f}x  max diff {result['max_abs_diff']:.1e}"
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
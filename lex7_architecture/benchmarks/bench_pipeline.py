@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+PIPELINE BENCHMARK - Serial vs pipelined directive throughput
+Runs the same directive stream through LexNode.process_directive serially
+and through the staged DirectivePipeline, and reports directives/sec
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.lex_node import LexNode
+
+def make_bench_config(state_dim: int, workdir: Path) -> Path:
+    """Write a copy of the node config sized for the benchmark"""
+    with open(ROOT / "config" / "lex_config.yaml", 'r') as f:
+        config = yaml.safe_load(f)
+    
+    config['model'].update(input_dim=state_dim, hidden_dim=state_dim, state_dim=state_dim)
+    config['lex_node']['state_vector_path'] = str(workdir / "node_state.pt")
+    config['lex_node']['execution_mode'] = 'serial'
+    # The whole stream is submitted at once; measure capacity, not CoDel shedding
+    config['admission']['protected_priority'] = 4
+    # The copy lives outside config/, so point the Axiom Hives at the repo's directories
+    for hive in ('axiom_hive', 'financial_axiom_hive'):
+        hive_config = config['sovereign'].get(hive)
+        if hive_config:
+            hive_config['directory'] = str(ROOT / "config" / hive_config['directory'])
+    
+    config_path = workdir / "bench_config.yaml"
+    with open(config_path, 'w') as f:
+        yaml.safe_dump(config, f)
+    return config_path
+
+def make_directives(count: int):
+    return [
+        {
+            'id': f"bench_{i}",
+            'command': 'analyze_intent',
+            'parameters': {'user_input': f"benchmark directive {i}"},
+            'signature': 'local_signature',
+            'timestamp': time.time()
+        }
+        for i in range(count)
+    ]
+
+async def run(state_dim: int, count: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = make_bench_config(state_dim, Path(tmp))
+        directives = make_directives(count)
+        
+        # Serial path
+        node = LexNode(config_path, "bench_serial")
+        started = time.perf_counter()
+        serial = [await node.process_directive(d) for d in directives]
+        serial_time = time.perf_counter() - started
+        
+        # Pipelined path (fresh node so both start from the same state)
+        node = LexNode(config_path, "bench_pipelined")
+        await node.start_pipeline()
+        started = time.perf_counter()
+        pipelined = await node.process_directives(directives)
+        pipelined_time = time.perf_counter() - started
+        stage_metrics = node.pipeline.get_metrics()['stages']
+        await node.stop_pipeline()
+    
+    return {
+        'state_dim': state_dim,
+        'directives': count,
+        'serial': {
+            'seconds': serial_time,
+            'throughput': count / serial_time,
+            'succeeded': sum(r.status == 'success' for r in serial)
+        },
+        'pipelined': {
+            'seconds': pipelined_time,
+            'throughput': count / pipelined_time,
+            'succeeded': sum(r.status == 'success' for r in pipelined),
+            'stages': stage_metrics
+        },
+        'speedup': serial_time / pipelined_time
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--state-dim', type=int, nargs='+', default=[256, 1024])
+    parser.add_argument('--directives', type=int, default=200)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    for state_dim in args.state_dim:
+        result = asyncio.run(run(state_dim, args.directives))
+        results.append(result)
+        print(
+            f"d={state_dim:5d}  serial {result['serial']['throughput']:8.1f}/s  "
+            f"pipelined {result['pipelined']['throughput']:8.1f}/s  "
+            f"speedup {result['speedup']:.2f}x"
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+RESPONSE CODEC BENCHMARK - Full vs compact LexResponse encoding
+Compares the full response (asdict(error_state) serialised as JSON) against
+the compact binary form, reporting encoded size and encode time
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import torch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.error_model import ErrorState
+from src.core.lex_node import LexResponse
+from src.core.response_codec import VectorHandle
+
+def _tensor_default(value):
+    if isinstance(value, torch.Tensor):
+        return value.tolist()
+    return float(value)
+
+def make_response(state_dim: int, compact: bool) -> LexResponse:
+    error_state = ErrorState(
+        error_magnitude=0.42,
+        error_vector=torch.randn(state_dim),
+        convergence_rate=0.9,
+        stability_indicator=0.8,
+        divergence_risk=0.1
+    )
+    return LexResponse(
+        status='success',
+        directive_id='bench_directive',
+        correction={'type': 'bark_correction', 'magnitude': 0.12, 'action': 'stabilize'},
+        confidence=0.87,
+        convergence_achieved=False,
+        error_state=error_state.summary() if compact else asdict(error_state),
+        processing_time=0.004,
+        metadata={'validation_compliance': 1.0, 'control_action': 'stabilize', 'node_id': 'bench'},
+        error_vector=VectorHandle(error_state.error_vector) if compact else None
+    )
+
+def time_encode(fn, iterations: int):
+    payload = fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return len(payload), (time.perf_counter() - started) / iterations
+
+def run(state_dim: int, iterations: int):
+    full = make_response(state_dim, compact=False)
+    compact = make_response(state_dim, compact=True)
+    
+    full_size, full_time = time_encode(
+        lambda: json.dumps(asdict(full), default=_tensor_default).encode('utf-8'), iterations
+    )
+    compact_size, compact_time = time_encode(compact.to_bytes, iterations)
+    vector_size, vector_time = time_encode(lambda: compact.to_bytes(include_vector=True), iterations)
+    
+    # Round trip must preserve the vector exactly
+    decoded = LexResponse.from_bytes(compact.to_bytes(include_vector=True))
+    assert torch.equal(decoded.error_vector.tensor(), compact.error_vector.tensor())
+    
+    return {
+        'state_dim': state_dim,
+        'full': {'bytes': full_size, 'encode_us': full_time * 1e6},
+        'compact': {'bytes': compact_size, 'encode_us': compact_time * 1e6},
+        'compact_with_vector': {'bytes': vector_size, 'encode_us': vector_time * 1e6},
+        'size_ratio': full_size / compact_size,
+        'time_ratio': full_time / compact_time
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--state-dim', type=int, nargs='+', default=[256, 1024, 4096])
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    for state_dim in args.state_dim:
+        result = run(state_dim, args.iterations)
+        results.append(result)
+        print(
+            f"d={state_dim:5d}  full {result['full']['bytes']:8d}B {result['full']['encode_us']:9.1f}us  "
+            f"compact {result['compact']['bytes']:5d}B {result['compact']['encode_us']:7.1f}us  "
+            f"(+vector {result['compact_with_vector']['bytes']:6d}B)  "
+            f"size {result['size_ratio']:.0f}x  time {result['time_ratio']:.0f}x"
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK SUITE - Error model and validator microbenchmarks
+Sweeps KalmanFilter.step (state_dim x observation_dim),
+AdaptiveErrorModel.step (state_dim x history length), PIDController.step
+and SovereignDirectiveValidator.validate_directive (axiom count x history
+length, with the validation cache off so the engine is measured; one
+cached case per axiom count measures the hit path). Each case runs in a fresh spawned process, so peak RSS belongs to
+that case alone, and reports ops/sec, Python allocations per op
+(tracemalloc) and peak RSS. Results go to JSON for benchmarks/compare.py.
+Needs only the repo's Python dependencies - no services, no GPU.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from queue import Empty
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+logging.disable(logging.INFO)
+
+AXIOM_TYPES = ("wealth_preservation", "time_efficiency", "health_priority")
+
+def make_kalman(state_dim: int, observation_dim: int, seed: int) -> Callable[[], Any]:
+    import torch
+    from src.core.error_model import KalmanFilter
+    
+    generator = torch.Generator().manual_seed(seed)
+    kf = KalmanFilter(state_dim, observation_dim)
+    inputs = [
+        (torch.randn(observation_dim, generator=generator), torch.randn(observation_dim, generator=generator))
+        for _ in range(64)
+    ]
+    cycle = itertools.cycle(inputs)
+    
+    def op():
+        u, z = next(cycle)
+        return kf.step(u, z)
+    return op
+
+def make_adaptive(state_dim: int, history: int, seed: int) -> Callable[[], Any]:
+    import torch
+    from src.core.error_model import AdaptiveErrorModel
+    from src.core.streaming_stats import SlidingWindowStats
+    
+    generator = torch.Generator().manual_seed(seed)
+    model = AdaptiveErrorModel(state_dim)
+    model.adaptation_window = history
+    model.performance_stats = SlidingWindowStats(history)
+    model.performance_history = model.performance_stats.values
+    target = torch.zeros(state_dim)
+    states = [torch.randn(state_dim, generator=generator) for _ in range(64)]
+    
+    # Fill the history so the sweep measures a full window
+    for i in range(history):
+        model.performance_stats.push(float(i % 7))
+    cycle = itertools.cycle(states)
+    
+    def op():
+        return model.step(next(cycle), target)
+    return op
+
+def make_pid(seed: int) -> Callable[[], Any]:
+    import numpy as np
+    from src.core.error_model import PIDController
+    
+    controller = PIDController()
+    cycle = itertools.cycle(np.random.default_rng(seed).normal(size=1024).tolist())
+    
+    def op():
+        return controller.step(next(cycle))
+    return op
+
+def make_axioms(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": f"axiom_{i}",
+            "type": AXIOM_TYPES[i % len(AXIOM_TYPES)],
+            "rule": f"rule_{i}",
+            "weight": 1.0,
+            "mandatory": False
+        }
+        for i in range(count)
+    ]
+
+def make_validator(axioms: int, history: int, seed: int, cache_size: int = 0) -> Callable[[], Any]:
+    from src.core.error_model import SovereignDirectiveValidator
+    
+    # The 64 directives below cycle, so with the cache on every op after the first pass is a hit
+    validator = SovereignDirectiveValidator({"compliance_threshold": 0.95, "validation_cache_size": cache_size})
+    validator.sovereign_axioms = make_axioms(axioms)
+    directives = [
+        {
+            "command": command,
+            "parameters": {"budget": 10 * i, "available_runway": 1000, "task": "t", "estimated_time": 2, "expected_output": i % 3},
+            "signature": "sig",
+            "timestamp": f"2025-01-01T00:00:{i % 60:02d}"
+        }
+        for i, command in enumerate(["spend on tools", "plan day", "skip sleep tonight", "purchase course"] * 16)
+    ]
+    for i in range(history):
+        validator.validate_directive(directives[i % len(directives)])
+    cycle = itertools.cycle(directives)
+    
+    def op():
+        return validator.validate_directive(next(cycle))
+    return op
+
+BENCHMARKS = {
+    'kalman_step': make_kalman,
+    'adaptive_step': make_adaptive,
+    'pid_step': make_pid,
+    'validate_directive': make_validator
+}
+
+def build_cases(args) -> List[Dict[str, Any]]:
+    cases = []
+    for state_dim, observation_dim in itertools.product(args.state_dim, args.observation_dim):
+        if observation_dim <= state_dim:
+            cases.append({'benchmark': 'kalman_step', 'params': {'state_dim': state_dim, 'observation_dim': observation_dim}})
+    for state_dim, history in itertools.product(args.state_dim, args.history):
+        cases.append({'benchmark': 'adaptive_step', 'params': {'state_dim': state_dim, 'history': max(2, history)}})
+    cases.append({'benchmark': 'pid_step', 'params': {}})
+    for axioms, history in itertools.product(args.axioms, args.history):
+        cases.append({'benchmark': 'validate_directive', 'params': {'axioms': axioms, 'history': history, 'cache_size': 0}})
+    for axioms in args.axioms:
+        cases.append({'benchmark': 'validate_directive', 'params': {'axioms': axioms, 'history': min(args.history), 'cache_size': 1024}})
+    return cases
+
+def measure(op: Callable[[], Any], min_time: float, repeats: int, alloc_ops: int) -> Dict[str, float]:
+    """Timing repeats of at least `min_time` seconds, then a traced allocation pass"""
+    op()  # warm-up
+    
+    rates = []
+    for _ in range(repeats):
+        ops = 0
+        started = time.perf_counter()
+        while True:
+            op()
+            ops += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time and ops >= 3:
+                break
+        rates.append(ops / elapsed)
+    
+    # Python-heap allocations; native tensor storage is not traced
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(alloc_ops):
+        op()
+    blocks_after = sys.getallocatedblocks()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        'ops_per_sec': statistics.median(rates),
+        'ops_per_sec_min': min(rates),
+        'ops_per_sec_max': max(rates),
+        'mean_us': 1e6 / statistics.median(rates),
+        'alloc_peak_bytes': peak - before,
+        'alloc_retained_bytes_per_op': (current - before) / alloc_ops,
+        'alloc_retained_blocks_per_op': (blocks_after - blocks_before) / alloc_ops
+    }
+
+def peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # bytes on macOS, KiB on Linux
+
+def run_case(case: Dict[str, Any], settings: Dict[str, Any], queue):
+    """Child-process entry point"""
+    import torch
+    
+    torch.manual_seed(settings['seed'])
+    torch.set_num_threads(settings['threads'])
+    logging.disable(logging.INFO)
+    
+    op = BENCHMARKS[case['benchmark']](**case['params'], seed=settings['seed'])
+    result = measure(op, settings['min_time'], settings['repeats'], settings['alloc_ops'])
+    result['peak_rss_kb'] = peak_rss_kb()
+    queue.put(result)
+
+def environment(threads: int) -> Dict[str, Any]:
+    import numpy as np
+    import torch
+    
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'torch': torch.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': multiprocessing.cpu_count(),
+        'threads': threads,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--state-dim', type=int, nargs='+', default=[64, 256, 1024])
+    parser.add_argument('--observation-dim', type=int, nargs='+', default=[2, 16])
+    parser.add_argument('--history', type=int, nargs='+', default=[100, 10000])
+    parser.add_argument('--axioms', type=int, nargs='+', default=[3, 30, 300])
+    parser.add_argument('--benchmark', choices=sorted(BENCHMARKS), nargs='+', help="Run only these benchmarks")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Seconds per timing repeat")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--alloc-ops', type=int, default=20, help="Operations in the traced allocation pass")
+    parser.add_argument('--threads', type=int, default=1, help="torch intra-op threads")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    settings = {
+        'min_time': args.min_time,
+        'repeats': args.repeats,
+        'alloc_ops': args.alloc_ops,
+        'threads': args.threads,
+        'seed': args.seed
+    }
+    cases = [case for case in build_cases(args) if not args.benchmark or case['benchmark'] in args.benchmark]
+    
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for case in cases:
+        queue = context.Queue()
+        process = context.Process(target=run_case, args=(case, settings, queue))
+        process.start()
+        while True:
+            try:
+                result = queue.get(timeout=1.0)
+                break
+            except Empty:
+                if not process.is_alive():
+                    raise RuntimeError(f"{case['benchmark']} {case['params']} exited with code {process.exitcode}")
+        process.join()
+        
+        results.append({**case, **result})
+        params = ' '.join(f"{key}={value}" for key, value in case['params'].items())
+        print(
+            f"{case['benchmark']:20s} {params:32s} {result['ops_per_sec']:12.1f} ops/s"
+            f"  alloc peak {result['alloc_peak_bytes'] / 1024:9.1f}KiB"
+            f"  retained {result['alloc_retained_bytes_per_op']:8.1f}B/op"
+            f"  rss {result['peak_rss_kb'] / 1024:7.1f}MiB"
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps({'environment': environment(args.threads), 'settings': settings, 'results': results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+TRANSPORT BENCHMARK - Per-message frames vs coalesced frames over loopback
+Sends small BARK messages (heartbeat-sized) between two protocols connected
+by create_loopback_mesh, with the producer yielding to the event loop after
+every message as real handlers do. Compares one frame and write per message
+(flush_interval 0) against coalescing (size threshold + flush timer),
+reporting delivered messages/second, frames and writes, and the one-way
+latency of a CRITICAL message sent while coalescing
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.communication.bark_protocol import BARKMessage, BARKProtocol, MessageType, Priority
+from src.communication.transport import create_loopback_mesh
+
+logging.disable(logging.WARNING)
+
+async def run_mode(kind: str, messages: int, coalesce: bool, flush_interval_us: float):
+    sender = BARKProtocol("sender", "sender_key", "sender_pub")
+    receiver = BARKProtocol("receiver", "receiver_key", "receiver_pub", admission_config={'max_queue_size': messages + 16})
+    options = {'flush_interval': flush_interval_us / 1e6} if coalesce else {'flush_interval': 0, 'frame_bytes': 1}
+    transports = await create_loopback_mesh([sender, receiver], kind=kind, **options)
+    
+    async def send_one(i: int, priority: Priority = Priority.NORMAL):
+        await sender.send_message(BARKMessage(
+            message_type=MessageType.HEARTBEAT,
+            sender_id="sender",
+            recipient_id="receiver",
+            priority=priority,
+            payload={'status': 'alive', 'sequence': i}
+        ))
+    
+    try:
+        # Warm up the connections
+        await send_one(-1)
+        await send_one(-1, Priority.CRITICAL)
+        while receiver.incoming_queue.qsize() < 2:
+            await asyncio.sleep(0.001)
+        while not receiver.incoming_queue.empty():
+            receiver.incoming_queue.get_nowait()
+        lanes = transports[0].peers['receiver']
+        frames_before = sum(link.metrics.frames_sent for link in lanes)
+        writes_before = sum(link.metrics.write_batches for link in lanes)
+        
+        started = time.perf_counter()
+        for i in range(messages):
+            await send_one(i)
+            await asyncio.sleep(0)
+        while receiver.incoming_queue.qsize() < messages:
+            await asyncio.sleep(0.0005)
+        elapsed = time.perf_counter() - started
+        frames = sum(link.metrics.frames_sent for link in lanes) - frames_before
+        writes = sum(link.metrics.write_batches for link in lanes) - writes_before
+        while not receiver.incoming_queue.empty():
+            receiver.incoming_queue.get_nowait()
+        
+        # One-way latency of a CRITICAL message (flushed at once, never waits for the timer)
+        latencies = []
+        for i in range(50):
+            sent = time.perf_counter()
+            await send_one(i, Priority.CRITICAL)
+            await receiver.incoming_queue.get()
+            latencies.append(time.perf_counter() - sent)
+        latencies.sort()
+        
+        return {
+            'mode': 'coalesced' if coalesce else 'per_message',
+            'messages_per_s': messages / elapsed,
+            'frames': frames,
+            'writes': writes,
+            'messages_per_frame': messages / max(frames, 1),
+            'critical_latency_us_p50': latencies[len(latencies) // 2] * 1e6
+        }
+    finally:
+        for transport in transports:
+            await transport.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--transport', choices=['tcp', 'unix'], nargs='+', default=['tcp', 'unix'])
+    parser.add_argument('--messages', type=int, default=20000)
+    parser.add_argument('--flush-interval-us', type=float, default=500)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    for kind in args.transport:
+        modes = [asyncio.run(run_mode(kind, args.messages, coalesce, args.flush_interval_us)) for coalesce in (False, True)]
+        for result in modes:
+            result['transport'] = kind
+            results.append(result)
+            print(
+                f"{kind:4s} {result['mode']:11s} {result['messages_per_s']:9.0f} msg/s  "
+                f"frames {result['frames']:6d}  writes {result['writes']:6d}  "
+                f"({result['messages_per_frame']:.1f} msg/frame)  "
+                f"critical p50 {result['critical_latency_us_p50']:.0f}us"
+            )
+        print(f"{kind:4s} speedup {modes[1]['messages_per_s'] / modes[0]['messages_per_s']:.1f}x")
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+BARK WIRE BENCHMARK - JSON vs binary BARKMessage encoding
+Compares the legacy wire form (asdict + json.dumps, json.loads + from_dict,
+HMAC over the JSON) against the binary envelope with both payload codecs,
+for a heartbeat, a directive and a large numeric payload. Signatures always
+cover the default codec's bytes, so sign+verify is reported for that codec
+only
+"""
+
+import argparse
+import copy
+import hashlib
+import hmac
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.communication.bark_codec import DEFAULT_CODEC
+from src.communication.bark_protocol import BARKMessage, MessageType, Priority
+
+KEY = 'bench_key'
+
+def make_message(kind: str) -> BARKMessage:
+    if kind == 'heartbeat':
+        message_type, payload = MessageType.HEARTBEAT, {'node_id': 'lex-1', 'timestamp': time.time()}
+    elif kind == 'directive':
+        message_type, payload = MessageType.DIRECTIVE, {
+            'directive_id': 'bench_directive',
+            'action': 'health_check',
+            'parameters': {'check_type': 'full', 'components': ['kernel', 'error_model', 'validator']},
+            'constraints': {'max_latency_ms': 50, 'mandatory': True}
+        }
+    else:
+        message_type, payload = MessageType.STATE_SYNC, {'state': [i * 0.001 for i in range(1000)]}
+    return BARKMessage(
+        message_id=f'bench_{kind}',
+        message_type=message_type,
+        priority=Priority.NORMAL,
+        sender_id='lex-1',
+        recipient_id='lex-2',
+        timestamp=time.time(),
+        payload=payload
+    )
+
+def legacy_encode(message: BARKMessage) -> bytes:
+    data = copy.deepcopy(message.to_dict())  # as asdict() did
+    return json.dumps(data, sort_keys=True).encode('utf-8')
+
+def legacy_decode(data: bytes) -> BARKMessage:
+    return BARKMessage.from_dict(json.loads(data))
+
+def legacy_sign_verify(message: BARKMessage) -> bool:
+    signature = hmac.new(KEY.encode(), legacy_encode(message), hashlib.sha256).hexdigest()
+    expected = hmac.new(KEY.encode(), legacy_encode(message), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature, expected)
+
+def binary_encode(message: BARKMessage, codec: str) -> bytes:
+    message.invalidate()  # time a cold encode, not the cached bytes
+    return message.to_bytes(codec)
+
+def binary_sign_verify(message: BARKMessage) -> bool:
+    message.invalidate()
+    return message.sign(KEY).verify_signature(KEY)
+
+def time_op(fn, iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+def run(kind: str, iterations: int):
+    message = make_message(kind)
+    legacy = legacy_encode(message)
+    result = {
+        'payload': kind,
+        'legacy': {
+            'bytes': len(legacy),
+            'encode_us': time_op(lambda: legacy_encode(message), iterations) * 1e6,
+            'decode_us': time_op(lambda: legacy_decode(legacy), iterations) * 1e6,
+            'sign_verify_us': time_op(lambda: legacy_sign_verify(message), iterations) * 1e6
+        }
+    }
+    for codec in ('pack', 'json'):
+        encoded = message.to_bytes(codec)
+        assert BARKMessage.from_bytes(encoded) == message
+        result[codec] = {
+            'bytes': len(encoded),
+            'encode_us': time_op(lambda: binary_encode(message, codec), iterations) * 1e6,
+            'decode_us': time_op(lambda: BARKMessage.from_bytes(encoded), iterations) * 1e6,
+            'sign_verify_us': (
+                time_op(lambda: binary_sign_verify(message), iterations) * 1e6 if codec == DEFAULT_CODEC else None
+            )
+        }
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--payload', choices=['heartbeat', 'directive', 'large'], nargs='+',
+                        default=['heartbeat', 'directive', 'large'])
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = []
+    for kind in args.payload:
+        result = run(kind, args.iterations)
+        results.append(result)
+        for form in ('legacy', 'pack', 'json'):
+            row = result[form]
+            sign_verify = f"{row['sign_verify_us']:8.1f}us" if row['sign_verify_us'] is not None else f"{'-':>10s}"
+            print(
+                f"{kind:9s} {form:6s} {row['bytes']:7d}B  encode {row['encode_us']:8.1f}us  "
+                f"decode {row['decode_us']:8.1f}us  sign+verify {sign_verify}"
+            )
+    
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
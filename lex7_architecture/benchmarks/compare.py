@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK COMPARE - Flag regressions between two bench_suite.py runs
+Matches cases by benchmark name and parameters and flags a regression when
+ops/sec drops, or retained allocations / peak RSS grow, by more than the
+given fractions. Exits non-zero if anything regressed, so it can gate CI:
+
+    python benchmarks/bench_suite.py --json base.json      # on the old commit
+    python benchmarks/bench_suite.py --json head.json      # on the new commit
+    python benchmarks/compare.py base.json head.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+def case_key(result: Dict[str, Any]) -> Tuple:
+    return (result['benchmark'],) + tuple(sorted(result['params'].items()))
+
+def load(path: Path) -> Dict[Tuple, Dict[str, Any]]:
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return {case_key(result): result for result in data['results']}
+
+def compare(
+    baseline: Dict[Tuple, Dict[str, Any]],
+    candidate: Dict[Tuple, Dict[str, Any]],
+    speed_threshold: float,
+    alloc_threshold: float,
+    rss_threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    One row per case present in both runs
+    
+    Args:
+        baseline: Results of the reference run, keyed by case
+        candidate: Results of the run under test, keyed by case
+        speed_threshold: Allowed fractional ops/sec drop
+        alloc_threshold: Allowed fractional growth of retained bytes per op
+        rss_threshold: Allowed fractional peak RSS growth
+    
+    Returns:
+        rows: Case, ratios and the list of regressed metrics
+    """
+    rows = []
+    for key in sorted(baseline.keys() & candidate.keys(), key=str):
+        old, new = baseline[key], candidate[key]
+        speed_ratio = new['ops_per_sec'] / old['ops_per_sec']
+        rss_ratio = new['peak_rss_kb'] / old['peak_rss_kb']
+        
+        regressions = []
+        if speed_ratio < 1.0 - speed_threshold:
+            regressions.append('ops_per_sec')
+        # Retained bytes are tiny and noisy near zero, so allow a small absolute slack
+        old_alloc = old['alloc_retained_bytes_per_op']
+        new_alloc = new['alloc_retained_bytes_per_op']
+        if new_alloc > max(old_alloc, 0.0) * (1.0 + alloc_threshold) + 64:
+            regressions.append('alloc_retained_bytes_per_op')
+        if rss_ratio > 1.0 + rss_threshold:
+            regressions.append('peak_rss_kb')
+        
+        rows.append({
+            'benchmark': old['benchmark'],
+            'params': old['params'],
+            'speed_ratio': speed_ratio,
+            'alloc_delta_bytes_per_op': new_alloc - old_alloc,
+            'rss_ratio': rss_ratio,
+            'regressions': regressions
+        })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline', type=Path)
+    parser.add_argument('candidate', type=Path)
+    parser.add_argument('--speed-threshold', type=float, default=0.10, help="Allowed ops/sec drop (fraction)")
+    parser.add_argument('--alloc-threshold', type=float, default=0.25, help="Allowed retained-bytes growth (fraction)")
+    parser.add_argument('--rss-threshold', type=float, default=0.10, help="Allowed peak RSS growth (fraction)")
+    parser.add_argument('--json', type=Path, help="Write the comparison to this JSON file")
+    args = parser.parse_args()
+    
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    rows = compare(baseline, candidate, args.speed_threshold, args.alloc_threshold, args.rss_threshold)
+    
+    for row in rows:
+        params = ' '.join(f"{key}={value}" for key, value in row['params'].items())
+        status = 'REGRESSION ' + ','.join(row['regressions']) if row['regressions'] else 'ok'
+        print(
+            f"{row['benchmark']:20s} {params:32s} speed x{row['speed_ratio']:6.2f}"
+            f"  alloc {row['alloc_delta_bytes_per_op']:+9.1f}B/op  rss x{row['rss_ratio']:5.2f}  {status}"
+        )
+    
+    for label, missing in (('baseline', candidate.keys() - baseline.keys()), ('candidate', baseline.keys() - candidate.keys())):
+        for key in sorted(missing, key=str):
+            print(f"{key[0]:20s} {' '.join(f'{k}={v}' for k, v in key[1:]):32s} not in {label}")
+    
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2))
+    
+    regressed = sum(1 for row in rows if row['regressions'])
+    print(f"{len(rows)} cases compared, {regressed} regressed")
+    if regressed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
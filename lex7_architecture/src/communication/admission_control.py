@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+ADMISSION CONTROL - Load Shedding for LEX-7 Nodes
+Implements CoDel-style (Controlled Delay) admission control so overloaded
+Lex Nodes refuse work early instead of queueing it until memory runs out
+"""
+
+import math
+import time
+from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from enum import Enum
+import logging
+
+logger = logging.getLogger(__name__)
+
+class RejectionReason(Enum):
+    """Reasons a unit of work can be refused at admission"""
+    EXPIRED = "expired"
+    DEADLINE_UNMEETABLE = "deadline_unmeetable"
+    OVERLOADED = "overloaded"
+    QUEUE_FULL = "queue_full"
+
+@dataclass
+class AdmissionDecision:
+    """Result of an admission check"""
+    admitted: bool
+    reason: Optional[RejectionReason] = None
+    retry_after: float = 0.0  # Seconds the sender should wait before retrying
+    
+    @classmethod
+    def admit(cls) -> 'AdmissionDecision':
+        return cls(admitted=True)
+    
+    @classmethod
+    def reject(cls, reason: RejectionReason, retry_after: float = 0.0) -> 'AdmissionDecision':
+        return cls(admitted=False, reason=reason, retry_after=retry_after)
+
+class CoDelAdmissionController:
+    """
+    CoDel-style admission controller
+    
+    Tracks the sojourn time (queue delay) of work items as they are dequeued.
+    When the minimum delay stays above `target_delay` for a whole `interval`
+    the controller enters the dropping state, during which:
+    - queued items below the protected priority are dropped at dequeue
+      at the CoDel control-law rate (interval / sqrt(count))
+    - new items below the protected priority are rejected at admission,
+      before they consume any memory
+    
+    Priorities follow the BARK convention: lower value = more important.
+    """
+    
+    def __init__(
+        self,
+        max_queue_size: int = 1024,
+        target_delay: float = 0.005,
+        interval: float = 0.100,
+        protected_priority: int = 2
+    ):
+        """
+        Args:
+            max_queue_size: Hard bound on queued work items
+            target_delay: Acceptable standing queue delay in seconds
+            interval: Window over which delay must exceed target before shedding
+            protected_priority: Priorities <= this value are never shed for delay
+        """
+        self.max_queue_size = max_queue_size
+        self.target_delay = target_delay
+        self.interval = interval
+        self.protected_priority = protected_priority
+        
+        # CoDel state machine
+        self.first_above_time = 0.0
+        self.drop_next = 0.0
+        self.drop_count = 0
+        self.last_drop_count = 0
+        self.dropping = False
+        
+        # Delay estimate used for retry-after hints and deadline checks
+        self.last_sojourn = 0.0
+        
+        # Shedding counters
+        self.admitted = 0
+        self.shed: Dict[str, int] = {reason.value: 0 for reason in RejectionReason}
+        self.dropped_at_dequeue = 0
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'CoDelAdmissionController':
+        """Create a controller from the `admission` configuration section"""
+        config = config or {}
+        return cls(
+            max_queue_size=config.get('max_queue_size', 1024),
+            target_delay=config.get('target_delay_ms', 5) / 1000.0,
+            interval=config.get('interval_ms', 100) / 1000.0,
+            protected_priority=config.get('protected_priority', 2)
+        )
+    
+    def _control_law(self, t: float) -> float:
+        """Next drop time: spacing shrinks with sqrt(count) while delay persists"""
+        return t + self.interval / math.sqrt(max(1, self.drop_count))
+    
+    def retry_after_hint(self) -> float:
+        """Suggested back-off for rejected senders"""
+        if self.dropping:
+            return self.last_sojourn + self.interval / math.sqrt(max(1, self.drop_count))
+        return max(self.last_sojourn, self.target_delay)
+    
+    def admit(
+        self,
+        priority: int,
+        queue_size: int = 0,
+        deadline: Optional[float] = None,
+        now: Optional[float] = None
+    ) -> AdmissionDecision:
+        """
+        Decide whether to accept a new work item
+        
+        Args:
+            priority: Item priority (1 = CRITICAL ... 4 = LOW)
+            queue_size: Current number of queued items
+            deadline: Absolute time (time.time()) by which the item must complete
+            now: Current time, defaults to time.time()
+        
+        Returns:
+            AdmissionDecision
+        """
+        if now is None:
+            now = time.time()
+        
+        decision = None
+        if deadline is not None and now >= deadline:
+            decision = AdmissionDecision.reject(RejectionReason.EXPIRED)
+        elif deadline is not None and now + self.last_sojourn >= deadline:
+            # Would expire while waiting in the queue - refuse it now
+            decision = AdmissionDecision.reject(
+                RejectionReason.DEADLINE_UNMEETABLE, self.retry_after_hint()
+            )
+        elif queue_size >= self.max_queue_size:
+            decision = AdmissionDecision.reject(
+                RejectionReason.QUEUE_FULL, self.retry_after_hint()
+            )
+        elif self.dropping and priority > self.protected_priority:
+            decision = AdmissionDecision.reject(
+                RejectionReason.OVERLOADED, self.retry_after_hint()
+            )
+        
+        if decision is None:
+            self.admitted += 1
+            return AdmissionDecision.admit()
+        
+        self.shed[decision.reason.value] += 1
+        return decision
+    
+    def on_dequeue(
+        self,
+        sojourn: float,
+        priority: int,
+        queue_size: int = 0,
+        now: Optional[float] = None
+    ) -> bool:
+        """
+        Update the CoDel state with the sojourn time of a dequeued item
+        
+        Args:
+            sojourn: Time the item spent queued, in seconds
+            priority: Item priority
+            queue_size: Items still queued after this dequeue
+            now: Current time, defaults to time.time()
+        
+        Returns:
+            True if the item should be dropped instead of processed
+        """
+        if now is None:
+            now = time.time()
+        
+        self.last_sojourn = sojourn
+        
+        # Is the standing delay above target for a full interval?
+        ok_to_drop = False
+        if sojourn < self.target_delay or queue_size == 0:
+            self.first_above_time = 0.0
+        elif self.first_above_time == 0.0:
+            self.first_above_time = now + self.interval
+        elif now >= self.first_above_time:
+            ok_to_drop = True
+        
+        sheddable = priority > self.protected_priority
+        drop = False
+        
+        if self.dropping:
+            if not ok_to_drop:
+                self.dropping = False
+                logger.info("Admission control left dropping state")
+            elif now >= self.drop_next and sheddable:
+                drop = True
+                self.drop_count += 1
+                self.drop_next = self._control_law(self.drop_next)
+        elif ok_to_drop:
+            self.dropping = True
+            drop = sheddable
+            # Resume near the previous drop rate if we were dropping recently
+            delta = self.drop_count - self.last_drop_count
+            if delta > 1 and now - self.drop_next < 16 * self.interval:
+                self.drop_count = delta
+            else:
+                self.drop_count = 1
+            self.last_drop_count = self.drop_count
+            self.drop_next = self._control_law(now)
+            logger.warning(f"Admission control entered dropping state (sojourn {sojourn * 1000:.1f}ms)")
+        
+        if drop:
+            self.dropped_at_dequeue += 1
+        
+        return drop
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get admission and shedding metrics"""
+        return {
+            'admitted': self.admitted,
+            'shed': dict(self.shed),
+            'shed_total': sum(self.shed.values()) + self.dropped_at_dequeue,
+            'dropped_at_dequeue': self.dropped_at_dequeue,
+            'dropping': self.dropping,
+            'last_sojourn_ms': self.last_sojourn * 1000.0
+        }
+
+def priority_value(priority: Any, default: int = 3) -> int:
+    """Normalise a priority given as Priority enum, int or name to its int value"""
+    if priority is None:
+        return default
+    if hasattr(priority, 'value'):
+        return int(priority.value)
+    if isinstance(priority, str):
+        names = {'critical': 1, 'high': 2, 'normal': 3, 'low': 4}
+        return names.get(priority.lower(), default)
+    return int(priority)
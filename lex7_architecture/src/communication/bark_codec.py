@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+BARK CODEC - Binary wire format for BARK messages
+A fixed struct header (type, priority, codec, ttl, timestamp and the
+lengths of the id strings) followed by the id strings and the encoded
+payload form the body - the bytes a signature covers. The signature
+travels as a trailer after the body, so signing never re-encodes the
+message and the signed bytes are a prefix of the wire bytes. Payload
+codecs are looked up in a registry by the id carried in the header; the
+default "pack" codec writes the MessagePack layout for the JSON data model
+(nil, bool, int, float64, str, bin, array, map) with map keys sorted, so
+equal payloads always encode to equal bytes, and moves arrays of floats
+with one struct call. Decoding reads the header and id fields straight
+from a memoryview over the received buffer, and any malformed input raises
+WireFormatError
+"""
+
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BARK_MAGIC = b"BK"
+WIRE_VERSION = 2
+
+# magic, version, codec id, message type code, priority, flags, ttl,
+# timestamp, then the lengths of message_id, sender_id, recipient_id,
+# public_key and the payload
+HEADER = struct.Struct("!2sBBBBBId4HI")
+
+# Signature trailer: length, then the signature text
+SIGNATURE = struct.Struct("!H")
+
+FLAG_RECIPIENT = 0x01
+FLAG_PUBLIC_KEY = 0x02
+
+class WireFormatError(ValueError):
+    """A buffer that is not a valid BARK wire message"""
+
+@dataclass(frozen=True, slots=True)
+class PayloadCodec:
+    """Encoder/decoder pair for message payloads"""
+    codec_id: int
+    name: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[memoryview], Any]
+
+PAYLOAD_CODECS: Dict[int, PayloadCodec] = {}
+CODECS_BY_NAME: Dict[str, PayloadCodec] = {}
+
+def register_payload_codec(codec: PayloadCodec):
+    """Add (or replace) a payload codec; ids are carried on the wire, so never reuse one"""
+    if not 0 < codec.codec_id < 256:
+        raise ValueError("codec_id must fit in one byte and 0 is reserved")
+    PAYLOAD_CODECS[codec.codec_id] = codec
+    CODECS_BY_NAME[codec.name] = codec
+
+def get_codec(codec: str) -> PayloadCodec:
+    try:
+        return CODECS_BY_NAME[codec]
+    except KeyError:
+        raise ValueError(f"Unknown payload codec: {codec}") from None
+
+# MessagePack-layout payload codec
+
+_UINT8 = struct.Struct("!BB")
+_UINT16 = struct.Struct("!BH")
+_UINT32 = struct.Struct("!BI")
+_UINT64 = struct.Struct("!BQ")
+_INT8 = struct.Struct("!Bb")
+_INT16 = struct.Struct("!Bh")
+_INT32 = struct.Struct("!Bi")
+_INT64 = struct.Struct("!Bq")
+_FLOAT64 = struct.Struct("!Bd")
+
+def _pack_length(out: bytearray, n: int, fix_base: int, fix_limit: int, code8: Optional[int], code16: int, code32: int):
+    if n < fix_limit:
+        out.append(fix_base | n)
+    elif code8 is not None and n < 0x100:
+        out += _UINT8.pack(code8, n)
+    elif n < 0x10000:
+        out += _UINT16.pack(code16, n)
+    else:
+        out += _UINT32.pack(code32, n)
+
+def _pack_int(out: bytearray, value: int):
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xff)
+    elif value >= 0:
+        if value < 0x100:
+            out += _UINT8.pack(0xcc, value)
+        elif value < 0x10000:
+            out += _UINT16.pack(0xcd, value)
+        elif value < 0x100000000:
+            out += _UINT32.pack(0xce, value)
+        elif value < 0x10000000000000000:
+            out += _UINT64.pack(0xcf, value)
+        else:
+            raise OverflowError(f"Integer {value} does not fit in 64 bits")
+    elif value >= -0x80:
+        out += _INT8.pack(0xd0, value)
+    elif value >= -0x8000:
+        out += _INT16.pack(0xd1, value)
+    elif value >= -0x80000000:
+        out += _INT32.pack(0xd2, value)
+    elif value >= -0x8000000000000000:
+        out += _INT64.pack(0xd3, value)
+    else:
+        raise OverflowError(f"Integer {value} does not fit in 64 bits")
+
+# Arrays at least this long whose items are all float64 are packed and
+# unpacked with one struct call instead of one per item
+_BULK_FLOATS = 8
+
+def _pack_floats(out: bytearray, values):
+    """Float64 items: the type bytes and the doubles interleaved by slice assignment"""
+    n = len(values)
+    raw = struct.pack(f"!{n}d", *values)
+    items = bytearray(9 * n)
+    items[0::9] = b"\xcb" * n
+    for k in range(8):
+        items[k + 1::9] = raw[k::8]
+    out += items
+
+def _pack_value(out: bytearray, value: Any):
+    kind = type(value)
+    if kind is str:
+        data = value.encode('utf-8')
+        _pack_length(out, len(data), 0xa0, 32, 0xd9, 0xda, 0xdb)
+        out += data
+    elif kind is float:
+        out += _FLOAT64.pack(0xcb, value)
+    elif kind is dict:
+        _pack_length(out, len(value), 0x80, 16, None, 0xde, 0xdf)
+        for key in sorted(value):
+            _pack_value(out, key)
+            _pack_value(out, value[key])
+    elif kind is int:
+        _pack_int(out, value)
+    elif value is None:
+        out.append(0xc0)
+    elif kind is bool:
+        out.append(0xc3 if value else 0xc2)
+    elif kind is list or kind is tuple:
+        _pack_length(out, len(value), 0x90, 16, None, 0xdc, 0xdd)
+        if len(value) >= _BULK_FLOATS and all(type(item) is float for item in value):
+            _pack_floats(out, value)
+        else:
+            for item in value:
+                _pack_value(out, item)
+    elif kind is bytes or kind is bytearray or kind is memoryview:
+        _pack_length(out, len(value), 0x00, 0, 0xc4, 0xc5, 0xc6)
+        out += value
+    # Subclasses (numpy float64, IntEnum, OrderedDict, ...) - the slow path
+    elif isinstance(value, bool):
+        out.append(0xc3 if value else 0xc2)
+    elif isinstance(value, int):
+        _pack_int(out, int(value))
+    elif isinstance(value, float):
+        out += _FLOAT64.pack(0xcb, float(value))
+    elif isinstance(value, str):
+        _pack_value(out, str(value))
+    elif isinstance(value, dict):
+        _pack_value(out, dict(value))
+    elif isinstance(value, (list, tuple)):
+        _pack_value(out, list(value))
+    else:
+        raise TypeError(f"Object of type {kind.__name__} is not serializable in a BARK payload")
+
+def pack(value: Any) -> bytes:
+    """Encode a JSON-model value in the MessagePack layout (map keys sorted)"""
+    out = bytearray()
+    _pack_value(out, value)
+    return bytes(out)
+
+_FIXED = {0xc0: None, 0xc2: False, 0xc3: True}
+_FLOAT64_VALUE = struct.Struct("!d")
+# code -> (struct, payload kind): 'int' / 'float' values, or the length of a 'str' / 'bin' / 'array' / 'map'
+_SIZED = {
+    0xcc: (struct.Struct("!B"), 'int'), 0xcd: (struct.Struct("!H"), 'int'),
+    0xce: (struct.Struct("!I"), 'int'), 0xcf: (struct.Struct("!Q"), 'int'),
+    0xd0: (struct.Struct("!b"), 'int'), 0xd1: (struct.Struct("!h"), 'int'),
+    0xd2: (struct.Struct("!i"), 'int'), 0xd3: (struct.Struct("!q"), 'int'),
+    0xca: (struct.Struct("!f"), 'float'), 0xcb: (struct.Struct("!d"), 'float'),
+    0xd9: (struct.Struct("!B"), 'str'), 0xda: (struct.Struct("!H"), 'str'), 0xdb: (struct.Struct("!I"), 'str'),
+    0xc4: (struct.Struct("!B"), 'bin'), 0xc5: (struct.Struct("!H"), 'bin'), 0xc6: (struct.Struct("!I"), 'bin'),
+    0xdc: (struct.Struct("!H"), 'array'), 0xdd: (struct.Struct("!I"), 'array'),
+    0xde: (struct.Struct("!H"), 'map'), 0xdf: (struct.Struct("!I"), 'map')
+}
+
+# Nesting limit for decoded payloads - deeper input is rejected instead of
+# exhausting the interpreter stack
+MAX_PAYLOAD_DEPTH = 64
+
+def _unpack_floats(data: bytes, i: int, n: int) -> Optional[Tuple[List[float], int]]:
+    """n float64 items in one unpack, or None if the array holds anything else"""
+    end = i + 9 * n
+    # Check the length before building the pattern - n comes off the wire
+    if end > len(data) or data[i:end:9] != b"\xcb" * n:
+        return None
+    return list(struct.unpack_from("!" + "xd" * n, data, i)), end
+
+def _unpack_value(data: bytes, i: int, depth: int) -> Tuple[Any, int]:
+    code = data[i]
+    i += 1
+    if code < 0x80:
+        return code, i
+    if 0xa0 <= code < 0xc0:
+        end = i + (code & 0x1f)
+        return data[i:end].decode('utf-8'), end
+    if code >= 0xe0:
+        return code - 0x100, i
+    if code == 0xcb:
+        return _FLOAT64_VALUE.unpack_from(data, i)[0], i + 8
+    if 0x80 <= code < 0x90:
+        kind, n = 'map', code & 0x0f
+    elif 0x90 <= code < 0xa0:
+        kind, n = 'array', code & 0x0f
+    elif code in _FIXED:
+        return _FIXED[code], i
+    else:
+        try:
+            layout, kind = _SIZED[code]
+        except KeyError:
+            raise WireFormatError(f"Unsupported payload type byte 0x{code:02x}") from None
+        n = layout.unpack_from(data, i)[0]
+        i += layout.size
+        if kind == 'int' or kind == 'float':
+            return n, i
+    
+    if kind == 'str':
+        return data[i:i + n].decode('utf-8'), i + n
+    if kind == 'bin':
+        return data[i:i + n], i + n
+    
+    if depth >= MAX_PAYLOAD_DEPTH:
+        raise WireFormatError(f"Payload nested deeper than {MAX_PAYLOAD_DEPTH} levels")
+    depth += 1
+    if kind == 'array':
+        if n >= _BULK_FLOATS:
+            floats = _unpack_floats(data, i, n)
+            if floats is not None:
+                return floats
+        items = []
+        for _ in range(n):
+            item, i = _unpack_value(data, i, depth)
+            items.append(item)
+        return items, i
+    
+    mapping = {}
+    for _ in range(n):
+        code = data[i]
+        if 0xa0 <= code < 0xc0:
+            # Short string key, the common case, decoded inline
+            end = i + 1 + (code & 0x1f)
+            key = data[i + 1:end].decode('utf-8')
+            i = end
+        else:
+            key, i = _unpack_value(data, i, depth)
+            if type(key) is list or type(key) is dict:
+                raise WireFormatError(f"Unhashable map key of type {type(key).__name__}")
+        mapping[key], i = _unpack_value(data, i, depth)
+    return mapping, i
+
+def unpack(data) -> Any:
+    """
+    Decode one MessagePack-layout value spanning all of `data`
+    
+    The payload is copied to bytes once: slicing and decoding strings from
+    bytes is cheaper than through a memoryview.
+    
+    Raises:
+        WireFormatError: Truncated, trailing or otherwise malformed input
+    """
+    data = bytes(data)
+    try:
+        value, end = _unpack_value(data, 0, 0)
+    except (IndexError, struct.error) as e:
+        raise WireFormatError(f"Truncated payload: {e}") from e
+    except UnicodeDecodeError as e:
+        raise WireFormatError(f"Invalid UTF-8 in payload: {e}") from e
+    except (RecursionError, TypeError) as e:
+        raise WireFormatError(f"Malformed payload: {e}") from e
+    # Slices are clamped, so a string or float run cut short shows up here
+    if end > len(data):
+        raise WireFormatError(f"Truncated payload: {end - len(data)} bytes missing")
+    if end != len(data):
+        raise WireFormatError(f"{len(data) - end} trailing bytes after payload")
+    return value
+
+def _json_encode(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def _json_decode(view: memoryview) -> Any:
+    try:
+        return json.loads(bytes(view))
+    except RecursionError as e:
+        raise WireFormatError(f"Payload nested too deeply: {e}") from e
+    except ValueError as e:
+        raise WireFormatError(f"Invalid JSON payload: {e}") from e
+
+register_payload_codec(PayloadCodec(1, "json", _json_encode, _json_decode))
+register_payload_codec(PayloadCodec(2, "pack", pack, unpack))
+
+# "pack" is smaller than "json" and faster for small maps and numeric
+# arrays (see benchmarks/bench_wire.py); the json module's C scanner still
+# decodes string-heavy maps (directives) ~20% faster than the pure-Python
+# decoder
+DEFAULT_CODEC = "pack"
+
+def _encode_text(value: Optional[str]) -> bytes:
+    return value.encode('utf-8') if value is not None else b""
+
+def encode_body(
+    type_code: int,
+    priority: int,
+    ttl: int,
+    timestamp: float,
+    message_id: str,
+    sender_id: str,
+    recipient_id: Optional[str],
+    public_key: Optional[str],
+    payload: Any,
+    codec: str = DEFAULT_CODEC
+) -> bytes:
+    """
+    Encode the signed part of one message
+    
+    Args:
+        type_code: Wire code of the message type
+        priority: Priority value (1 = critical ... 4 = low)
+        ttl: Time to live in seconds
+        timestamp: Creation time (seconds since the epoch)
+        message_id, sender_id, recipient_id, public_key: Id fields;
+            None is distinct from an empty string
+        payload: JSON-model payload
+        codec: Payload codec name
+    
+    Returns:
+        body: Header, id strings and payload
+    """
+    payload_codec = get_codec(codec)
+    encoded = payload_codec.encode(payload)
+    texts = (
+        message_id.encode('utf-8'), sender_id.encode('utf-8'),
+        _encode_text(recipient_id), _encode_text(public_key)
+    )
+    flags = (
+        (FLAG_RECIPIENT if recipient_id is not None else 0)
+        | (FLAG_PUBLIC_KEY if public_key is not None else 0)
+    )
+    header = HEADER.pack(
+        BARK_MAGIC, WIRE_VERSION, payload_codec.codec_id, type_code, priority, flags, ttl, timestamp,
+        *map(len, texts), len(encoded)
+    )
+    return b"".join((header, *texts, encoded))
+
+def encode_signature(signature: Optional[str]) -> bytes:
+    """Signature trailer appended to a body; empty for unsigned messages"""
+    if signature is None:
+        return b""
+    encoded = signature.encode('utf-8')
+    return SIGNATURE.pack(len(encoded)) + encoded
+
+def decode_envelope(data) -> Tuple:
+    """
+    Decode one message from a bytes-like buffer without copying it
+    
+    Returns:
+        fields: (type_code, priority, ttl, timestamp, message_id, sender_id,
+        recipient_id, public_key, payload, codec_id, body_length, signature)
+    """
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    if len(view) < HEADER.size:
+        raise WireFormatError(f"Buffer of {len(view)} bytes is shorter than the header")
+    (
+        magic, version, codec_id, type_code, priority, flags, ttl, timestamp,
+        id_length, sender_length, recipient_length, key_length, payload_length
+    ) = HEADER.unpack_from(view)
+    if magic != BARK_MAGIC or version != WIRE_VERSION:
+        raise WireFormatError(f"Not a BARK v{WIRE_VERSION} message (magic {bytes(magic)!r}, version {version})")
+    
+    offset = HEADER.size
+    end = offset + id_length + sender_length + recipient_length + key_length + payload_length
+    if len(view) < end:
+        raise WireFormatError(f"Length mismatch: header describes {end} bytes, buffer has {len(view)}")
+    
+    codec = PAYLOAD_CODECS.get(codec_id)
+    if codec is None:
+        raise WireFormatError(f"Unknown payload codec id {codec_id}")
+    
+    # Every decode failure surfaces as WireFormatError, so a receiver can
+    # skip one malformed message and keep its connection
+    try:
+        texts = []
+        for length in (id_length, sender_length, recipient_length, key_length):
+            texts.append(str(view[offset:offset + length], 'utf-8'))
+            offset += length
+        message_id, sender_id, recipient_id, public_key = texts
+        payload = codec.decode(view[offset:end])
+    except WireFormatError:
+        raise
+    except (ValueError, TypeError, RecursionError) as e:
+        raise WireFormatError(f"Malformed message: {e}") from e
+    
+    signature = None
+    if len(view) > end:
+        if len(view) < end + SIGNATURE.size:
+            raise WireFormatError("Truncated signature trailer")
+        (signature_length,) = SIGNATURE.unpack_from(view, end)
+        start = end + SIGNATURE.size
+        if len(view) != start + signature_length:
+            raise WireFormatError(
+                f"Length mismatch: signature trailer describes {start + signature_length} bytes, "
+                f"buffer has {len(view)}"
+            )
+        try:
+            signature = str(view[start:], 'utf-8')
+        except UnicodeDecodeError as e:
+            raise WireFormatError(f"Invalid UTF-8 in signature: {e}") from e
+    
+    return (
+        type_code, priority, ttl, timestamp, message_id, sender_id,
+        recipient_id if flags & FLAG_RECIPIENT else None,
+        public_key if flags & FLAG_PUBLIC_KEY else None,
+        payload, codec_id, end, signature
+    )
\ No newline at end of file
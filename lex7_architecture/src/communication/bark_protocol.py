@@ -10,12 +10,16 @@ import json
 import time
 import hashlib
 import hmac
-from typing import Dict, Any, Optional, List, Callable, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Callable, Tuple, Union
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 from pathlib import Path
 import logging
 
+from .admission_control import CoDelAdmissionController, AdmissionDecision, RejectionReason
+from .ingress import BatchVerifier
+from .bark_codec import DEFAULT_CODEC, decode_envelope, encode_body, encode_signature, get_codec
+
 logger = logging.getLogger(__name__)
 
 class MessageType(Enum):
@@ -36,6 +40,20 @@ class Priority(Enum):
     NORMAL = 3
     LOW = 4
 
+# Wire codes of the message types - never renumber, only append
+MESSAGE_TYPE_CODES = {
+    MessageType.DIRECTIVE: 1,
+    MessageType.RESPONSE: 2,
+    MessageType.STATE_SYNC: 3,
+    MessageType.HEARTBEAT: 4,
+    MessageType.DISCOVERY: 5,
+    MessageType.ROUTING_UPDATE: 6,
+    MessageType.ERROR: 7,
+    MessageType.CRYPTO_SIGNED: 8
+}
+MESSAGE_TYPES_BY_CODE = {code: message_type for message_type, code in MESSAGE_TYPE_CODES.items()}
+DEFAULT_CODEC_ID = get_codec(DEFAULT_CODEC).codec_id
+
 @dataclass
 class BARKMessage:
     """Base BARK protocol message structure"""
@@ -49,6 +67,9 @@ class BARKMessage:
     payload: Dict[str, Any] = None
     signature: Optional[str] = None
     public_key: Optional[str] = None
+    # Serialised forms, computed once and keyed on what they were built from
+    _canonical: Optional[Tuple[tuple, Union[bytes, memoryview]]] = field(default=None, init=False, repr=False, compare=False)
+    _wire: Optional[Tuple[Union[bytes, memoryview], Optional[str], Union[bytes, memoryview]]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -64,11 +85,19 @@ class BARKMessage:
         return hashlib.sha256(content.encode()).hexdigest()[:16]
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization"""
-        data = asdict(self)
-        data['message_type'] = self.message_type.value
-        data['priority'] = self.priority.value
-        return data
+        """Convert to dictionary for serialization (the payload is shared, not copied)"""
+        return {
+            'message_type': self.message_type.value,
+            'sender_id': self.sender_id,
+            'recipient_id': self.recipient_id,
+            'message_id': self.message_id,
+            'timestamp': self.timestamp,
+            'priority': self.priority.value,
+            'ttl': self.ttl,
+            'payload': self.payload,
+            'signature': self.signature,
+            'public_key': self.public_key
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BARKMessage':
@@ -78,12 +107,118 @@ class BARKMessage:
         data['priority'] = Priority(data['priority'])
         return cls(**data)
     
+    def to_json(self) -> str:
+        """Readable JSON form, for debugging and logs"""
+        return json.dumps(self.to_dict(), sort_keys=True, indent=2)
+    
+    @classmethod
+    def from_json(cls, text: str) -> 'BARKMessage':
+        return cls.from_dict(json.loads(text))
+    
+    def _canonical_fields(self) -> tuple:
+        # Compared against the cached tuple on every use: reassigning any field
+        # (the payload by identity first) invalidates the cached bytes
+        return (
+            self.message_type, self.priority, self.ttl, self.timestamp, self.message_id,
+            self.sender_id, self.recipient_id, self.public_key, self.payload
+        )
+    
+    def invalidate(self):
+        """Drop the cached bytes after mutating the payload in place"""
+        self._canonical = None
+        self._wire = None
+    
+    def canonical_bytes(self) -> Union[bytes, memoryview]:
+        """
+        Canonical body (everything but the signature), serialised once
+        
+        Reused until a field is reassigned; the payload is treated as
+        immutable once serialised (call invalidate() after changing it in place).
+        For a decoded message this is a view into the received buffer.
+        """
+        fields = self._canonical_fields()
+        cached = self._canonical
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+        canonical = encode_body(
+            MESSAGE_TYPE_CODES[self.message_type], self.priority.value, self.ttl, self.timestamp,
+            self.message_id, self.sender_id, self.recipient_id, self.public_key, self.payload
+        )
+        self._canonical = (fields, canonical)
+        return canonical
+    
+    def to_bytes(self, codec: str = DEFAULT_CODEC) -> Union[bytes, memoryview]:
+        """
+        Binary wire form: the canonical body followed by the signature trailer
+        
+        Args:
+            codec: Payload codec name (see bark_codec.PAYLOAD_CODECS); only the
+                default codec's bytes are cached
+        """
+        if codec != DEFAULT_CODEC:
+            return encode_body(
+                MESSAGE_TYPE_CODES[self.message_type], self.priority.value, self.ttl, self.timestamp,
+                self.message_id, self.sender_id, self.recipient_id, self.public_key, self.payload, codec
+            ) + encode_signature(self.signature)
+        
+        canonical = self.canonical_bytes()
+        cached = self._wire
+        if cached is not None and cached[0] is canonical and cached[1] == self.signature:
+            return cached[2]
+        wire = b"".join((canonical, encode_signature(self.signature))) if self.signature is not None else canonical
+        self._wire = (canonical, self.signature, wire)
+        return wire
+    
+    @property
+    def wire_size(self) -> int:
+        """Size of the wire form in bytes"""
+        return len(self.to_bytes())
+    
+    @classmethod
+    def from_bytes(cls, data) -> 'BARKMessage':
+        """
+        Decode the binary wire form
+        
+        The received body is kept as the message's canonical bytes, so
+        verifying or forwarding it does not serialise it again. A read-only
+        buffer (bytes, or a memoryview over bytes) is kept by reference -
+        the cached bytes are slices of it; a writable one is copied, since
+        its owner may reuse it.
+        
+        Args:
+            data: bytes, bytearray or memoryview; read in place
+        """
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        (
+            type_code, priority, ttl, timestamp, message_id, sender_id,
+            recipient_id, public_key, payload, codec_id, body_length, signature
+        ) = decode_envelope(view)
+        message = cls(
+            message_type=MESSAGE_TYPES_BY_CODE[type_code],
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+            message_id=message_id,
+            timestamp=timestamp,
+            priority=Priority(priority),
+            ttl=ttl,
+            payload=payload,
+            signature=signature,
+            public_key=public_key
+        )
+        if codec_id == DEFAULT_CODEC_ID:
+            if view.readonly:
+                canonical, wire = view[:body_length], (data if type(data) is bytes else view)
+            else:
+                canonical, wire = bytes(view[:body_length]), bytes(view)
+            message._canonical = (message._canonical_fields(), canonical)
+            message._wire = (canonical, signature, wire)
+        return message
+    
     def sign(self, private_key: str) -> 'BARKMessage':
         """Sign the message with private key"""
-        content = json.dumps(self.to_dict(), sort_keys=True)
         signature = hmac.new(
             private_key.encode(),
-            content.encode(),
+            self.canonical_bytes(),
             hashlib.sha256
         ).hexdigest()
         
@@ -95,10 +230,9 @@ class BARKMessage:
         if not self.signature:
             return False
         
-        content = json.dumps(self.to_dict(), sort_keys=True)
         expected_signature = hmac.new(
             public_key.encode(),
-            content.encode(),
+            self.canonical_bytes(),
             hashlib.sha256
         ).hexdigest()
         
@@ -134,6 +268,24 @@ class BARKResponse:
     result: Dict[str, Any]
     error: Optional[str] = None
     processing_time: Optional[float] = None
+    retry_after: Optional[float] = None  # Back-off hint for rejected directives
+    
+    @classmethod
+    def rejected(
+        cls,
+        directive_id: str,
+        reason: str,
+        retry_after: float = 0.0
+    ) -> 'BARKResponse':
+        """Create a Rejected response for a directive refused at admission"""
+        return cls(
+            response_id=f"rejected_{directive_id}",
+            directive_id=directive_id,
+            status="rejected",
+            result={'reason': reason, 'retry_after': retry_after},
+            error=reason,
+            retry_after=retry_after
+        )
     
     def to_message(self, sender_id: str, recipient_id: str) -> BARKMessage:
         """Convert to BARK message"""
@@ -154,18 +306,41 @@ class BARKProtocol:
     It handles secure, authenticated messaging between Lex Nodes.
     """
     
-    def __init__(self, node_id: str, private_key: str, public_key: str):
+    def __init__(
+        self,
+        node_id: str,
+        private_key: str,
+        public_key: str,
+        admission_config: Optional[Dict[str, Any]] = None,
+        ingress_config: Optional[Dict[str, Any]] = None
+    ):
         self.node_id = node_id
         self.private_key = private_key
         self.public_key = public_key
         
+        # Admission control (bounded queues + CoDel load shedding)
+        self.admission = CoDelAdmissionController.from_config(admission_config)
+        self.shed_outgoing = 0
+        
+        # Traffic accounting, from the messages' cached wire bytes
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        
+        # Ingress verification (batched, keyed HMAC states)
+        ingress_config = ingress_config or {}
+        self.verifier = BatchVerifier.from_config(ingress_config)
+        self.ingress_batch_size = ingress_config.get('batch_size', 64)
+        self.peer_keys: Dict[str, str] = {}  # sender_id -> verification key
+        self.expired_incoming = 0
+        
         # Message handlers
         self.message_handlers: Dict[MessageType, Callable] = {}
         self.directive_handlers: Dict[str, Callable] = {}
         
         # Message queues and pending requests
-        self.incoming_queue = asyncio.Queue()
-        self.outgoing_queue = asyncio.Queue()
+        # incoming_queue holds (enqueued_at, message) so queue delay can be measured
+        self.incoming_queue = asyncio.Queue(maxsize=self.admission.max_queue_size)
+        self.outgoing_queue = asyncio.Queue(maxsize=self.admission.max_queue_size)
         self.pending_directives: Dict[str, asyncio.Future] = {}
         
         # Connection management
@@ -227,15 +402,21 @@ class BARKProtocol:
             True if sent successfully, False otherwise
         """
         try:
-            # Sign the message
-            message = message.sign(self.private_key)
+            # Sign the message (keyed state reused across messages)
+            message.signature = self.verifier.keyring.sign(self.private_key, message.canonical_bytes())
             
-            # Add to outgoing queue
-            await self.outgoing_queue.put(message)
+            # Add to outgoing queue (bounded - shed instead of growing without limit)
+            self.outgoing_queue.put_nowait(message)
+            self.bytes_sent += message.wire_size
             
             logger.debug(f"Sent {message.message_type.value} message {message.message_id}")
             return True
             
+        except asyncio.QueueFull:
+            self.shed_outgoing += 1
+            logger.warning(f"Outgoing queue full, shed {message.message_type.value} message {message.message_id}")
+            return False
+        
         except Exception as e:
             logger.error(f"Error sending message: {e}")
             return False
@@ -301,6 +482,124 @@ class BARKProtocol:
         """Register handler for specific directive command"""
         self.directive_handlers[command] = handler
     
+    def _message_deadline(self, message: BARKMessage) -> float:
+        """Absolute time after which the message is no longer worth processing"""
+        deadline = message.timestamp + message.ttl
+        
+        directive_data = message.payload.get('directive') if message.message_type == MessageType.DIRECTIVE else None
+        if directive_data and directive_data.get('timeout') is not None:
+            deadline = min(deadline, message.timestamp + directive_data['timeout'])
+        
+        return deadline
+    
+    async def receive_message(self, message: BARKMessage) -> AdmissionDecision:
+        """
+        Admit an incoming message into the bounded incoming queue
+        
+        Expired, low-priority (while overloaded) and over-capacity messages are
+        refused up front. Refused directives are answered with a Rejected
+        BARKResponse carrying a retry-after hint.
+        
+        Args:
+            message: The received message
+        
+        Returns:
+            AdmissionDecision for the message
+        """
+        now = time.time()
+        decision = self.admission.admit(
+            priority=message.priority.value,
+            queue_size=self.incoming_queue.qsize(),
+            deadline=self._message_deadline(message),
+            now=now
+        )
+        
+        self.bytes_received += message.wire_size
+        if decision.admitted:
+            try:
+                self.incoming_queue.put_nowait((now, message))
+                return decision
+            except asyncio.QueueFull:
+                self.admission.admitted -= 1
+                self.admission.shed[RejectionReason.QUEUE_FULL.value] += 1
+                decision = AdmissionDecision.reject(
+                    RejectionReason.QUEUE_FULL, self.admission.retry_after_hint()
+                )
+        
+        logger.debug(f"Rejected message {message.message_id}: {decision.reason.value}")
+        await self._reject_directive(message, decision)
+        return decision
+    
+    async def next_incoming_message(self) -> BARKMessage:
+        """
+        Dequeue the next incoming message worth processing
+        
+        Applies the CoDel drop decision at dequeue time, so a standing queue
+        sheds sheddable work instead of serving it late.
+        """
+        while True:
+            enqueued_at, message = await self.incoming_queue.get()
+            if await self._keep_dequeued(enqueued_at, message):
+                return message
+    
+    async def next_incoming_batch(self, max_messages: Optional[int] = None) -> List[BARKMessage]:
+        """
+        Wait for one message worth processing, then take whatever else is
+        already queued, up to `max_messages` (default: ingress batch_size)
+        """
+        max_messages = max_messages or self.ingress_batch_size
+        batch = [await self.next_incoming_message()]
+        while len(batch) < max_messages:
+            try:
+                enqueued_at, message = self.incoming_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if await self._keep_dequeued(enqueued_at, message):
+                batch.append(message)
+        return batch
+    
+    async def _keep_dequeued(self, enqueued_at: float, message: BARKMessage) -> bool:
+        """Deadline and CoDel checks for a dequeued message; refused directives are answered"""
+        now = time.time()
+        
+        if now >= self._message_deadline(message):
+            self.admission.shed[RejectionReason.EXPIRED.value] += 1
+            await self._reject_directive(message, AdmissionDecision.reject(RejectionReason.EXPIRED))
+            return False
+        
+        drop = self.admission.on_dequeue(
+            sojourn=now - enqueued_at,
+            priority=message.priority.value,
+            queue_size=self.incoming_queue.qsize(),
+            now=now
+        )
+        if drop:
+            await self._reject_directive(
+                message,
+                AdmissionDecision.reject(RejectionReason.OVERLOADED, self.admission.retry_after_hint())
+            )
+            return False
+        
+        return True
+    
+    async def _reject_directive(self, message: BARKMessage, decision: AdmissionDecision):
+        """Answer a refused directive with a Rejected response"""
+        if message.message_type != MessageType.DIRECTIVE:
+            return
+        
+        directive_data = message.payload.get('directive') or {}
+        directive_id = directive_data.get('directive_id', message.message_id)
+        
+        response = BARKResponse.rejected(directive_id, decision.reason.value, decision.retry_after)
+        await self.send_message(response.to_message(self.node_id, message.sender_id))
+    
+    def register_peer_key(self, node_id: str, key: str):
+        """Key that verifies signatures from `node_id` (otherwise the message's own public_key is used)"""
+        self.peer_keys[node_id] = key
+    
+    def _verification_key(self, message: BARKMessage) -> str:
+        return self.peer_keys.get(message.sender_id) or message.public_key or ""
+    
     async def process_incoming_message(self, message: BARKMessage):
         """
         Process incoming BARK message
@@ -308,22 +607,65 @@ class BARKProtocol:
         Args:
             message: The message to process
         """
-        try:
-            # Verify signature
-            if not message.verify_signature(message.public_key or ""):
-                logger.warning(f"Invalid signature on message {message.message_id}")
-                return
-            
-            # Check TTL
-            if time.time() - message.timestamp > message.ttl:
+        await self.process_incoming_batch([message])
+    
+    async def process_incoming_batch(self, messages: List[BARKMessage]):
+        """
+        Verify a batch of incoming messages and route the verified ones
+        
+        Signatures are checked together (in the verifier's pool when the batch
+        is large enough). Senders are routed concurrently, each sender's
+        messages one at a time in arrival order.
+        
+        Args:
+            messages: Messages in arrival order
+        """
+        now = time.time()
+        live = []
+        for message in messages:
+            if now - message.timestamp > message.ttl:
+                self.expired_incoming += 1
                 logger.warning(f"Message {message.message_id} expired")
-                return
-            
-            # Route message
-            await self._route_message(message)
-            
+            else:
+                live.append(message)
+        if not live:
+            return
+        
+        try:
+            results = await self.verifier.verify([
+                (message.canonical_bytes(), message.signature, self._verification_key(message))
+                for message in live
+            ])
         except Exception as e:
-            logger.error(f"Error processing message {message.message_id}: {e}")
+            logger.error(f"Error verifying batch of {len(live)} messages: {e}")
+            return
+        
+        by_sender: Dict[str, List[BARKMessage]] = {}
+        for message, valid in zip(live, results):
+            if valid:
+                by_sender.setdefault(message.sender_id, []).append(message)
+            else:
+                logger.warning(f"Invalid signature on message {message.message_id}")
+        
+        if len(by_sender) == 1:
+            await self._route_in_order(next(iter(by_sender.values())))
+        elif by_sender:
+            await asyncio.gather(*(self._route_in_order(batch) for batch in by_sender.values()))
+    
+    async def _route_in_order(self, messages: List[BARKMessage]):
+        for message in messages:
+            try:
+                await self._route_message(message)
+            except Exception as e:
+                logger.error(f"Error processing message {message.message_id}: {e}")
+    
+    async def run_ingress(self):
+        """Ingress loop: drain the incoming queue in batches, verify, route"""
+        try:
+            while True:
+                await self.process_incoming_batch(await self.next_incoming_batch())
+        finally:
+            self.verifier.shutdown()
     
     async def _route_message(self, message: BARKMessage):
         """Route message to appropriate handler"""
@@ -402,6 +744,16 @@ class BARKProtocol:
             'queue_sizes': {
                 'incoming': self.incoming_queue.qsize(),
                 'outgoing': self.outgoing_queue.qsize()
+            },
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'ingress': {
+                **self.verifier.get_metrics(),
+                'expired': self.expired_incoming
+            },
+            'admission': {
+                **self.admission.get_metrics(),
+                'shed_outgoing': self.shed_outgoing
             }
         }
 
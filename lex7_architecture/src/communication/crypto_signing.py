@@ -7,7 +7,9 @@ This ensures all inter-node communication is cryptographically secure
 
 import hashlib
 import hmac
+import json
 import secrets
+import struct
 import time
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
@@ -16,6 +18,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Signed envelope: timestamp, then length-prefixed fields (_ABSENT for None)
+_TIMESTAMP = struct.Struct("!d")
+_LENGTH = struct.Struct("!I")
+_ABSENT = 0xFFFFFFFF
+
 class KeyType(Enum):
     """Types of cryptographic keys"""
     SIGNING = "signing"
@@ -92,6 +99,29 @@ class SecureMessage:
     session_key_id: Optional[str] = None
     encryption_algorithm: Optional[str] = None
     
+    def signed_bytes(self) -> bytes:
+        """
+        Bytes covered by the signature
+        
+        The payload is already serialised, so it is framed as-is - building
+        the envelope is a concatenation, not another serialisation pass.
+        """
+        parts = [_TIMESTAMP.pack(self.timestamp)]
+        for value in (
+            self.message_id.encode('utf-8'),
+            self.sender_id.encode('utf-8'),
+            self.recipient_id.encode('utf-8') if self.recipient_id is not None else None,
+            self.message_type.encode('utf-8'),
+            self.nonce,
+            self.payload
+        ):
+            if value is None:
+                parts.append(_LENGTH.pack(_ABSENT))
+            else:
+                parts.append(_LENGTH.pack(len(value)))
+                parts.append(value)
+        return b"".join(parts)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -228,10 +258,8 @@ class CryptographicManager:
         if signing_key.is_expired():
             raise ValueError(f"Signing key {key_id} is expired")
         
-        # Serialize message data
-        import json
-        message_json = json.dumps(message_data, sort_keys=True)
-        payload = message_json.encode('utf-8')
+        # Serialize message data - the only serialisation pass; the envelope frames these bytes
+        payload = json.dumps(message_data, sort_keys=True, separators=(',', ':')).encode('utf-8')
         
         # Generate nonce for replay protection
         nonce = secrets.token_bytes(16)
@@ -239,34 +267,22 @@ class CryptographicManager:
         # Create message envelope
         message_id = hashlib.sha256(f"{self.node_id}{time.time()}{secrets.token_hex(8)}".encode()).hexdigest()[:16]
         
-        envelope = {
-            'message_id': message_id,
-            'sender_id': self.node_id,
-            'recipient_id': message_data.get('recipient_id'),
-            'timestamp': time.time(),
-            'message_type': message_data.get('message_type', 'data'),
-            'payload': payload.hex(),
-            'nonce': nonce.hex()
-        }
-        
-        # Sign the envelope
-        envelope_json = json.dumps(envelope, sort_keys=True)
-        signature = self._sign_data(envelope_json.encode('utf-8'), signing_key)
-        
-        # Create secure message
         secure_msg = SecureMessage(
             message_id=message_id,
             sender_id=self.node_id,
-            recipient_id=envelope['recipient_id'],
-            timestamp=envelope['timestamp'],
-            message_type=envelope['message_type'],
+            recipient_id=message_data.get('recipient_id'),
+            timestamp=time.time(),
+            message_type=message_data.get('message_type', 'data'),
             payload=payload,
-            signature=signature,
+            signature=b"",
             nonce=nonce,
             session_key_id=f"session_{peer_node_id}" if peer_node_id else None,
             encryption_algorithm=signing_key.algorithm.value
         )
         
+        # Sign the envelope
+        secure_msg.signature = self._sign_data(secure_msg.signed_bytes(), signing_key)
+        
         return secure_msg
     
     def verify_message(self, secure_msg: SecureMessage) -> Optional[Dict[str, Any]]:
@@ -283,18 +299,7 @@ class CryptographicManager:
             return None
         
         # Verify signature
-        envelope = {
-            'message_id': secure_msg.message_id,
-            'sender_id': secure_msg.sender_id,
-            'recipient_id': secure_msg.recipient_id,
-            'timestamp': secure_msg.timestamp,
-            'message_type': secure_msg.message_type,
-            'payload': secure_msg.payload.hex(),
-            'nonce': secure_msg.nonce.hex()
-        }
-        
-        envelope_json = json.dumps(envelope, sort_keys=True)
-        is_valid = self._verify_signature(envelope_json.encode('utf-8'), secure_msg.signature, sender_key)
+        is_valid = self._verify_signature(secure_msg.signed_bytes(), secure_msg.signature, sender_key)
         
         if not is_valid:
             logger.warning(f"Invalid signature from {secure_msg.sender_id}")
@@ -310,7 +315,6 @@ class CryptographicManager:
         
         # Parse message data
         try:
-            import json
             message_data = json.loads(payload.decode('utf-8'))
             return message_data
         except Exception as e:
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+INGRESS VERIFICATION - Batched signature checks for incoming BARK messages
+Verifies a batch of signatures in a thread pool sized to the machine's
+cores. HMAC states are keyed once per key and copied per message, so a
+check costs one copy, one update over the message's cached canonical bytes
+and one digest. hashlib releases the GIL while hashing buffers of 2 KiB or
+more, so large messages verify in parallel; batches too small to amortise
+the hand-off to the pool are verified inline
+"""
+
+import hashlib
+import hmac
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (data, signature, key) - one signature check
+VerificationItem = Tuple[bytes, Optional[str], str]
+
+class HMACKeyring:
+    """
+    HMAC-SHA256 states keyed once per key
+    
+    hmac.new() hashes the padded key into fresh inner and outer states; a
+    copy() of a keyed state skips that work. The keyring is bounded (least
+    recently used key evicted first) so rotating or forged keys cannot grow
+    it without limit.
+    """
+    
+    def __init__(self, max_keys: int = 1024):
+        self.max_keys = max_keys
+        self.states: OrderedDict[str, Any] = OrderedDict()
+    
+    def state(self, key: str):
+        """Keyed HMAC state for `key` - copy it before use, never update it"""
+        state = self.states.get(key)
+        if state is None:
+            state = hmac.new(key.encode(), digestmod=hashlib.sha256)
+            self.states[key] = state
+            if len(self.states) > self.max_keys:
+                self.states.popitem(last=False)
+        else:
+            self.states.move_to_end(key)
+        return state
+    
+    def sign(self, key: str, data: bytes) -> str:
+        mac = self.state(key).copy()
+        mac.update(data)
+        return mac.hexdigest()
+
+def _verify_chunk(items: Sequence[Tuple[bytes, Optional[str], Any]]) -> List[bool]:
+    """Worker body: items carry already-keyed states, so workers never touch the keyring"""
+    results = []
+    for data, signature, state in items:
+        if not signature or not signature.isascii():
+            results.append(False)
+            continue
+        mac = state.copy()
+        mac.update(data)
+        results.append(hmac.compare_digest(mac.hexdigest(), signature))
+    return results
+
+class BatchVerifier:
+    """
+    Signature verification for batches of incoming messages
+    
+    Keys are resolved to HMAC states on the calling (event loop) thread;
+    the pool only copies and updates them.
+    """
+    
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        parallel_threshold: int = 65536,
+        max_keys: int = 1024
+    ):
+        """
+        Args:
+            workers: Pool size; None or 0 uses one worker per core
+            parallel_threshold: Batches with fewer bytes to hash are verified inline
+            max_keys: Bound on cached HMAC states
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self.keyring = HMACKeyring(max_keys)
+        self.executor: Optional[ThreadPoolExecutor] = None
+        
+        # Counters
+        self.batches = 0
+        self.parallel_batches = 0
+        self.verified = 0
+        self.rejected = 0
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'BatchVerifier':
+        """Create a verifier from the `communication.ingress` configuration section"""
+        config = config or {}
+        return cls(
+            workers=config.get('workers'),
+            parallel_threshold=config.get('parallel_threshold_bytes', 65536),
+            max_keys=config.get('max_keys', 1024)
+        )
+    
+    def verify_inline(self, items: Sequence[VerificationItem]) -> List[bool]:
+        """Verify on the calling thread"""
+        results = _verify_chunk([
+            (data, signature, self.keyring.state(key)) for data, signature, key in items
+        ])
+        self._count(results)
+        return results
+    
+    async def verify(self, items: Sequence[VerificationItem]) -> List[bool]:
+        """
+        Verify a batch, in the pool when it is large enough to pay for the hand-off
+        
+        Args:
+            items: (data, signature, key) per message
+        
+        Returns:
+            results: One bool per item, in order
+        """
+        self.batches += 1
+        total = sum(len(data) for data, _, _ in items)
+        if self.workers == 1 or len(items) < 2 or total < self.parallel_threshold:
+            return self.verify_inline(items)
+        
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='bark-verify')
+        keyed = [(data, signature, self.keyring.state(key)) for data, signature, key in items]
+        
+        # One contiguous chunk per worker keeps per-future overhead off the per-message cost
+        size = -(-len(keyed) // self.workers)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _verify_chunk, keyed[start:start + size])
+            for start in range(0, len(keyed), size)
+        ))
+        results = [result for chunk in chunks for result in chunk]
+        self.parallel_batches += 1
+        self._count(results)
+        return results
+    
+    def _count(self, results: List[bool]):
+        verified = sum(results)
+        self.verified += verified
+        self.rejected += len(results) - verified
+    
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'batches': self.batches,
+            'parallel_batches': self.parallel_batches,
+            'verified': self.verified,
+            'rejected': self.rejected,
+            'cached_keys': len(self.keyring.states)
+        }
\ No newline at end of file
@@ -0,0 +1,682 @@
+#!/usr/bin/env python3
+"""
+BARK TRANSPORT - Stream transport for BARK messages over TCP and Unix sockets
+Drains BARKProtocol.outgoing_queue onto persistent per-peer connections and
+feeds frames received from peers into BARKProtocol.receive_message (and so
+into admission control and the ingress stage). Small messages are
+coalesced: a frame carries as many length-prefixed messages (their cached
+wire bytes) as accumulate until the frame reaches the size threshold or
+the flush timer fires, and a CRITICAL message flushes at once. Everything
+ready for a connection is written with a single writelines() call; the
+receiver decodes each message straight out of the frame buffer. Each peer
+gets a small pool of connections, one per priority lane, so CRITICAL
+traffic is never queued behind bulk state syncs and order is kept within
+a lane. Broken connections are redialled with jittered exponential backoff
+"""
+
+import asyncio
+import random
+import struct
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+
+from .bark_codec import WireFormatError
+from .bark_protocol import BARKMessage, BARKProtocol, Priority
+
+logger = logging.getLogger(__name__)
+
+# Frame: body length and message count, then per message its length and wire bytes
+FRAME_HEADER = struct.Struct("!IH")
+MESSAGE_HEADER = struct.Struct("!I")
+MAX_FRAME_MESSAGES = 0xFFFF
+
+def encode_frames(messages: Sequence[bytes], frame_bytes: int) -> List[bytes]:
+    """
+    Pack messages into frames of at most `frame_bytes` body bytes (a larger
+    message gets a frame of its own)
+    
+    Returns:
+        pieces: Headers and message buffers for writelines() - messages are not copied
+    """
+    pieces = []
+    frame: List[bytes] = []
+    size = 0
+    for data in messages:
+        length = MESSAGE_HEADER.size + len(data)
+        if frame and (size + length > frame_bytes or len(frame) == MAX_FRAME_MESSAGES * 2):
+            pieces.append(FRAME_HEADER.pack(size, len(frame) // 2))
+            pieces.extend(frame)
+            frame = []
+            size = 0
+        frame.append(MESSAGE_HEADER.pack(len(data)))
+        frame.append(data)
+        size += length
+    if frame:
+        pieces.append(FRAME_HEADER.pack(size, len(frame) // 2))
+        pieces.extend(frame)
+    return pieces
+
+def iter_frame(body: bytes, count: int):
+    """
+    Yield a memoryview per message of a frame body - slices of `body`, not copies
+    
+    Raises:
+        WireFormatError: The lengths do not add up to the body
+    """
+    view = memoryview(body)
+    offset = 0
+    for _ in range(count):
+        if offset + MESSAGE_HEADER.size > len(view):
+            raise WireFormatError("Frame truncated inside a message header")
+        (length,) = MESSAGE_HEADER.unpack_from(view, offset)
+        offset += MESSAGE_HEADER.size
+        if offset + length > len(view):
+            raise WireFormatError(f"Message of {length} bytes overruns the frame")
+        yield view[offset:offset + length]
+        offset += length
+    if offset != len(view):
+        raise WireFormatError(f"{len(view) - offset} bytes after the last message of the frame")
+
+@dataclass(frozen=True, slots=True)
+class PeerAddress:
+    """Where a peer listens: tcp://host:port or unix:///path/to/socket"""
+    scheme: str
+    host: Optional[str] = None
+    port: Optional[int] = None
+    path: Optional[str] = None
+    
+    @classmethod
+    def parse(cls, address: str) -> 'PeerAddress':
+        scheme, sep, rest = address.partition("://")
+        if not sep:
+            raise ValueError(f"Address needs a scheme (tcp:// or unix://): {address}")
+        if scheme == "unix":
+            if not rest:
+                raise ValueError(f"Unix address without a path: {address}")
+            return cls(scheme, path=rest)
+        if scheme == "tcp":
+            host, sep, port = rest.rpartition(":")
+            if not sep or not port.isdigit():
+                raise ValueError(f"TCP address needs host:port: {address}")
+            return cls(scheme, host=host.strip("[]") or "0.0.0.0", port=int(port))
+        raise ValueError(f"Unsupported transport scheme: {scheme}")
+    
+    def __str__(self) -> str:
+        if self.scheme == "unix":
+            return f"unix://{self.path}"
+        return f"tcp://{self.host}:{self.port}"
+    
+    async def open(self, limit: int):
+        if self.scheme == "unix":
+            return await asyncio.open_unix_connection(self.path, limit=limit)
+        return await asyncio.open_connection(self.host, self.port, limit=limit)
+
+@dataclass(slots=True)
+class ConnectionMetrics:
+    """Counters for one connection (outbound lane or accepted inbound stream)"""
+    messages_sent: int = 0
+    messages_received: int = 0
+    frames_sent: int = 0
+    frames_received: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    write_batches: int = 0
+    flushes_size: int = 0
+    flushes_timer: int = 0
+    flushes_critical: int = 0
+    connects: int = 0
+    connect_failures: int = 0
+    errors: int = 0
+    messages_dropped: int = 0
+    decode_errors: int = 0
+    connected_at: Optional[float] = None
+    last_activity: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class PeerLink:
+    """
+    One persistent outbound connection (a lane of a peer's pool)
+    
+    Messages accumulate in a bounded deque until a flush: when `frame_bytes`
+    are pending, when the flush timer (armed by the first message after a
+    flush) fires, or at once for a CRITICAL message. They also wait there
+    while the link is connecting; when full, the oldest are dropped. A write
+    failure drops the messages of that write - BARK directives time out and
+    are retried at the protocol level.
+    
+    The timer is sub-millisecond, but an idle epoll loop sleeps in whole
+    milliseconds, so the worst-case added latency there is ~1ms.
+    """
+    
+    def __init__(
+        self,
+        node_id: str,
+        address: PeerAddress,
+        lane: int,
+        max_pending: int = 4096,
+        backoff_initial: float = 0.05,
+        backoff_max: float = 5.0,
+        connect_timeout: float = 5.0,
+        stream_limit: int = 2 ** 16,
+        frame_bytes: int = 2 ** 16,
+        flush_interval: float = 0.0005
+    ):
+        self.node_id = node_id
+        self.address = address
+        self.lane = lane
+        self.max_pending = max_pending
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.connect_timeout = connect_timeout
+        self.stream_limit = stream_limit
+        self.frame_bytes = frame_bytes
+        self.flush_interval = flush_interval
+        
+        self.pending: deque = deque()
+        self.pending_bytes = 0
+        self.flush_timer: Optional[asyncio.TimerHandle] = None
+        self.wakeup = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.failures = 0
+        self.task: Optional[asyncio.Task] = None
+        self.watch_task: Optional[asyncio.Task] = None
+        self.metrics = ConnectionMetrics()
+    
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._run(), name=f"bark-link-{self.node_id}-{self.lane}")
+    
+    def enqueue(self, data: bytes, critical: bool = False):
+        if len(self.pending) >= self.max_pending:
+            self.pending_bytes -= len(self.pending.popleft())
+            self.metrics.messages_dropped += 1
+        self.pending.append(data)
+        self.pending_bytes += len(data)
+        self.idle.clear()
+        
+        if self.wakeup.is_set():
+            return
+        if critical:
+            self.metrics.flushes_critical += 1
+            self._flush_now()
+        elif self.pending_bytes >= self.frame_bytes or self.flush_interval <= 0:
+            self.metrics.flushes_size += 1
+            self._flush_now()
+        elif self.flush_timer is None:
+            self.flush_timer = asyncio.get_running_loop().call_later(self.flush_interval, self._on_timer)
+    
+    def _on_timer(self):
+        self.flush_timer = None
+        if not self.wakeup.is_set():
+            self.metrics.flushes_timer += 1
+            self.wakeup.set()
+    
+    def _flush_now(self):
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        self.wakeup.set()
+    
+    async def _connect(self):
+        """Dial until connected, backing off exponentially (with jitter) between attempts"""
+        while True:
+            try:
+                reader, self.writer = await asyncio.wait_for(
+                    self.address.open(self.stream_limit), self.connect_timeout
+                )
+                self.watch_task = asyncio.create_task(self._watch(reader, self.writer))
+                self.failures = 0
+                self.metrics.connects += 1
+                self.metrics.connected_at = time.time()
+                logger.debug(f"Connected to {self.node_id} at {self.address} (lane {self.lane})")
+                return
+            except (OSError, asyncio.TimeoutError) as e:
+                self.metrics.connect_failures += 1
+                delay = min(self.backoff_max, self.backoff_initial * 2 ** self.failures)
+                self.failures += 1
+                logger.debug(f"Connect to {self.node_id} at {self.address} failed ({e}), retry in {delay:.2f}s")
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+    
+    async def _run(self):
+        while True:
+            if not self.pending:
+                self.idle.set()
+            await self.wakeup.wait()
+            if not self.pending:
+                self.wakeup.clear()
+                continue
+            
+            if self.writer is None:
+                await self._connect()
+            
+            batch = list(self.pending)
+            self.pending.clear()
+            self.pending_bytes = 0
+            self.wakeup.clear()
+            pieces = encode_frames(batch, self.frame_bytes)
+            
+            try:
+                self.writer.writelines(pieces)
+                await self.writer.drain()
+            except (OSError, RuntimeError) as e:
+                self.metrics.errors += 1
+                self.metrics.messages_dropped += len(batch)
+                logger.warning(f"Write to {self.node_id} at {self.address} failed: {e}; dropped {len(batch)} messages")
+                await self._close()
+                continue
+            
+            frames = len(pieces) - 2 * len(batch)
+            self.metrics.messages_sent += len(batch)
+            self.metrics.frames_sent += frames
+            self.metrics.bytes_sent += sum(map(len, pieces))
+            self.metrics.write_batches += 1
+            self.metrics.last_activity = time.time()
+    
+    async def _watch(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Peers never write on our connection: EOF or an error means it is gone, so redial on the next send"""
+        try:
+            while await reader.read(4096):
+                pass
+        except (OSError, ConnectionError):
+            pass
+        if self.writer is writer:
+            logger.debug(f"Connection to {self.node_id} at {self.address} closed by peer")
+            self.writer = None
+            self.metrics.connected_at = None
+            writer.close()
+    
+    async def _close(self):
+        if self.watch_task is not None:
+            self.watch_task.cancel()
+            self.watch_task = None
+        writer, self.writer = self.writer, None
+        self.metrics.connected_at = None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, RuntimeError):
+                pass
+    
+    async def stop(self):
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        await self._close()
+
+class BARKTransport:
+    """
+    Socket transport for one BARKProtocol instance
+    
+    Peers are registered with add_peer(node_id, "tcp://host:port" or
+    "unix:///path"); a registered peer also appears in protocol.connections,
+    so broadcasts reach it. Messages without a recipient go to every peer.
+    """
+    
+    def __init__(
+        self,
+        protocol: BARKProtocol,
+        pool_size: int = 2,
+        max_pending: int = 4096,
+        max_frame_bytes: int = 16 * 2 ** 20,
+        backoff_initial: float = 0.05,
+        backoff_max: float = 5.0,
+        connect_timeout: float = 5.0,
+        batch_size: int = 256,
+        frame_bytes: int = 2 ** 16,
+        flush_interval: float = 0.0005
+    ):
+        """
+        Args:
+            protocol: Protocol whose queues the transport serves
+            pool_size: Connections per peer (priority lanes)
+            max_pending: Messages buffered per connection until flushed or while it is down
+            max_frame_bytes: Larger inbound frames close the connection
+            frame_bytes: Coalescing threshold - pending bytes that flush a connection at once
+            flush_interval: Seconds a message may wait for others to share its frame;
+                0 flushes every message immediately
+            backoff_initial, backoff_max: Reconnect delay bounds in seconds
+            connect_timeout: Seconds per dial attempt
+            batch_size: Messages taken from outgoing_queue per dispatch round
+        """
+        self.protocol = protocol
+        self.pool_size = max(1, pool_size)
+        self.max_pending = max_pending
+        self.max_frame_bytes = max_frame_bytes
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.connect_timeout = connect_timeout
+        self.batch_size = batch_size
+        self.frame_bytes = min(frame_bytes, max_frame_bytes)
+        self.flush_interval = flush_interval
+        self.stream_limit = 2 ** 16
+        
+        self.peers: Dict[str, List[PeerLink]] = {}
+        self.servers: List[asyncio.AbstractServer] = []
+        self.listen_addresses: List[PeerAddress] = []
+        self.socket_dirs: List[Path] = []  # Removed on stop once empty (e.g. a loopback mesh's temp dir)
+        self.inbound: Dict[asyncio.StreamWriter, ConnectionMetrics] = {}
+        self.inbound_tasks: set = set()
+        self.dispatch_task: Optional[asyncio.Task] = None
+        
+        # Counters
+        self.unroutable = 0
+        self.closed_inbound = ConnectionMetrics()  # Totals of inbound connections that have closed
+    
+    @classmethod
+    def from_config(cls, protocol: BARKProtocol, config: Optional[Dict[str, Any]]) -> 'BARKTransport':
+        """Create a transport from the `communication.transport` configuration section"""
+        config = config or {}
+        return cls(
+            protocol,
+            pool_size=config.get('pool_size', 2),
+            max_pending=config.get('max_pending', 4096),
+            max_frame_bytes=config.get('max_frame_bytes', 16 * 2 ** 20),
+            backoff_initial=config.get('backoff_initial_ms', 50) / 1000.0,
+            backoff_max=config.get('backoff_max_ms', 5000) / 1000.0,
+            connect_timeout=config.get('connect_timeout', 5.0),
+            batch_size=config.get('batch_size', 256),
+            frame_bytes=config.get('frame_bytes', 2 ** 16),
+            flush_interval=config.get('flush_interval_us', 500) / 1e6
+        )
+    
+    # Peers
+    
+    def add_peer(self, node_id: str, address: str):
+        """Register (or re-point) a peer; connections are dialled on first send"""
+        peer_address = PeerAddress.parse(address)
+        old = self.peers.pop(node_id, None)
+        if old:
+            for link in old:
+                asyncio.ensure_future(link.stop())
+        self.peers[node_id] = [
+            PeerLink(
+                node_id, peer_address, lane,
+                max_pending=self.max_pending,
+                backoff_initial=self.backoff_initial,
+                backoff_max=self.backoff_max,
+                connect_timeout=self.connect_timeout,
+                stream_limit=self.stream_limit,
+                frame_bytes=self.frame_bytes,
+                flush_interval=self.flush_interval
+            )
+            for lane in range(self.pool_size)
+        ]
+        self.protocol.connections[node_id] = {'address': str(peer_address), 'transport': self}
+    
+    async def remove_peer(self, node_id: str):
+        self.protocol.connections.pop(node_id, None)
+        for link in self.peers.pop(node_id, []):
+            await link.stop()
+    
+    def _lane(self, links: List[PeerLink], message: BARKMessage) -> PeerLink:
+        # Priority 1 (CRITICAL) -> lane 0 ... order is kept within a lane
+        return links[min(message.priority.value - 1, len(links) - 1)]
+    
+    # Lifecycle
+    
+    async def listen(self, address: str) -> PeerAddress:
+        """
+        Accept peers at `address`; TCP port 0 picks a free port
+        
+        Returns:
+            bound: The address actually bound
+        """
+        peer_address = PeerAddress.parse(address)
+        if peer_address.scheme == "unix":
+            server = await asyncio.start_unix_server(self._serve, peer_address.path, limit=self.stream_limit)
+            bound = peer_address
+        else:
+            server = await asyncio.start_server(
+                self._serve, peer_address.host, peer_address.port, limit=self.stream_limit
+            )
+            host, port = server.sockets[0].getsockname()[:2]
+            bound = PeerAddress("tcp", host=host, port=port)
+        self.servers.append(server)
+        self.listen_addresses.append(bound)
+        logger.info(f"BARK transport for {self.protocol.node_id} listening on {bound}")
+        return bound
+    
+    async def start(self, listen: Sequence[str] = ()):
+        for address in listen:
+            await self.listen(address)
+        if self.dispatch_task is None:
+            self.dispatch_task = asyncio.create_task(self._dispatch(), name=f"bark-dispatch-{self.protocol.node_id}")
+    
+    async def stop(self):
+        if self.dispatch_task is not None:
+            self.dispatch_task.cancel()
+            try:
+                await self.dispatch_task
+            except asyncio.CancelledError:
+                pass
+            self.dispatch_task = None
+        for links in self.peers.values():
+            for link in links:
+                await link.stop()
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        self.servers.clear()
+        # Unix servers leave their socket files behind
+        for address in self.listen_addresses:
+            if address.scheme == "unix":
+                Path(address.path).unlink(missing_ok=True)
+        for directory in self.socket_dirs:
+            try:
+                directory.rmdir()
+            except OSError:
+                pass  # Still holds another transport's socket - the last one to stop removes it
+        # Closing the streams ends the readers (cancelling them would make asyncio log the cancellation)
+        for writer in list(self.inbound):
+            writer.close()
+        if self.inbound_tasks:
+            await asyncio.gather(*self.inbound_tasks, return_exceptions=True)
+    
+    async def flush(self, timeout: Optional[float] = None):
+        """Wait until the outgoing queue is dispatched and every connection has written its frames"""
+        async def drained():
+            while self.protocol.outgoing_queue.qsize():
+                await asyncio.sleep(0)
+            await asyncio.gather(*(link.idle.wait() for links in self.peers.values() for link in links))
+        await asyncio.wait_for(drained(), timeout)
+    
+    # Outbound
+    
+    async def _dispatch(self):
+        """Move messages from the protocol's outgoing queue onto peer connections"""
+        queue = self.protocol.outgoing_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            for message in batch:
+                self.send(message)
+    
+    def send(self, message: BARKMessage):
+        """Queue one (signed) message on its recipient's connection, or every peer's if it has none"""
+        if message.recipient_id is None:
+            targets = list(self.peers.values())
+        else:
+            links = self.peers.get(message.recipient_id)
+            if links is None:
+                self.unroutable += 1
+                logger.debug(f"No route to {message.recipient_id} for message {message.message_id}")
+                return
+            targets = [links]
+        
+        data = message.to_bytes()
+        critical = message.priority is Priority.CRITICAL
+        for links in targets:
+            link = self._lane(links, message)
+            link.enqueue(data, critical)
+            link.start()
+    
+    # Inbound
+    
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        metrics = ConnectionMetrics(connects=1, connected_at=time.time())
+        self.inbound[writer] = metrics
+        task = asyncio.current_task()
+        self.inbound_tasks.add(task)
+        try:
+            while True:
+                header = await reader.readexactly(FRAME_HEADER.size)
+                length, count = FRAME_HEADER.unpack(header)
+                if length > self.max_frame_bytes:
+                    metrics.errors += 1
+                    logger.warning(f"Closing inbound connection: {length}-byte frame exceeds {self.max_frame_bytes}")
+                    return
+                body = await reader.readexactly(length)
+                metrics.frames_received += 1
+                metrics.bytes_received += FRAME_HEADER.size + length
+                metrics.last_activity = time.time()
+                
+                # Messages are decoded from slices of the frame body (read-only bytes, so
+                # the decoded messages keep those slices as their wire bytes)
+                try:
+                    for data in iter_frame(body, count):
+                        try:
+                            message = BARKMessage.from_bytes(data)
+                        except (WireFormatError, KeyError, ValueError) as e:
+                            metrics.decode_errors += 1
+                            logger.warning(f"Undecodable message ({len(data)} bytes): {e}")
+                            continue
+                        metrics.messages_received += 1
+                        await self.protocol.receive_message(message)
+                except WireFormatError as e:
+                    metrics.decode_errors += 1
+                    logger.warning(f"Malformed frame ({length} bytes, {count} messages): {e}")
+        except asyncio.IncompleteReadError:
+            pass  # Peer closed the connection
+        except (OSError, ConnectionError) as e:
+            metrics.errors += 1
+            logger.debug(f"Inbound connection error: {e}")
+        finally:
+            self.inbound_tasks.discard(task)
+            del self.inbound[writer]
+            for name in ('messages_received', 'frames_received', 'bytes_received', 'errors', 'decode_errors'):
+                setattr(self.closed_inbound, name, getattr(self.closed_inbound, name) + getattr(metrics, name))
+            writer.close()
+    
+    # Metrics
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'listening': [str(address) for address in self.listen_addresses],
+            'peers': {
+                node_id: [{'lane': link.lane, 'address': str(link.address), **link.metrics.to_dict()} for link in links]
+                for node_id, links in self.peers.items()
+            },
+            'inbound': [metrics.to_dict() for metrics in self.inbound.values()],
+            'closed_inbound': self.closed_inbound.to_dict(),
+            'unroutable': self.unroutable
+        }
+
+async def create_loopback_mesh(
+    protocols: Sequence[BARKProtocol],
+    kind: str = "tcp",
+    directory: Optional[Path] = None,
+    **transport_options
+) -> List[BARKTransport]:
+    """
+    Connect protocols to each other over local sockets - a test harness
+    that needs no external services
+    
+    Every transport listens on 127.0.0.1 (an ephemeral port) or on a Unix
+    socket in `directory`, every protocol registers every other one as a
+    peer, and each protocol trusts the others' signing keys.
+    
+    Args:
+        protocols: Protocols to connect
+        kind: "tcp" or "unix"
+        directory: Socket directory for "unix" (default: a new temp dir,
+            removed when the last of the transports stops)
+        transport_options: Passed to BARKTransport
+    
+    Returns:
+        transports: Started transports, in the order of `protocols`
+    """
+    owned_directory = kind == "unix" and directory is None
+    if owned_directory:
+        directory = Path(tempfile.mkdtemp(prefix="bark-"))
+    
+    transports = []
+    addresses = []
+    for protocol in protocols:
+        transport = BARKTransport(protocol, **transport_options)
+        if owned_directory:
+            transport.socket_dirs.append(directory)
+        if kind == "unix":
+            bound = await transport.listen(f"unix://{directory / (protocol.node_id + '.sock')}")
+        else:
+            bound = await transport.listen("tcp://127.0.0.1:0")
+        transports.append(transport)
+        addresses.append(bound)
+    
+    for protocol, transport in zip(protocols, transports):
+        for other, address in zip(protocols, addresses):
+            if other is not protocol:
+                transport.add_peer(other.node_id, str(address))
+                protocol.register_peer_key(other.node_id, other.private_key)
+        await transport.start()
+    
+    return transports
+
+# Example usage and testing
+if __name__ == "__main__":
+    from .bark_protocol import BARKDirective, BARKResponse, create_test_directive, generate_keypair
+    
+    async def test_loopback(kind: str):
+        alpha = BARKProtocol("alpha", *generate_keypair())
+        beta = BARKProtocol("beta", *generate_keypair())
+        
+        async def handle_health_check(directive: BARKDirective, message: BARKMessage):
+            response = BARKResponse(
+                response_id=f"health_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="success",
+                result={"status": "healthy"}
+            )
+            await beta.send_message(response.to_message("beta", message.sender_id))
+        
+        beta.register_directive_handler("health_check", handle_health_check)
+        
+        transports = await create_loopback_mesh([alpha, beta], kind=kind)
+        ingress = [asyncio.create_task(protocol.run_ingress()) for protocol in (alpha, beta)]
+        try:
+            started = time.perf_counter()
+            response = await alpha.send_directive(create_test_directive("health_check", {}), "beta", timeout=5.0)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"{kind}: {response.status if response else 'timeout'} in {elapsed:.2f}ms")
+            print(f"  alpha -> beta lanes: {transports[0].get_metrics()['peers']['beta']}")
+        finally:
+            for task in ingress:
+                task.cancel()
+            for transport in transports:
+                await transport.stop()
+    
+    async def main():
+        await test_loopback("tcp")
+        await test_loopback("unix")
+    
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+AXIOM ENGINE - Compiled sovereign axiom evaluation
+Compiles axioms once into predicate closures plus a dispatch index
+(command trigger / parameter key -> candidate rules), so validating a
+directive only evaluates the rules it can possibly violate, stopping at the
+first mandatory violation. Batches of directives are evaluated column-wise:
+the numeric parameters a rule reads are extracted into NumPy columns and
+each threshold predicate is one vectorised comparison across the batch
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# predicate(command_lower, parameters) -> (score, suggestion), or None when compliant
+AxiomPredicate = Callable[[str, Dict[str, Any]], Optional[Tuple[float, Optional[str]]]]
+
+# compiler(axiom) -> (command triggers, parameter-key triggers, predicate).
+# Command triggers are substrings of the lower-cased command; an axiom with
+# no triggers at all is evaluated for every directive.
+AxiomCompiler = Callable[[Dict[str, Any]], Tuple[Sequence[str], Sequence[str], AxiomPredicate]]
+
+# batch_predicate(commands_lower, columns) -> bool mask of rows where the
+# predicate fires; columns maps each declared key to (values, present)
+BatchPredicate = Callable[[List[str], Dict[str, Tuple[np.ndarray, np.ndarray]]], np.ndarray]
+
+# Largest integer magnitude float64 holds exactly
+_EXACT_INT_LIMIT = 2 ** 53
+
+def numeric_column(records: Sequence[Dict[str, Any]], key: str, default: float = 0.0):
+    """
+    Extract one numeric field from a list of dicts
+    
+    Args:
+        records: Dicts to read `key` from
+        key: Field name
+        default: Value used where the field is absent
+    
+    Returns:
+        values: float64 column (default where absent)
+        present: Rows that carry the field
+        exact: Rows whose value converts to float64 losslessly; other rows
+            (strings, None, huge ints) must be evaluated on the scalar path
+    """
+    n = len(records)
+    present = np.fromiter((key in record for record in records), dtype=bool, count=n)
+    raw = [record.get(key, default) for record in records]
+    
+    kinds = set(map(type, raw))
+    if kinds <= {float, int, bool}:
+        values = np.array(raw, dtype=np.float64)
+        exact = np.ones(n, dtype=bool)
+        if int in kinds:
+            # Integers at or beyond 2**53 may have been rounded
+            is_int = np.fromiter((type(value) is int for value in raw), dtype=bool, count=n)
+            exact = ~is_int | (np.abs(values) < _EXACT_INT_LIMIT)
+        return values, present, exact
+    
+    values = np.full(n, default, dtype=np.float64)
+    exact = np.ones(n, dtype=bool)
+    for i, value in enumerate(raw):
+        if isinstance(value, (float, np.floating)) or (
+            isinstance(value, (int, np.integer)) and abs(int(value)) < _EXACT_INT_LIMIT
+        ):
+            values[i] = value
+        else:
+            exact[i] = False
+    
+    return values, present, exact
+
+_WEALTH_OUTCOME = (0.0, "Reduce spending to maintain runway")
+_HEALTH_OUTCOME = (0.2, "Maintain adequate sleep schedule")
+_EFFICIENCY_OUTCOME = (0.3, "Optimize task for better efficiency")
+
+def _wealth_preservation(command: str, parameters: Dict[str, Any]):
+    if "budget" in parameters:
+        budget = parameters.get("budget", 0)
+        available_runway = parameters.get("available_runway", float('inf'))
+        if budget > available_runway * 0.1:  # Spending more than 10% of runway
+            return _WEALTH_OUTCOME
+    return None
+
+def _health_priority(command: str, parameters: Dict[str, Any]):
+    if "sleep" in command:
+        return _HEALTH_OUTCOME
+    return None
+
+def _time_efficiency(command: str, parameters: Dict[str, Any]):
+    estimated_time = parameters.get("estimated_time", 0)
+    expected_output = parameters.get("expected_output", 0)
+    if estimated_time > 0 and expected_output > 0:
+        if expected_output / estimated_time < 0.5:  # Low efficiency threshold
+            return _EFFICIENCY_OUTCOME
+    return None
+
+def _wealth_preservation_batch(commands, columns):
+    budget, has_budget = columns["budget"]
+    runway, has_runway = columns["available_runway"]
+    return has_budget & (budget > np.where(has_runway, runway, np.inf) * 0.1)
+
+def _health_priority_batch(commands, columns):
+    return np.fromiter(("sleep" in command for command in commands), dtype=bool, count=len(commands))
+
+def _time_efficiency_batch(commands, columns):
+    estimated_time, _ = columns["estimated_time"]
+    expected_output, _ = columns["expected_output"]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (estimated_time > 0) & (expected_output > 0) & (expected_output / estimated_time < 0.5)
+
+# The built-in rules take no per-axiom settings, so axioms of one type share
+# a predicate and it runs once per directive however many axioms use it
+def _compile_wealth_preservation(axiom: Dict[str, Any]):
+    return ("spend", "purchase"), (), _wealth_preservation
+
+def _compile_health_priority(axiom: Dict[str, Any]):
+    return ("skip",), (), _health_priority
+
+def _compile_time_efficiency(axiom: Dict[str, Any]):
+    return (), ("task",), _time_efficiency
+
+AXIOM_COMPILERS: Dict[str, AxiomCompiler] = {
+    "wealth_preservation": _compile_wealth_preservation,
+    "health_priority": _compile_health_priority,
+    "time_efficiency": _compile_time_efficiency
+}
+
+# predicate -> (numeric keys read, batch predicate, outcome when it fires)
+BATCH_PREDICATES: Dict[AxiomPredicate, Tuple[Sequence[str], BatchPredicate, Tuple[float, Optional[str]]]] = {
+    _wealth_preservation: (("budget", "available_runway"), _wealth_preservation_batch, _WEALTH_OUTCOME),
+    _health_priority: ((), _health_priority_batch, _HEALTH_OUTCOME),
+    _time_efficiency: (("estimated_time", "expected_output"), _time_efficiency_batch, _EFFICIENCY_OUTCOME)
+}
+
+def register_axiom_type(axiom_type: str, compiler: AxiomCompiler):
+    """Add (or replace) the compiler for an axiom type"""
+    AXIOM_COMPILERS[axiom_type] = compiler
+
+def register_batch_predicate(
+    predicate: AxiomPredicate,
+    keys: Sequence[str],
+    batch_predicate: BatchPredicate,
+    outcome: Tuple[float, Optional[str]]
+):
+    """
+    Add a vectorised form of a predicate; without one, batches fall back to
+    calling the predicate row by row
+    
+    Args:
+        predicate: Scalar predicate the batch form must agree with
+        keys: Numeric parameters it reads (absent values are 0.0)
+        batch_predicate: Vectorised form returning the rows that fire
+        outcome: (score, suggestion) the predicate returns when it fires
+    """
+    BATCH_PREDICATES[predicate] = (tuple(keys), batch_predicate, outcome)
+
+def copy_validation_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a validation result whose lists can be modified independently"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+@dataclass(slots=True)
+class _RuleGroup:
+    """Axioms sharing one predicate and trigger set"""
+    predicate: AxiomPredicate
+    command_triggers: Tuple[str, ...]
+    parameter_triggers: Tuple[str, ...]
+    members: List[int] = field(default_factory=list)
+    optional_members: List[int] = field(default_factory=list)
+    first_mandatory: Optional[int] = None
+    weight_sum: float = 0.0
+
+class AxiomEngine:
+    """
+    Sovereign axioms compiled for fast directive validation
+    
+    Axioms of an unknown type are always compliant and cost nothing per
+    directive. Axioms with the same predicate and triggers form one rule
+    group whose predicate runs once per directive. The per-axiom results of
+    compliant axioms are built once and shared between calls, so treat
+    returned `axiom_compliance` entries as read-only.
+    """
+    
+    def __init__(self, axioms: List[Dict[str, Any]], version: int = 0):
+        """
+        Args:
+            axioms: Axiom dicts (id, type, rule, weight, mandatory, ...)
+            version: Axiom-set version, bumped whenever the set is replaced
+        """
+        self.axioms = list(axioms)
+        self.version = version
+        
+        self._groups: List[_RuleGroup] = []
+        self._axiom_group: List[Optional[int]] = []
+        self._command_index: Dict[str, List[int]] = {}
+        self._parameter_index: Dict[str, List[int]] = {}
+        self._unconditional: List[int] = []
+        
+        group_ids: Dict[Tuple, int] = {}
+        for i, axiom in enumerate(self.axioms):
+            compiler = AXIOM_COMPILERS.get(axiom["type"])
+            if compiler is None:
+                self._axiom_group.append(None)
+                continue
+            
+            command_triggers, parameter_triggers, predicate = compiler(axiom)
+            key = (predicate, tuple(command_triggers), tuple(parameter_triggers))
+            if key not in group_ids:
+                g = group_ids[key] = len(self._groups)
+                self._groups.append(_RuleGroup(predicate, tuple(command_triggers), tuple(parameter_triggers)))
+                for trigger in command_triggers:
+                    self._command_index.setdefault(trigger, []).append(g)
+                for parameter in parameter_triggers:
+                    self._parameter_index.setdefault(parameter, []).append(g)
+                if not command_triggers and not parameter_triggers:
+                    self._unconditional.append(g)
+            
+            g = group_ids[key]
+            group = self._groups[g]
+            group.members.append(i)
+            group.weight_sum += axiom["weight"]
+            if not axiom["mandatory"]:
+                group.optional_members.append(i)
+            elif group.first_mandatory is None:
+                group.first_mandatory = i
+            self._axiom_group.append(g)
+        
+        self._default_results = [
+            {"score": 1.0, "weight": axiom["weight"], "suggestion": None, "axiom_id": axiom["id"]}
+            for axiom in self.axioms
+        ]
+        self.total_weight = sum(axiom["weight"] for axiom in self.axioms)
+        
+        logger.info(
+            f"Compiled {len(self.axioms)} axioms into {len(self._groups)} rule groups: "
+            f"{len(self._command_index)} command triggers, {len(self._parameter_index)} parameter triggers, "
+            f"{len(self._unconditional)} unconditional"
+        )
+    
+    def __len__(self) -> int:
+        return len(self.axioms)
+    
+    def candidates(self, command: str, parameters: Dict[str, Any]) -> List[int]:
+        """
+        Indices of the rule groups that can fire for a directive, in order
+        
+        Args:
+            command: Lower-cased directive command
+            parameters: Directive parameters
+        """
+        hits = [groups for trigger, groups in self._command_index.items() if trigger in command]
+        hits.extend(groups for key, groups in self._parameter_index.items() if key in parameters)
+        if self._unconditional:
+            hits.append(self._unconditional)
+        
+        if not hits:
+            return []
+        if len(hits) == 1:
+            return hits[0]
+        return sorted(set().union(*hits))
+    
+    def evaluate(self, command: str, parameters: Dict[str, Any], threshold: float = 0.95) -> Dict[str, Any]:
+        """
+        Validate a directive's command and parameters against every axiom
+        
+        Args:
+            command: Directive command
+            parameters: Directive parameters
+            threshold: Compliance score below which an axiom is violated
+        
+        Returns:
+            result: As SovereignDirectiveValidator.validate_directive
+        """
+        command = command.lower()
+        fired = []
+        for g in self.candidates(command, parameters):
+            outcome = self._groups[g].predicate(command, parameters)
+            if outcome is not None:
+                fired.append((g, outcome))
+        return self._assemble(fired, threshold)
+    
+    def evaluate_batch(
+        self,
+        commands: Sequence[str],
+        parameters: Sequence[Dict[str, Any]],
+        threshold: float = 0.95
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate many directives, one vectorised comparison per rule group
+        
+        Rows whose parameters do not convert to float64 exactly, and rules
+        without a registered batch form, use the scalar predicate, so each
+        result equals `evaluate` on the same inputs. Results are assembled
+        once per distinct combination of fired rules.
+        
+        Args:
+            commands: Directive commands
+            parameters: Directive parameters, aligned with `commands`
+            threshold: Compliance score below which an axiom is violated
+        
+        Returns:
+            results: One `evaluate` result per directive
+        """
+        n = len(commands)
+        lowered = [command.lower() for command in commands]
+        # Only rows where something fires get an entry
+        fired: Dict[int, List[Tuple[int, Tuple[float, Optional[str]]]]] = {}
+        
+        trigger_masks: Dict[Tuple[str, str], np.ndarray] = {}
+        
+        def trigger_mask(kind: str, trigger: str) -> np.ndarray:
+            if (kind, trigger) not in trigger_masks:
+                source = lowered if kind == 'command' else parameters
+                trigger_masks[kind, trigger] = np.fromiter((trigger in item for item in source), dtype=bool, count=n)
+            return trigger_masks[kind, trigger]
+        
+        for g, group in enumerate(self._groups):
+            if group.command_triggers or group.parameter_triggers:
+                applicable = np.zeros(n, dtype=bool)
+                for trigger in group.command_triggers:
+                    applicable |= trigger_mask('command', trigger)
+                for key in group.parameter_triggers:
+                    applicable |= trigger_mask('parameter', key)
+                rows = np.flatnonzero(applicable)
+            else:
+                rows = np.arange(n)
+            if not len(rows):
+                continue
+            
+            scalar_rows = rows
+            batch = BATCH_PREDICATES.get(group.predicate)
+            if batch is not None:
+                keys, batch_predicate, outcome = batch
+                subset = [parameters[r] for r in rows]
+                columns = {}
+                exact = np.ones(len(rows), dtype=bool)
+                for key in keys:
+                    values, present, key_exact = numeric_column(subset, key)
+                    columns[key] = (values, present)
+                    exact &= key_exact
+                
+                hits = batch_predicate([lowered[r] for r in rows], columns) & exact
+                for r in rows[hits].tolist():
+                    fired.setdefault(r, []).append((g, outcome))
+                scalar_rows = rows[~exact]
+            
+            for r in scalar_rows.tolist():
+                outcome = group.predicate(lowered[r], parameters[r])
+                if outcome is not None:
+                    fired.setdefault(r, []).append((g, outcome))
+        
+        # Rows firing the same rules get the same result: assemble each
+        # distinct combination once and hand out copies
+        assembled: Dict[Tuple, Dict[str, Any]] = {}
+        results = []
+        for r in range(n):
+            row = fired.get(r, ())
+            key = tuple(sorted(row, key=lambda item: item[0])) if len(row) > 1 else tuple(row)
+            template = assembled.get(key)
+            if template is None:
+                template = assembled[key] = self._assemble(list(key), threshold)
+            results.append(copy_validation_result(template))
+        return results
+    
+    def _assemble(self, fired: List[Tuple[int, Tuple[float, Optional[str]]]], threshold: float) -> Dict[str, Any]:
+        """Validation result from the (group, outcome) pairs that fired, in group order"""
+        groups = self._groups
+        required_corrections = []
+        
+        if threshold > 1.0:
+            # Every axiom, compliant or not, scores below the threshold
+            outcomes = dict(fired)
+            for i, axiom in enumerate(self.axioms):
+                score, suggestion = outcomes.get(self._axiom_group[i], (1.0, None))
+                if axiom["mandatory"]:
+                    return self._violation(i, score)
+                required_corrections.append(suggestion)
+        else:
+            violation = None
+            corrections = []
+            for g, (score, suggestion) in fired:
+                if score < threshold:
+                    group = groups[g]
+                    if group.first_mandatory is not None and (violation is None or group.first_mandatory < violation[0]):
+                        violation = (group.first_mandatory, score)
+                    corrections.extend((i, suggestion) for i in group.optional_members)
+            if violation is not None:
+                return self._violation(*violation)
+            if len(fired) > 1:
+                corrections.sort(key=lambda item: item[0])
+            required_corrections = [suggestion for _, suggestion in corrections]
+        
+        results = list(self._default_results)
+        deficit = 0.0
+        for g, (score, suggestion) in fired:
+            group = groups[g]
+            deficit += (1.0 - score) * group.weight_sum
+            for i in group.members:
+                axiom = self.axioms[i]
+                results[i] = {"score": score, "weight": axiom["weight"], "suggestion": suggestion, "axiom_id": axiom["id"]}
+        
+        total_weight = self.total_weight
+        return {
+            "valid": True,
+            "compliance_score": (total_weight - deficit) / total_weight if total_weight > 0 else 1.0,
+            "required_corrections": required_corrections,
+            "axiom_compliance": results
+        }
+    
+    def _violation(self, index: int, score: float) -> Dict[str, Any]:
+        axiom = self.axioms[index]
+        return {
+            "valid": False,
+            "reason": f"violates_mandatory_axiom_{axiom['id']}",
+            "compliance_score": score,
+            "required_corrections": [axiom["rule"]]
+        }
+
+# Example usage and testing
+if __name__ == "__main__":
+    import time
+    
+    types = list(AXIOM_COMPILERS)
+    axioms = [
+        {"id": f"axiom_{i}", "type": types[i % len(types)], "rule": f"rule_{i}", "weight": 1.0, "mandatory": i % 50 == 49}
+        for i in range(1000)
+    ]
+    engine = AxiomEngine(axioms)
+    
+    directives = [
+        ("plan the week", {}),
+        ("purchase course", {"budget": 50, "available_runway": 1000}),
+        ("spend on tools", {"budget": 500, "available_runway": 1000}),
+        ("write report", {"task": "report", "estimated_time": 4, "expected_output": 1})
+    ]
+    for command, parameters in directives:
+        started = time.perf_counter()
+        for _ in range(100):
+            result = engine.evaluate(command, parameters)
+        elapsed_us = (time.perf_counter() - started) / 100 * 1e6
+        print(f"{command:16s} valid={result['valid']} score={result['compliance_score']:.3f} {elapsed_us:8.1f}us")
+    
+    commands, parameters = zip(*(directives * 2500))
+    started = time.perf_counter()
+    batch = engine.evaluate_batch(commands, parameters)
+    elapsed = time.perf_counter() - started
+    assert batch == [engine.evaluate(command, params) for command, params in zip(commands, parameters)]
+    print(f"batch of {len(batch)}: {elapsed * 1e6 / len(batch):.1f}us per directive")
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+AXIOM HIVE - Axiom directories with a precompiled binary cache
+Reads axiom definitions from a directory of JSON/YAML files, validates them
+and compiles them (by default into an AxiomEngine). The validated set is
+written to a versioned binary cache keyed by the sources' mtimes/sizes and
+content hash, so a restart maps the cache instead of reparsing. A watcher
+polls the directory and, when a file changes, builds the new set off the
+validation path and swaps it in with one reference assignment; an edit that
+fails validation is logged and the previous set stays live. Callers can add
+checks of their own per axiom (e.g. the fields each rule type reads), so a
+file the compiled set could not evaluate is rejected at load time.
+
+Each file holds a list of axioms, or a mapping with an "axioms" list:
+
+    axioms:
+      - id: financial_discipline
+        type: wealth_preservation
+        rule: never_spend_more_than_available_runway
+        weight: 1.0
+        mandatory: true
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import marshal
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from .axiom_engine import AxiomEngine
+
+logger = logging.getLogger(__name__)
+
+AXIOM_FILE_SUFFIXES = (".json", ".yaml", ".yml")
+
+# Bump when the cache layout or the validated axiom form changes
+CACHE_FORMAT_VERSION = 1
+
+# magic, format version, marshal version, axiom count, payload length,
+# stat key, content hash; the marshalled axiom list follows
+_CACHE_MAGIC = b"AXH1"
+_CACHE_HEADER = struct.Struct("<4sHHIQ32s32s")
+
+# validate(axiom, where) raises AxiomHiveError for an axiom the caller cannot use
+AxiomValidator = Callable[[Dict[str, Any], str], None]
+
+# field -> (accepted types, required)
+_AXIOM_FIELDS = {
+    "id": ((str,), True),
+    "type": ((str,), True),
+    "rule": ((str,), True),
+    "weight": ((int, float), True),
+    "mandatory": ((bool,), True)
+}
+
+class AxiomHiveError(ValueError):
+    """An axiom directory that cannot be loaded"""
+
+def source_files(directory: Path) -> List[Path]:
+    """Axiom files in `directory`, in load order (sorted by name, hidden files skipped)"""
+    if not directory.is_dir():
+        raise AxiomHiveError(f"Axiom directory {directory} does not exist")
+    return sorted(
+        path for path in directory.iterdir()
+        if path.suffix in AXIOM_FILE_SUFFIXES and not path.name.startswith(".") and path.is_file()
+    )
+
+def stat_key(directory: Path, files: List[Path]) -> bytes:
+    """Digest of the file names, mtimes and sizes - cheap, needs no reads"""
+    digest = hashlib.sha256()
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path.relative_to(directory)}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return digest.digest()
+
+def read_sources(directory: Path, files: List[Path]) -> Tuple[bytes, List[Tuple[Path, bytes]]]:
+    """Raw file contents and the digest of names plus contents"""
+    digest = hashlib.sha256()
+    contents = []
+    for path in files:
+        data = path.read_bytes()
+        digest.update(f"{path.relative_to(directory)}\0{len(data)}\0".encode())
+        digest.update(data)
+        contents.append((path, data))
+    return digest.digest(), contents
+
+def parse_axiom_file(path: Path, data: bytes) -> List[Any]:
+    """The axiom entries of one file"""
+    try:
+        document = json.loads(data) if path.suffix == ".json" else yaml.safe_load(data)
+    except (ValueError, yaml.YAMLError) as e:
+        raise AxiomHiveError(f"{path.name}: {e}") from e
+    
+    if isinstance(document, dict):
+        document = document.get("axioms")
+    if document is None:
+        return []
+    if not isinstance(document, list):
+        raise AxiomHiveError(f"{path.name}: expected a list of axioms or an 'axioms' list")
+    return document
+
+def require_fields(axiom: Dict[str, Any], fields: Dict[str, Tuple[Tuple[type, ...], bool]], where: str):
+    """
+    Check the presence and types of an axiom's fields
+    
+    Args:
+        axiom: Axiom mapping
+        fields: field -> (accepted types, required); bool is never accepted as a number
+        where: Location used in error messages
+    """
+    for name, (types, required) in fields.items():
+        if name not in axiom:
+            if required:
+                raise AxiomHiveError(f"{where}: missing '{name}'")
+            continue
+        value = axiom[name]
+        # bool is an int, but never an acceptable number
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            raise AxiomHiveError(f"{where}: '{name}' must be {' or '.join(t.__name__ for t in types)}")
+
+def schema_validator(schema: Dict[str, Dict[str, Tuple[Tuple[type, ...], bool]]]) -> AxiomValidator:
+    """
+    Validator requiring per-rule-type fields
+    
+    Args:
+        schema: rule type -> fields as for require_fields; other types pass
+    """
+    def validate(axiom: Dict[str, Any], where: str):
+        fields = schema.get(axiom["type"])
+        if fields is not None:
+            require_fields(axiom, fields, where)
+    return validate
+
+def validate_axiom(axiom: Any, where: str, validate: Optional[AxiomValidator] = None) -> Dict[str, Any]:
+    """
+    Check one axiom definition
+    
+    Args:
+        axiom: Parsed axiom entry
+        where: Location used in error messages
+        validate: Caller's additional check, run after the common fields
+    
+    Returns:
+        axiom: The axiom with weight as a float; extra fields are kept
+    """
+    if not isinstance(axiom, dict):
+        raise AxiomHiveError(f"{where}: expected a mapping, got {type(axiom).__name__}")
+    
+    require_fields(axiom, _AXIOM_FIELDS, where)
+    if not axiom["id"]:
+        raise AxiomHiveError(f"{where}: empty 'id'")
+    if not 0.0 <= axiom["weight"] <= 1.0:
+        raise AxiomHiveError(f"{where}: 'weight' must be in [0, 1], got {axiom['weight']}")
+    if validate is not None:
+        validate(axiom, where)
+    return {**axiom, "weight": float(axiom["weight"])}
+
+def load_axioms(contents: List[Tuple[Path, bytes]], validate: Optional[AxiomValidator] = None) -> List[Dict[str, Any]]:
+    """Parse and validate the files of a directory into one axiom list"""
+    axioms = []
+    seen: Dict[str, str] = {}
+    for path, data in contents:
+        for i, entry in enumerate(parse_axiom_file(path, data)):
+            axiom = validate_axiom(entry, f"{path.name}[{i}]", validate)
+            if axiom["id"] in seen:
+                raise AxiomHiveError(f"{path.name}[{i}]: duplicate id '{axiom['id']}' (first in {seen[axiom['id']]})")
+            seen[axiom["id"]] = path.name
+            axioms.append(axiom)
+    
+    if not axioms:
+        raise AxiomHiveError("No axioms defined")
+    return axioms
+
+def read_cache(cache_path: Path) -> Optional[Tuple[bytes, bytes, List[Dict[str, Any]]]]:
+    """
+    Map a cache file and decode it
+    
+    Returns:
+        cached: (stat key, content hash, axioms), or None if the file is
+        missing, truncated or written by another format/marshal version
+    """
+    try:
+        with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) < _CACHE_HEADER.size:
+                return None
+            magic, format_version, marshal_version, count, length, key, content_hash = _CACHE_HEADER.unpack_from(mapped)
+            if (
+                magic != _CACHE_MAGIC
+                or format_version != CACHE_FORMAT_VERSION
+                or marshal_version != marshal.version
+                or len(mapped) != _CACHE_HEADER.size + length
+            ):
+                return None
+            with memoryview(mapped) as view, view[_CACHE_HEADER.size:] as payload:
+                axioms = marshal.loads(payload)
+    except (OSError, ValueError, EOFError, TypeError):
+        # Missing, empty (mmap of length 0) or corrupt
+        return None
+    
+    if not isinstance(axioms, list) or len(axioms) != count:
+        return None
+    return key, content_hash, axioms
+
+def write_cache(cache_path: Path, key: bytes, content_hash: bytes, axioms: List[Dict[str, Any]]):
+    """Write the cache atomically (temporary file + rename), so readers never see a partial file"""
+    payload = marshal.dumps(axioms)
+    header = _CACHE_HEADER.pack(
+        _CACHE_MAGIC, CACHE_FORMAT_VERSION, marshal.version, len(axioms), len(payload), key, content_hash
+    )
+    temporary = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(temporary, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write axiom cache {cache_path}: {e}")
+        temporary.unlink(missing_ok=True)
+
+class AxiomHive:
+    """
+    One axiom directory, its binary cache and the compiled set built from it
+    
+    `compiled` is replaced as a whole, never mutated, so readers that take
+    a reference once per validation always see a consistent set.
+    """
+    
+    def __init__(
+        self,
+        directory: Path,
+        cache_path: Optional[Path] = None,
+        compile: Callable[[List[Dict[str, Any]]], Any] = AxiomEngine,
+        on_swap: Optional[Callable[[Any], None]] = None,
+        poll_interval: float = 5.0,
+        validate: Optional[AxiomValidator] = None
+    ):
+        """
+        Args:
+            directory: Directory of *.json / *.yaml / *.yml axiom files
+            cache_path: Binary cache location (default: <directory>/.axioms.axh)
+            compile: Builds the compiled form from the validated axiom list
+            on_swap: Called with the new compiled set after each hot swap
+            poll_interval: Seconds between checks for changed files while watching
+            validate: Additional per-axiom check (see schema_validator); a
+                set with a failing axiom is never loaded or swapped in
+        """
+        self.directory = Path(directory)
+        self.cache_path = Path(cache_path) if cache_path is not None else self.directory / ".axioms.axh"
+        self.compile = compile
+        self.on_swap = on_swap
+        self.validate = validate
+        self.poll_interval = poll_interval
+        
+        self.axioms: List[Dict[str, Any]] = []
+        self.compiled = None
+        self.version = 0
+        self.source_key: Optional[bytes] = None
+        self.content_hash: Optional[bytes] = None
+        self.last_load_source: Optional[str] = None
+        self.last_error: Optional[str] = None
+        
+        self._watch_task: Optional[asyncio.Task] = None
+    
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        base_dir: Optional[Path] = None,
+        compile: Callable[[List[Dict[str, Any]]], Any] = AxiomEngine,
+        on_swap: Optional[Callable[[Any], None]] = None,
+        validate: Optional[AxiomValidator] = None
+    ) -> Optional["AxiomHive"]:
+        """
+        Build a hive from a config block (directory, cache_path, poll_interval)
+        
+        Args:
+            config: Hive configuration
+            base_dir: Directory relative paths are resolved against
+            compile: See __init__
+            on_swap: See __init__
+            validate: See __init__
+        
+        Returns:
+            hive: The hive, or None (with a warning) when the directory does
+            not exist, so the caller falls back to its built-in axioms
+        """
+        base_dir = Path(base_dir) if base_dir is not None else Path.cwd()
+        directory = base_dir / config["directory"]
+        if not directory.is_dir():
+            logger.warning(f"Axiom directory {directory} does not exist; using the built-in axioms")
+            return None
+        cache_path = base_dir / config["cache_path"] if config.get("cache_path") else None
+        return cls(directory, cache_path, compile, on_swap, config.get("poll_interval", 5.0), validate)
+    
+    def _read(self, files: List[Path], key: bytes) -> Tuple[List[Dict[str, Any]], bytes, str]:
+        """
+        The validated axioms for the current sources
+        
+        Returns:
+            (axioms, content hash, source): source is "cache" when the cache
+            matched the file stats, "cache_rehashed" when only the contents
+            matched (e.g. touched files), "parsed" otherwise
+        """
+        cached = read_cache(self.cache_path)
+        if cached is not None and cached[0] == key:
+            self._check(cached[2])
+            return cached[2], cached[1], "cache"
+        
+        content_hash, contents = read_sources(self.directory, files)
+        if cached is not None and cached[1] == content_hash:
+            self._check(cached[2])
+            axioms, source = cached[2], "cache_rehashed"
+        else:
+            axioms, source = load_axioms(contents, self.validate), "parsed"
+        write_cache(self.cache_path, key, content_hash, axioms)
+        return axioms, content_hash, source
+    
+    def _check(self, axioms: List[Dict[str, Any]]):
+        """Run the caller's check over cached axioms (the cache may predate it)"""
+        if self.validate is not None:
+            for axiom in axioms:
+                self.validate(axiom, f"cached axiom '{axiom['id']}'")
+    
+    def load(self) -> Any:
+        """
+        Load the axiom set (from the cache when it is current) and compile it
+        
+        Returns:
+            compiled: The compiled axiom set
+        
+        Raises:
+            AxiomHiveError: If the directory is missing or fails validation
+        """
+        files = source_files(self.directory)
+        key = stat_key(self.directory, files)
+        axioms, content_hash, source = self._read(files, key)
+        
+        self.compiled = self.compile(axioms)
+        self.axioms = axioms
+        self.source_key = key
+        self.content_hash = content_hash
+        self.last_load_source = source
+        logger.info(f"Axiom Hive {self.directory}: {len(axioms)} axioms loaded ({source})")
+        return self.compiled
+    
+    def refresh(self) -> bool:
+        """
+        Reload if any axiom file was added, removed or changed
+        
+        The new set is validated and compiled before it replaces the live
+        one; if that fails the live set is kept and the error is logged once
+        per change of the directory.
+        
+        Returns:
+            swapped: True if a new compiled set was installed
+        """
+        try:
+            files = source_files(self.directory)
+            key = stat_key(self.directory, files)
+        except (AxiomHiveError, OSError) as e:
+            self._reject(None, e)
+            return False
+        if key == self.source_key:
+            return False
+        
+        try:
+            axioms, content_hash, source = self._read(files, key)
+            unchanged = content_hash == self.content_hash
+            compiled = None if unchanged else self.compile(axioms)
+        except (AxiomHiveError, OSError) as e:
+            self._reject(key, e)
+            return False
+        
+        self.source_key = key
+        self.last_error = None
+        if unchanged:
+            return False
+        
+        # Single reference assignments; validations in flight keep the set they started with
+        self.axioms = axioms
+        self.content_hash = content_hash
+        self.compiled = compiled
+        self.version += 1
+        self.last_load_source = source
+        logger.info(f"Axiom Hive {self.directory}: swapped in version {self.version} ({len(axioms)} axioms)")
+        
+        if self.on_swap is not None:
+            self.on_swap(compiled)
+        return True
+    
+    def _reject(self, key: Optional[bytes], error: Exception):
+        message = str(error)
+        if message != self.last_error:
+            logger.error(f"Axiom Hive {self.directory}: keeping version {self.version}: {message}")
+        self.last_error = message
+        if key is not None:
+            self.source_key = key
+    
+    async def start(self, poll_interval: Optional[float] = None):
+        """Start polling the directory for changes"""
+        if self._watch_task is None:
+            interval = poll_interval if poll_interval is not None else self.poll_interval
+            self._watch_task = asyncio.create_task(self._watch(interval))
+    
+    async def stop(self):
+        """Stop polling"""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+    
+    async def _watch(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            # Parsing and compiling run in a worker thread, off the event loop
+            await asyncio.to_thread(self.refresh)
+    
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "directory": str(self.directory),
+            "version": self.version,
+            "axioms": len(self.axioms),
+            "last_load_source": self.last_load_source,
+            "last_error": self.last_error,
+            "watching": self._watch_task is not None
+        }
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+    
+    logging.basicConfig(level=logging.INFO)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        (directory / "core.yaml").write_text(
+            "axioms:\n"
+            "  - {id: financial_discipline, type: wealth_preservation, rule: runway, weight: 1.0, mandatory: true}\n"
+        )
+        
+        hive = AxiomHive(directory)
+        engine = hive.load()
+        print(f"First load: {hive.last_load_source}, {len(engine)} axioms")
+        
+        restarted = AxiomHive(directory)
+        restarted.load()
+        print(f"Restart: {restarted.last_load_source}")
+        
+        (directory / "health.json").write_text(
+            '[{"id": "health_priority", "type": "health_priority", "rule": "sleep", "weight": 0.9, "mandatory": true}]'
+        )
+        print(f"Refresh after adding a file: swapped={hive.refresh()}, {len(hive.compiled)} axioms")
+        
+        time.sleep(0.01)
+        (directory / "health.json").write_text('[{"id": "broken"}]')
+        print(f"Refresh after a bad edit: swapped={hive.refresh()}, still {len(hive.compiled)} axioms")
\ No newline at end of file
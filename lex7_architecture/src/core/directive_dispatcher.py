@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+DIRECTIVE DISPATCHER - Command routing for Lex Nodes
+Maps BARK directive commands (interned to integer ids) to handlers through a
+flat dispatch table, runs each call through a middleware chain (validation,
+tracing, caching, timeouts) and keeps per-handler latency/error histograms
+"""
+
+import asyncio
+import bisect
+import copy
+import functools
+import inspect
+import itertools
+import json
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+from dataclasses import dataclass, field, replace
+import logging
+
+from ..communication.bark_protocol import BARKDirective, BARKResponse, BARKMessage
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency buckets in milliseconds (last bucket is open)
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 10000.0)
+
+OUTCOMES = ('ok', 'error', 'timeout', 'refused')
+
+class HandlerHistogram:
+    """Fixed-bucket latency histogram with outcome counters for one handler"""
+    
+    __slots__ = ('buckets', 'count', 'total_ms', 'max_ms', 'outcomes', 'cache_hits')
+    
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+        self.cache_hits = 0
+    
+    def record(self, latency_ms: float, outcome: str):
+        """Record one handler execution"""
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+        self.outcomes[outcome] += 1
+    
+    def percentile(self, q: float) -> float:
+        """Bucket upper bound below which q percent of executions fall"""
+        if self.count == 0:
+            return 0.0
+        
+        rank = q / 100.0 * self.count
+        for bound, seen in zip(LATENCY_BUCKETS_MS, itertools.accumulate(self.buckets)):
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        failures = self.outcomes['error'] + self.outcomes['timeout']
+        return {
+            'count': self.count,
+            'cache_hits': self.cache_hits,
+            'total_ms': self.total_ms,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+            'error_rate': failures / self.count if self.count else 0.0,
+            'outcomes': dict(self.outcomes),
+            'buckets': dict(zip([f"<={b}" for b in LATENCY_BUCKETS_MS] + ['inf'], self.buckets))
+        }
+
+@dataclass
+class HandlerEntry:
+    """A registered directive handler"""
+    command: str
+    command_id: int
+    handler: Callable
+    is_async: bool
+    timeout: Optional[float] = None   # Overrides the directive / default timeout
+    cacheable: bool = False           # Responses may be served from the cache
+    validate: bool = True             # Run sovereign validation before the handler
+    chain: Optional[Callable[['DispatchContext'], Awaitable[Any]]] = field(default=None, repr=False)
+    stats: HandlerHistogram = field(default_factory=HandlerHistogram, repr=False)
+
+@dataclass
+class DispatchContext:
+    """Per-call state shared by the middleware chain"""
+    directive: BARKDirective
+    message: Optional[BARKMessage]
+    entry: HandlerEntry
+    trace_id: Optional[str] = None
+    outcome: Optional[str] = None  # Set by middleware that short-circuits (refused, timeout)
+    cache_hit: bool = False
+
+def _response(ctx: DispatchContext, status: str, result: Dict[str, Any], error: Optional[str] = None) -> BARKResponse:
+    return BARKResponse(
+        response_id=f"{status}_{ctx.directive.directive_id}",
+        directive_id=ctx.directive.directive_id,
+        status=status,
+        result=result,
+        error=error
+    )
+
+class ValidationMiddleware:
+    """Refuse directives that violate the sovereign axioms"""
+    
+    def __init__(self, validator):
+        self.validator = validator
+    
+    async def __call__(self, ctx: DispatchContext, call_next):
+        if not ctx.entry.validate:
+            return await call_next(ctx)
+        
+        # The BARK layer has already authenticated the message
+        message = ctx.message
+        validation_result = self.validator.validate_directive({
+            'command': ctx.directive.command,
+            'parameters': ctx.directive.parameters,
+            'signature': (message.signature if message is not None else None) or 'bark_verified',
+            'timestamp': message.timestamp if message is not None else time.time()
+        }, ctx.directive.context)
+        
+        if not validation_result['valid']:
+            ctx.outcome = 'refused'
+            return _response(ctx, 'refused', {
+                'reason': validation_result['reason'],
+                'required_corrections': validation_result.get('required_corrections', [])
+            }, error=validation_result['reason'])
+        
+        return await call_next(ctx)
+
+class TracingMiddleware:
+    """Assign trace ids and keep a bounded log of recent dispatches"""
+    
+    def __init__(self, max_traces: int = 256):
+        self.traces = deque(maxlen=max_traces)
+        self._ids = itertools.count(1)
+    
+    async def __call__(self, ctx: DispatchContext, call_next):
+        ctx.trace_id = f"{ctx.directive.directive_id}#{next(self._ids)}"
+        started = time.perf_counter()
+        status = 'exception'
+        try:
+            response = await call_next(ctx)
+            status = getattr(response, 'status', 'success')
+            return response
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000.0
+            self.traces.append({
+                'trace_id': ctx.trace_id,
+                'command': ctx.entry.command,
+                'status': status,
+                'cache_hit': ctx.cache_hit,
+                'duration_ms': duration_ms
+            })
+            logger.debug(f"[{ctx.trace_id}] {ctx.entry.command} -> {status} in {duration_ms:.2f}ms")
+
+class CachingMiddleware:
+    """Serve repeated calls of cacheable handlers from a TTL-bounded LRU cache"""
+    
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    async def __call__(self, ctx: DispatchContext, call_next):
+        if not ctx.entry.cacheable:
+            return await call_next(ctx)
+        
+        key = (ctx.entry.command_id, json.dumps(ctx.directive.parameters, sort_keys=True, default=str))
+        now = time.monotonic()
+        
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] > now:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            ctx.cache_hit = True
+            # Each hit gets its own result so callers cannot mutate the cached copy
+            return replace(
+                cached[1],
+                response_id=f"cached_{ctx.directive.directive_id}",
+                directive_id=ctx.directive.directive_id,
+                result=copy.deepcopy(cached[1].result)
+            )
+        
+        self.misses += 1
+        response = await call_next(ctx)
+        
+        if isinstance(response, BARKResponse) and response.status == 'success':
+            self.cache[key] = (now + self.ttl, replace(response, result=copy.deepcopy(response.result)))
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        
+        return response
+
+class TimeoutMiddleware:
+    """Bound handler execution time"""
+    
+    def __init__(self, default_timeout: float = 30.0):
+        self.default_timeout = default_timeout
+    
+    async def __call__(self, ctx: DispatchContext, call_next):
+        # Handler override, else the sender's timeout capped by the node default
+        timeout = ctx.entry.timeout or min(ctx.directive.timeout or self.default_timeout, self.default_timeout)
+        try:
+            return await asyncio.wait_for(call_next(ctx), timeout=timeout)
+        except asyncio.TimeoutError:
+            ctx.outcome = 'timeout'
+            logger.warning(f"Handler {ctx.entry.command} timed out after {timeout}s")
+            return _response(ctx, 'timeout', {'timeout': timeout}, error='timeout')
+
+class DirectiveDispatcher:
+    """
+    Directive dispatch table
+    
+    Command strings are interned once to small integer ids; each id indexes a
+    flat list of handler entries, so dispatch is a dict lookup plus a list
+    index. Each entry carries its pre-composed middleware chain, so no
+    per-call closure building happens on the hot path.
+    """
+    
+    def __init__(self, middleware: Optional[List[Callable]] = None):
+        """
+        Args:
+            middleware: Middleware callables, outermost first. Each is called
+                as `await mw(ctx, call_next)` and returns the response.
+        """
+        self.command_ids: Dict[str, int] = {}
+        self.commands: List[str] = []
+        self.handlers: List[Optional[HandlerEntry]] = []
+        self.middleware: List[Callable] = list(middleware or [])
+        self.unknown_commands = 0
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], validator=None) -> 'DirectiveDispatcher':
+        """Create a dispatcher from the `dispatcher` configuration section"""
+        config = config or {}
+        available = {
+            'tracing': lambda: TracingMiddleware(config.get('max_traces', 256)),
+            'timeout': lambda: TimeoutMiddleware(config.get('default_timeout', 30.0)),
+            'validation': lambda: ValidationMiddleware(validator) if validator is not None else None,
+            'caching': lambda: CachingMiddleware(config.get('cache_ttl', 30.0), config.get('cache_size', 1024))
+        }
+        
+        middleware = []
+        for name in config.get('middleware', ['tracing', 'timeout', 'validation', 'caching']):
+            if name not in available:
+                raise ValueError(f"Unknown dispatcher middleware: {name}")
+            instance = available[name]()
+            if instance is not None:
+                middleware.append(instance)
+        
+        return cls(middleware)
+    
+    def intern(self, command: str) -> int:
+        """Integer id of a command string, allocating one if needed"""
+        command_id = self.command_ids.get(command)
+        if command_id is None:
+            command_id = len(self.commands)
+            self.command_ids[command] = command_id
+            self.commands.append(command)
+            self.handlers.append(None)
+        return command_id
+    
+    def register(
+        self,
+        command: str,
+        handler: Callable,
+        timeout: Optional[float] = None,
+        cacheable: bool = False,
+        validate: bool = True
+    ) -> int:
+        """
+        Register a handler for a directive command
+        
+        Args:
+            command: Directive command string
+            handler: `handler(directive, message)`, sync or async, returning a BARKResponse
+            timeout: Per-handler timeout override in seconds
+            cacheable: Whether identical calls may be answered from the cache
+            validate: Whether to run sovereign validation first
+        
+        Returns:
+            The command id
+        """
+        command_id = self.intern(command)
+        if self.handlers[command_id] is not None:
+            logger.warning(f"Replacing handler for directive command: {command}")
+        
+        entry = HandlerEntry(
+            command=command,
+            command_id=command_id,
+            handler=handler,
+            is_async=inspect.iscoroutinefunction(handler),
+            timeout=timeout,
+            cacheable=cacheable,
+            validate=validate
+        )
+        entry.chain = self._build_chain(entry)
+        self.handlers[command_id] = entry
+        return command_id
+    
+    def use(self, middleware: Callable):
+        """Append a middleware (innermost) and rebuild the handler chains"""
+        self.middleware.append(middleware)
+        for entry in self.handlers:
+            if entry is not None:
+                entry.chain = self._build_chain(entry)
+    
+    def _build_chain(self, entry: HandlerEntry):
+        """Compose the middleware around the handler call"""
+        async def call_handler(ctx: DispatchContext):
+            if entry.is_async:
+                return await entry.handler(ctx.directive, ctx.message)
+            return entry.handler(ctx.directive, ctx.message)
+        
+        chain = call_handler
+        for middleware in reversed(self.middleware):
+            chain = functools.partial(middleware, call_next=chain)
+        return chain
+    
+    def get_handler(self, command: str) -> Optional[HandlerEntry]:
+        """The handler entry for a command, if registered"""
+        command_id = self.command_ids.get(command)
+        return self.handlers[command_id] if command_id is not None else None
+    
+    async def dispatch(self, directive: BARKDirective, message: Optional[BARKMessage] = None) -> Optional[BARKResponse]:
+        """
+        Dispatch a directive to its handler
+        
+        Args:
+            directive: The directive to handle
+            message: The BARK message that carried it, if any
+        
+        Returns:
+            The handler's response (an error response for unknown commands or failures)
+        """
+        command_id = self.command_ids.get(directive.command)
+        entry = self.handlers[command_id] if command_id is not None else None
+        if entry is None:
+            self.unknown_commands += 1
+            logger.warning(f"No handler for directive: {directive.command}")
+            return BARKResponse(
+                response_id=f"error_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="error",
+                result={'error': 'unknown_command', 'command': directive.command},
+                error='unknown_command'
+            )
+        
+        ctx = DispatchContext(directive=directive, message=message, entry=entry)
+        started = time.perf_counter()
+        try:
+            response = await entry.chain(ctx)
+        except Exception as e:
+            logger.error(f"Handler {entry.command} failed: {e}")
+            ctx.outcome = 'error'
+            response = _response(ctx, 'error', {'error': str(e)}, error=type(e).__name__)
+        
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        if response is not None and response.processing_time is None:
+            response.processing_time = latency_ms / 1000.0
+        
+        if ctx.cache_hit:
+            entry.stats.cache_hits += 1
+        else:
+            outcome = ctx.outcome
+            if outcome is None:
+                outcome = 'error' if getattr(response, 'status', 'success') == 'error' else 'ok'
+            entry.stats.record(latency_ms, outcome)
+        
+        return response
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-handler histograms, slowest (by total time) first"""
+        handlers = {
+            entry.command: entry.stats.to_dict()
+            for entry in sorted(
+                (e for e in self.handlers if e is not None),
+                key=lambda e: e.stats.total_ms,
+                reverse=True
+            )
+        }
+        
+        metrics = {
+            'handlers': handlers,
+            'registered': len(handlers),
+            'unknown_commands': self.unknown_commands
+        }
+        for middleware in self.middleware:
+            if isinstance(middleware, CachingMiddleware):
+                metrics['cache'] = {'hits': middleware.hits, 'misses': middleware.misses, 'size': len(middleware.cache)}
+        return metrics
+    
+    def slowest_handlers(self, limit: int = 5, percentile: float = 95) -> List[Dict[str, Any]]:
+        """Handlers ranked by latency percentile"""
+        ranked = sorted(
+            (e for e in self.handlers if e is not None and e.stats.count),
+            key=lambda e: e.stats.percentile(percentile),
+            reverse=True
+        )
+        return [
+            {'command': e.command, f'p{percentile:g}_ms': e.stats.percentile(percentile), 'count': e.stats.count}
+            for e in ranked[:limit]
+        ]
+    
+    def recent_traces(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent traced dispatches"""
+        for middleware in self.middleware:
+            if isinstance(middleware, TracingMiddleware):
+                return list(middleware.traces)[-limit:]
+        return []
+
+# Example usage and testing
+if __name__ == "__main__":
+    async def test_dispatcher():
+        dispatcher = DirectiveDispatcher.from_config({'middleware': ['tracing', 'timeout', 'caching'], 'default_timeout': 0.05})
+        
+        async def fast(directive, message):
+            return BARKResponse("r", directive.directive_id, "success", {'echo': directive.parameters})
+        
+        async def slow(directive, message):
+            await asyncio.sleep(0.1)
+            return BARKResponse("r", directive.directive_id, "success", {})
+        
+        dispatcher.register("fast", fast, cacheable=True)
+        dispatcher.register("slow", slow)
+        
+        for i in range(5):
+            await dispatcher.dispatch(BARKDirective(f"d{i}", "fast", {'x': i % 2}, {}))
+        response = await dispatcher.dispatch(BARKDirective("d5", "slow", {}, {}))
+        print(f"slow -> {response.status}")
+        
+        print(json.dumps(dispatcher.slowest_handlers(), indent=2))
+        print(dispatcher.get_metrics()['cache'])
+    
+    asyncio.run(test_dispatcher())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+DIRECTIVE PIPELINE - Staged asyncio execution for Lex Nodes
+Runs the process_directive steps as a pipeline of worker tasks connected by
+bounded queues, so torch stages (which release the GIL) overlap with the
+pure-Python stages of neighbouring directives
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Callable
+from dataclasses import dataclass, field
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class DirectiveWorkItem:
+    """A directive travelling through the processing stages"""
+    seq: int
+    directive: Dict[str, Any]
+    context: Optional[Dict[str, Any]]
+    directive_id: str
+    start_time: float
+    enqueued_at: float = 0.0  # When the item was submitted to the first stage queue
+    
+    # Stage outputs
+    validation_result: Optional[Dict[str, Any]] = None
+    x_t: Any = None
+    h_t: Any = None
+    y_pred: Any = None
+    error_signal: Any = None
+    error_state: Any = None
+    control_signal: Any = None
+    error_model_metrics: Optional[Dict[str, Any]] = None  # taken by the error_model stage, published at commit
+    correction: Optional[Dict[str, Any]] = None
+    
+    # Set as soon as the outcome is final (rejected, refused or failed)
+    response: Any = None
+    future: Optional[asyncio.Future] = field(default=None, repr=False)
+
+@dataclass
+class PipelineStage:
+    """A pipeline stage: a node method applied to each work item"""
+    name: str
+    fn: Callable[[DirectiveWorkItem], None]
+    workers: int = 1
+    offload: bool = False  # Run in a worker thread (torch stages release the GIL)
+
+class _StageStats:
+    """Busy time and item counts for a stage"""
+    
+    def __init__(self):
+        self.items = 0
+        self.busy_time = 0.0
+    
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'items': self.items,
+            'busy_time': self.busy_time,
+            'avg_time': self.busy_time / self.items if self.items else 0.0
+        }
+
+class DirectivePipeline:
+    """
+    Staged pipeline for directive processing
+    
+    validate -> tensorise -> kernel -> error_model -> correction -> commit
+    
+    Stateful stages (validator history, kernel state, filter state, metrics)
+    run with a single worker fed by a FIFO queue, so state updates are
+    applied in submission order. Stateless stages may run several workers;
+    the commit stage re-orders their output by sequence number before
+    touching node metrics and history.
+    """
+    
+    def __init__(
+        self,
+        node,
+        queue_size: int = 64,
+        correction_workers: int = 2,
+        offload_torch: bool = True
+    ):
+        """
+        Args:
+            node: The LexNode whose stage methods are executed
+            queue_size: Bound of each inter-stage queue
+            correction_workers: Workers for the stateless correction stage
+            offload_torch: Run torch stages in worker threads
+        """
+        self.node = node
+        self.queue_size = queue_size
+        
+        self.stages: List[PipelineStage] = [
+            PipelineStage('validate', node._stage_validate),
+            PipelineStage('tensorise', node._stage_tensorise),
+            PipelineStage('kernel', node._stage_kernel, offload=offload_torch),
+            PipelineStage('error_model', node._stage_error_model, offload=offload_torch),
+            PipelineStage('correction', node._stage_correction, workers=correction_workers),
+        ]
+        
+        self.queues: List[asyncio.Queue] = []
+        self.tasks: List[asyncio.Task] = []
+        self.stats: Dict[str, _StageStats] = {stage.name: _StageStats() for stage in self.stages}
+        self.stats['commit'] = _StageStats()
+        
+        self.next_seq = 0
+        self.next_commit_seq = 0
+        self.reorder_buffer: Dict[int, DirectiveWorkItem] = {}
+        self.unpublished = 0  # Commits not yet visible in the node snapshot
+        self.waiting = 0  # Submitted items not yet taken by the first stage (queued or blocked on put)
+        
+        self.completed = 0
+        self.started_at: Optional[float] = None
+        self.running = False
+    
+    async def start(self):
+        """Start the stage worker tasks"""
+        if self.running:
+            return
+        
+        # One queue in front of each stage plus one in front of commit
+        self.queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        
+        for index, stage in enumerate(self.stages):
+            for worker in range(stage.workers):
+                self.tasks.append(asyncio.create_task(
+                    self._stage_worker(stage, self.queues[index], self.queues[index + 1]),
+                    name=f"lex_pipeline_{stage.name}_{worker}"
+                ))
+        
+        self.tasks.append(asyncio.create_task(self._commit_worker(self.queues[-1]), name="lex_pipeline_commit"))
+        
+        self.started_at = time.time()
+        self.running = True
+        logger.info(f"Directive pipeline started with {len(self.tasks)} workers")
+    
+    async def stop(self):
+        """Drain in-flight work and stop the workers"""
+        if not self.running:
+            return
+        
+        for queue in self.queues:
+            await queue.join()
+        
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        
+        self.tasks = []
+        self.running = False
+        logger.info("Directive pipeline stopped")
+    
+    async def submit(self, directive: Dict[str, Any], context: Optional[Dict] = None):
+        """
+        Submit a directive and wait for its response
+        
+        Backpressure: awaits while the first stage queue is full. Time spent
+        in that queue is fed to the node's CoDel controller when the first
+        stage takes the item, which may shed it then.
+        """
+        if not self.running:
+            await self.start()
+        
+        item = self.node._begin_directive(directive, context, seq=self.next_seq)
+        if item.response is not None:
+            # Rejected at admission - never enters the pipeline
+            return item.response
+        
+        self.next_seq += 1
+        item.future = asyncio.get_running_loop().create_future()
+        
+        item.enqueued_at = time.time()
+        self.waiting += 1
+        await self.queues[0].put(item)
+        return await item.future
+    
+    async def process_many(self, directives: List[Dict[str, Any]], context: Optional[Dict] = None) -> List[Any]:
+        """Submit a batch of directives; responses are returned in submission order"""
+        return await asyncio.gather(*(self.submit(directive, context) for directive in directives))
+    
+    async def _stage_worker(self, stage: PipelineStage, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        """Apply one stage to each work item"""
+        stats = self.stats[stage.name]
+        first = inbox is self.queues[0]
+        while True:
+            item = await inbox.get()
+            try:
+                if first:
+                    self.waiting -= 1
+                    if item.response is None:
+                        # CoDel sees the real queue delay and depth in front of the pipeline
+                        self.node._admit_dequeued(item, self.waiting)
+                
+                if item.response is None:
+                    started = time.perf_counter()
+                    try:
+                        if stage.offload:
+                            await asyncio.to_thread(stage.fn, item)
+                        else:
+                            stage.fn(item)
+                    except Exception as e:
+                        item.response = self.node._error_response(item, e)
+                    stats.busy_time += time.perf_counter() - started
+                    stats.items += 1
+                
+                await outbox.put(item)
+            finally:
+                inbox.task_done()
+    
+    async def _commit_worker(self, inbox: asyncio.Queue):
+        """Commit results in submission order and resolve the waiting futures"""
+        stats = self.stats['commit']
+        while True:
+            item = await inbox.get()
+            try:
+                self.reorder_buffer[item.seq] = item
+                
+                while self.next_commit_seq in self.reorder_buffer:
+                    ready = self.reorder_buffer.pop(self.next_commit_seq)
+                    self.next_commit_seq += 1
+                    
+                    started = time.perf_counter()
+                    try:
+                        response = self.node._stage_commit(ready)
+                    except Exception as e:
+                        response = self.node._error_response(ready, e)
+                    finally:
+                        self.node._end_directive(ready)
+                    stats.busy_time += time.perf_counter() - started
+                    stats.items += 1
+                    
+                    self.completed += 1
+                    self.unpublished += 1
+                    if not ready.future.done():
+                        ready.future.set_result(response)
+                
+                # Publish one status snapshot per burst of commits
+                if self.unpublished and inbox.empty():
+                    self.node.publish_snapshot()
+                    self.unpublished = 0
+            finally:
+                inbox.task_done()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pipeline throughput and per-stage utilisation"""
+        elapsed = time.time() - self.started_at if self.started_at else 0.0
+        return {
+            'running': self.running,
+            'completed': self.completed,
+            'throughput': self.completed / elapsed if elapsed > 0 else 0.0,
+            'queue_depths': [queue.qsize() for queue in self.queues],
+            'waiting': self.waiting,
+            'stages': {name: stats.to_dict() for name, stats in self.stats.items()}
+        }
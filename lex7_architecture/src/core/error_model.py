@@ -9,13 +9,21 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
-from typing import Optional, Tuple, Dict, List, Any
+from typing import Optional, Tuple, Dict, List, Any, Callable
 import logging
+import math
 from pathlib import Path
 import json
+import time
+import hashlib
+from collections import deque, OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 
+from .axiom_engine import AxiomEngine, copy_validation_result
+from .axiom_hive import AxiomHive
+from .streaming_stats import SlidingWindowStats
+
 logger = logging.getLogger(__name__)
 
 class ConvergenceMethod(Enum):
@@ -24,23 +32,233 @@ class ConvergenceMethod(Enum):
     PID = "pid"
     ADAPTIVE = "adaptive"
     GRADIENT_DESCENT = "gradient_descent"
+    SQUARE_ROOT_KALMAN = "square_root_kalman"
+    INFORMATION_FILTER = "information_filter"
+    PID_BANK = "pid_bank"
+
+def vector_summary(vector: Any) -> Dict[str, float]:
+    """Summary statistics of a tensor, used instead of shipping the tensor itself"""
+    if not isinstance(vector, torch.Tensor) or vector.numel() == 0:
+        return {"dim": 0, "norm": 0.0, "mean": 0.0, "max_abs": 0.0}
+    
+    flat = vector.detach().reshape(-1)
+    return {
+        "dim": flat.numel(),
+        "norm": torch.linalg.vector_norm(flat).item(),
+        "mean": flat.mean().item(),
+        "max_abs": flat.abs().max().item()
+    }
 
-@dataclass
+@dataclass(slots=True)
 class ErrorState:
-    """Represents the current error state of the system"""
+    """
+    Represents the current error state of the system
+    
+    `stability_indicator` is method-dependent and not comparable across a
+    method switch: log det(P) on the Kalman and ensemble paths, the
+    controller confidence in [0, 1] on the PID paths. Read
+    `covariance_logdet` for the covariance volume - it is None whenever the
+    step produced no covariance, never a value on another scale.
+    """
     error_magnitude: float
     error_vector: torch.Tensor
     convergence_rate: float
     stability_indicator: float
     divergence_risk: float
+    covariance_logdet: Optional[float] = None  # log det(P); None on the PID paths
+    
+    def summary(self) -> Dict[str, Any]:
+        """Scalar-only view of the error state (no tensors)"""
+        return {
+            "error_magnitude": float(self.error_magnitude),
+            "convergence_rate": float(self.convergence_rate),
+            "stability_indicator": float(self.stability_indicator),
+            "divergence_risk": float(self.divergence_risk),
+            "covariance_logdet": self.covariance_logdet,
+            "error_vector": vector_summary(self.error_vector)
+        }
 
-@dataclass
+@dataclass(slots=True)
 class ControlSignal:
     """Represents the control signal generated by the error model"""
     correction_magnitude: float
     correction_direction: torch.Tensor
     confidence: float
     convergence_action: str
+    
+    def summary(self) -> Dict[str, Any]:
+        """Scalar-only view of the control signal (no tensors)"""
+        magnitude = self.correction_magnitude
+        return {
+            "correction_magnitude": float(magnitude.item() if hasattr(magnitude, 'item') else magnitude),
+            "confidence": float(self.confidence),
+            "convergence_action": self.convergence_action,
+            "correction_direction": vector_summary(self.correction_direction)
+        }
+
+@dataclass(slots=True)
+class MethodTelemetry:
+    """Online cost and effect estimates for one convergence method"""
+    steps: int = 0
+    latency_ms: float = 0.0        # EWMA of wall time per step
+    error_reduction: float = 0.0   # EWMA of relative error decrease per step
+    reduction_samples: int = 0
+    total_latency_ms: float = 0.0
+    
+    def record_latency(self, latency_ms: float, alpha: float):
+        self.latency_ms = latency_ms if self.steps == 0 else self.latency_ms + alpha * (latency_ms - self.latency_ms)
+        self.steps += 1
+        self.total_latency_ms += latency_ms
+    
+    def record_reduction(self, reduction: float, alpha: float):
+        if self.reduction_samples == 0:
+            self.error_reduction = reduction
+        else:
+            self.error_reduction += alpha * (reduction - self.error_reduction)
+        self.reduction_samples += 1
+    
+    def summary(self) -> Dict[str, float]:
+        return {
+            "steps": self.steps,
+            "latency_ms": self.latency_ms,
+            "error_reduction": self.error_reduction,
+            "total_latency_ms": self.total_latency_ms
+        }
+
+def solve_discrete_riccati(
+    A: torch.Tensor,
+    H: torch.Tensor,
+    Q: torch.Tensor,
+    R: torch.Tensor,
+    tol: float = 1e-10,
+    max_iterations: int = 64
+) -> Optional[torch.Tensor]:
+    """
+    Steady-state predicted covariance of a time-invariant Kalman filter
+    
+    Solves P = A P A^T - A P H^T (H P H^T + R)^-1 H P A^T + Q with the
+    structure-preserving doubling algorithm (quadratic convergence, one
+    doubling covers 2^k Riccati steps), in float64.
+    
+    Args:
+        A: State transition [d, d]
+        H: Observation matrix [m, d]
+        Q: Process noise [d, d]
+        R: Observation noise [m, m]
+        tol: Relative change (and residual) accepted as converged
+        max_iterations: Doubling steps before giving up
+    
+    Returns:
+        P_inf (float64), or None if the iteration did not converge, e.g.
+        when an unobserved state is not stable
+    """
+    A = A.to(torch.float64)
+    H = H.to(torch.float64)
+    Q = Q.to(torch.float64)
+    R = R.to(torch.float64)
+    I = torch.eye(A.shape[0], dtype=torch.float64)
+    
+    # Dual of the control DARE: A -> A^T, B -> H^T
+    A_k = A.T.clone()
+    G_k = torch.matmul(H.T, torch.linalg.solve(R, H))
+    P_k = Q.clone()
+    
+    for _ in range(max_iterations):
+        W = I + torch.matmul(G_k, P_k)
+        W_inv_A = torch.linalg.solve(W, A_k)
+        W_inv_G = torch.linalg.solve(W, G_k)
+        
+        P_next = P_k + torch.matmul(torch.matmul(A_k.T, P_k), W_inv_A)
+        G_k = G_k + torch.matmul(torch.matmul(A_k, W_inv_G), A_k.T)
+        A_k = torch.matmul(A_k, W_inv_A)
+        
+        if not torch.isfinite(P_next).all():
+            return None
+        
+        change = (P_next - P_k).abs().max().item()
+        P_k = (P_next + P_next.T) / 2
+        if change <= tol * max(1.0, P_k.abs().max().item()):
+            break
+    else:
+        return None
+    
+    # Accept only a genuine fixed point of the Riccati recursion
+    S = torch.matmul(torch.matmul(H, P_k), H.T) + R
+    PHt = torch.matmul(P_k, H.T)
+    P_check = torch.matmul(torch.matmul(A, P_k - torch.matmul(PHt, torch.linalg.solve(S, PHt.T))), A.T) + Q
+    if (P_check - P_k).abs().max().item() > 1e3 * tol * max(1.0, P_k.abs().max().item()):
+        return None
+    return P_k
+
+def filter_outputs(
+    error_vector: torch.Tensor,
+    covariance_trace: float,
+    covariance_logdet: float
+) -> Tuple[ErrorState, ControlSignal]:
+    """
+    Error state and control signal from a filter's estimate
+    
+    Args:
+        error_vector: Estimate minus observation
+        covariance_trace: trace(P) of the estimate
+        covariance_logdet: log det(P) of the estimate
+    
+    Returns:
+        error_state: Current error state
+        control_signal: Control signal for convergence
+    """
+    # Compute error metrics
+    error_magnitude = torch.norm(error_vector).item()
+    
+    # Compute convergence rate
+    convergence_rate = 1.0 / (1.0 + covariance_trace)
+    
+    # Compute divergence risk
+    divergence_risk = max(0.0, error_magnitude - convergence_rate)
+    
+    # Generate control signal
+    control_gain = 1.0  # Could be adaptive
+    correction_magnitude = error_magnitude * control_gain
+    
+    if error_magnitude > 0:
+        correction_direction = -error_vector / error_magnitude
+    else:
+        correction_direction = torch.zeros_like(error_vector)
+    
+    confidence = min(1.0, convergence_rate)
+    
+    # Determine convergence action
+    if error_magnitude < 0.01:
+        action = "converged"
+    elif error_magnitude < 0.1:
+        action = "fine_tuning"
+    elif divergence_risk > 0.5:
+        action = "emergency_correction"
+    else:
+        action = "normal_correction"
+    
+    error_state = ErrorState(
+        error_magnitude=error_magnitude,
+        error_vector=error_vector,
+        convergence_rate=convergence_rate,
+        stability_indicator=covariance_logdet,
+        divergence_risk=divergence_risk,
+        covariance_logdet=covariance_logdet
+    )
+    
+    control_signal = ControlSignal(
+        correction_magnitude=correction_magnitude,
+        correction_direction=correction_direction,
+        confidence=confidence,
+        convergence_action=action
+    )
+    
+    return error_state, control_signal
+
+def _logdet(P: torch.Tensor) -> float:
+    """log det of a covariance; -inf if it is not positive definite"""
+    sign, logabsdet = torch.linalg.slogdet(P)
+    return logabsdet.item() if sign.item() > 0 else float('-inf')
 
 class KalmanFilter:
     """
@@ -156,67 +374,757 @@ class KalmanFilter:
             error_state: Current error state
             control_signal: Control signal for convergence
         """
-        # Predict
+        # Predict, update and store the new estimate
+        self._advance(u, z)
+        
+        # Stability indicator: log det(P), finite at any dimension
+        return filter_outputs(
+            self.x_est[:self.observation_dim] - z,
+            self._covariance_trace(),
+            self._covariance_logdet()
+        )
+    
+    def _advance(self, u: torch.Tensor, z: torch.Tensor):
+        """Predict + update, storing x_est and P"""
         x_pred, P_pred = self.predict(u)
-        
-        # Update
         x_est, P_est, K = self.update(x_pred, P_pred, z)
         
-        # Store estimates
         self.x_est = x_est
         self.P = P_est
+    
+    def _covariance_trace(self) -> float:
+        """trace(P) of the current estimate"""
+        return torch.trace(self.P).item()
+    
+    def _covariance_logdet(self) -> float:
+        """log det(P) of the current estimate (-inf if P is not positive definite)"""
+        return _logdet(self.P)
+
+class StructuredKalmanFilter(KalmanFilter):
+    """
+    Kalman Filter that exploits the structure of A, Q, H and P
+    
+    Let S be the indices touched by an off-diagonal entry of A, Q or P, or
+    by a non-zero column of H. Outside S, A and Q are diagonal and nothing
+    is observed, so P stays block-diagonal: a dense |S|x|S| block plus a
+    diagonal for the rest, and the cross-covariance stays zero.
+    
+    Each step costs O(|S|^3 + d*m) instead of the dense O(d^3), and the
+    dense d x d covariance (and the d x d identity in update) is never
+    allocated. When S covers too much of the state the filter keeps a
+    dense covariance and uses the KalmanFilter path.
+    
+    Changes to A, B, H, Q or R (reassignment or in-place edits) are picked
+    up through a (id, _version) fingerprint and the structure is re-derived.
+    
+    With steady_state=True the Riccati equation of the (time-invariant)
+    active system is solved once. The full filter runs until its
+    covariance reaches the steady state, after which the gain is fixed and
+    a step is two matrix-vector products. A parameter change or a new P
+    drops back to the full filter.
+    """
+    
+    def __init__(
+        self,
+        state_dim: int,
+        observation_dim: int,
+        dt: float = 1.0,
+        max_active_fraction: float = 0.25,
+        steady_state: bool = False,
+        steady_state_tol: float = 1e-6
+    ):
+        """
+        Args:
+            state_dim: State dimension d
+            observation_dim: Observation dimension m
+            dt: Time step
+            max_active_fraction: Above this |S|/d the dense path is used
+            steady_state: Switch to the fixed steady-state gain once reached
+            steady_state_tol: Relative distance to P_inf at which to switch
+        """
+        self.max_active_fraction = max_active_fraction
+        self.steady_state = steady_state
+        self.steady_state_tol = steady_state_tol
+        self.steady_state_locked = False
+        self._steady_gain: Optional[torch.Tensor] = None  # K_inf
+        self._steady_P: Optional[torch.Tensor] = None     # posterior P_inf (block, or dense)
+        self.active_idx: Optional[torch.Tensor] = None  # S, or None in dense mode
+        self.P_active: Optional[torch.Tensor] = None    # P[S, S]
+        self.p_diag: Optional[torch.Tensor] = None      # diag(P); entries in S unused
+        self._P_dense: Optional[torch.Tensor] = None
+        self._fingerprint = None
+        
+        super().__init__(state_dim, observation_dim, dt)
+    
+    # Covariance storage
+    
+    @property
+    def P(self) -> torch.Tensor:
+        """Dense covariance (materialised on demand in structured mode)"""
+        if self.active_idx is None:
+            return self._P_dense
+        
+        P = torch.diag(self.p_diag)
+        idx = self.active_idx
+        P[idx.unsqueeze(1), idx.unsqueeze(0)] = self._block_covariance()
+        return P
+    
+    @P.setter
+    def P(self, value: torch.Tensor):
+        self._set_covariance(value)
+    
+    def _parameters_fingerprint(self) -> tuple:
+        """Identity and in-place version of the model matrices"""
+        return tuple((id(t), t._version) for t in (self.A, self.B, self.H, self.Q, self.R))
+    
+    def _structural_indices(self, P: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """Indices coupled by off-diagonal entries of A, Q (and P) or observed through H"""
+        mask = self.H.ne(0).any(dim=0)
+        for M in (self.A, self.Q) + ((P,) if P is not None else ()):
+            off = M.ne(0)
+            off.fill_diagonal_(False)
+            mask |= off.any(dim=0) | off.any(dim=1)
+        return mask
+    
+    def _set_covariance(self, P: torch.Tensor):
+        """Split a dense covariance into the active block and the diagonal"""
+        mask = self._structural_indices(P)
+        self._fingerprint = self._parameters_fingerprint()
+        
+        if mask.sum().item() > self.max_active_fraction * self.state_dim:
+            self.active_idx = None
+            self.P_active = None
+            self.p_diag = None
+            self._P_dense = P.clone()
+        else:
+            idx = torch.nonzero(mask).flatten()
+            self.active_idx = idx
+            self.p_diag = torch.diagonal(P).clone()
+            self._P_dense = None
+            self._cache_blocks()
+            self._set_block(P[idx.unsqueeze(1), idx.unsqueeze(0)].clone())
+        
+        self._solve_steady_state()
+    
+    def _cache_blocks(self):
+        """Slice the model matrices to the active block"""
+        idx = self.active_idx
+        self.A_active = self.A[idx.unsqueeze(1), idx.unsqueeze(0)]
+        self.Q_active = self.Q[idx.unsqueeze(1), idx.unsqueeze(0)]
+        self.H_active = self.H[:, idx]
+        self.a_diag = torch.diagonal(self.A).clone()
+        self.q_diag = torch.diagonal(self.Q).clone()
+        self.eye_active = torch.eye(len(idx), dtype=self.A.dtype)
+        
+        complement = torch.ones(self.state_dim, dtype=torch.bool)
+        complement[idx] = False
+        self.complement_idx = torch.nonzero(complement).flatten()
+    
+    def _refresh_structure(self):
+        """Re-derive S after A/B/H/Q/R changed"""
+        if self._fingerprint == self._parameters_fingerprint():
+            return
+        # P only has off-diagonal mass inside the old S, so the dense copy is exact
+        self._set_covariance(self.P)
+    
+    # Filtering
+    
+    def _advance(self, u: torch.Tensor, z: torch.Tensor):
+        """Predict + update on the active block; diagonal propagation elsewhere"""
+        self._refresh_structure()
+        if self.steady_state_locked:
+            self._advance_steady(u, z)
+            return
         
-        # Compute error metrics
-        error_vector = x_est[:self.observation_dim] - z
-        error_magnitude = torch.norm(error_vector).item()
+        if self.active_idx is None:
+            x_pred, P_pred = self.predict(u)
+            self.x_est, self._P_dense, K = self.update(x_pred, P_pred, z)
+            self._check_steady_state()
+            return
+        
+        idx = self.active_idx
+        if u is None:
+            u = torch.zeros(self.observation_dim, dtype=torch.float32)
         
-        # Compute convergence rate
-        P_trace = torch.trace(P_est).item()
-        convergence_rate = 1.0 / (1.0 + P_trace)
+        # State prediction: A is diagonal outside S and has no S <-> rest coupling
+        x_pred = self.a_diag * self.x_est + torch.matmul(self.B, u)
+        x_pred[idx] = torch.matmul(self.A_active, self.x_est[idx]) + torch.matmul(self.B[idx], u)
         
-        # Compute stability indicator
-        stability = torch.det(P_est).item()
+        # Covariance prediction
+        self._predict_block()
+        self.p_diag = self.a_diag * self.a_diag * self.p_diag + self.q_diag
         
-        # Compute divergence risk
-        divergence_risk = max(0.0, error_magnitude - convergence_rate)
+        # Update (H only sees S, so the gain is zero elsewhere)
+        y = z - torch.matmul(self.H_active, x_pred[idx])
+        x_pred[idx] = x_pred[idx] + self._update_block(y)
+        self.p_diag[idx] = self._block_diagonal()
         
-        # Generate control signal
-        control_gain = 1.0  # Could be adaptive
-        correction_magnitude = error_magnitude * control_gain
+        self.x_est = x_pred
+        self._check_steady_state()
+    
+    # Steady-state gain
+    
+    def _solve_steady_state(self):
+        """Solve the Riccati equation for the current model (full filter until reached)"""
+        self.steady_state_locked = False
+        self._steady_gain = None
+        self._steady_P = None
+        if not self.steady_state:
+            return
         
-        if error_magnitude > 0:
-            correction_direction = -error_vector / error_magnitude
+        if self.active_idx is None:
+            A, H, Q = self.A, self.H, self.Q
         else:
-            correction_direction = torch.zeros_like(error_vector)
+            A, H, Q = self.A_active, self.H_active, self.Q_active
         
-        confidence = min(1.0, convergence_rate)
+        P_prior = solve_discrete_riccati(A, H, Q, self.R)
+        if P_prior is None:
+            logger.warning("Steady-state Kalman gain did not converge; using the full filter")
+            return
         
-        # Determine convergence action
-        if error_magnitude < 0.01:
-            action = "converged"
-        elif error_magnitude < 0.1:
-            action = "fine_tuning"
-        elif divergence_risk > 0.5:
-            action = "emergency_correction"
-        else:
-            action = "normal_correction"
+        H64 = H.to(torch.float64)
+        S = torch.matmul(torch.matmul(H64, P_prior), H64.T) + self.R.to(torch.float64)
+        K = torch.linalg.solve(S, torch.matmul(H64, P_prior)).T
         
-        error_state = ErrorState(
-            error_magnitude=error_magnitude,
-            error_vector=error_vector,
-            convergence_rate=convergence_rate,
-            stability_indicator=stability,
-            divergence_risk=divergence_risk
+        # Posterior steady state in Joseph form
+        I_KH = torch.eye(P_prior.shape[0], dtype=torch.float64) - torch.matmul(K, H64)
+        P_post = (
+            torch.matmul(torch.matmul(I_KH, P_prior), I_KH.T)
+            + torch.matmul(torch.matmul(K, self.R.to(torch.float64)), K.T)
         )
         
-        control_signal = ControlSignal(
-            correction_magnitude=correction_magnitude,
-            correction_direction=correction_direction,
-            confidence=confidence,
-            convergence_action=action
+        self._steady_gain = K.to(torch.float32)
+        self._steady_P = P_post.to(torch.float32)
+    
+    def _check_steady_state(self):
+        """Switch to the fixed gain once the running covariance reaches P_inf"""
+        if self._steady_P is None:
+            return
+        
+        current = self._P_dense if self.active_idx is None else self._block_covariance()
+        scale = max(1.0, self._steady_P.abs().max().item())
+        if (current - self._steady_P).abs().max().item() > self.steady_state_tol * scale:
+            return
+        
+        if self.active_idx is None:
+            self._P_dense = self._steady_P.clone()
+            self._steady_logdet = _logdet(self._P_dense)
+        else:
+            self._set_block(self._steady_P.clone())
+            self._steady_diag = torch.diagonal(self._steady_P).clone()
+            self.p_diag[self.active_idx] = self._steady_diag
+        self.steady_state_locked = True
+    
+    def _advance_steady(self, u: torch.Tensor, z: torch.Tensor):
+        """x <- A x + B u, then x <- x + K_inf (z - H x); the covariance is fixed"""
+        if u is None:
+            u = torch.zeros(self.observation_dim, dtype=torch.float32)
+        
+        if self.active_idx is None:
+            x_pred = torch.matmul(self.A, self.x_est) + torch.matmul(self.B, u)
+            self.x_est = x_pred + torch.matmul(self._steady_gain, z - torch.matmul(self.H, x_pred))
+            return
+        
+        idx = self.active_idx
+        x_pred = self.a_diag * self.x_est + torch.matmul(self.B, u)
+        x_block = torch.matmul(self.A_active, self.x_est[idx]) + torch.matmul(self.B[idx], u)
+        x_pred[idx] = x_block + torch.matmul(self._steady_gain, z - torch.matmul(self.H_active, x_block))
+        self.x_est = x_pred
+        
+        # Unobserved diagonal states keep propagating
+        self.p_diag = self.a_diag * self.a_diag * self.p_diag + self.q_diag
+        self.p_diag[idx] = self._steady_diag
+    
+    # Active-block covariance - overridden by the factored variants
+    
+    def _set_block(self, P_block: torch.Tensor):
+        """Load the active block from a covariance matrix"""
+        self.P_active = P_block
+    
+    def _block_covariance(self) -> torch.Tensor:
+        """The active block as a covariance matrix"""
+        return self.P_active
+    
+    def _block_diagonal(self) -> torch.Tensor:
+        """Variances of the active indices"""
+        return torch.diagonal(self._block_covariance())
+    
+    def _block_logdet(self) -> torch.Tensor:
+        """log det of the active block"""
+        sign, logabsdet = torch.linalg.slogdet(self.P_active)
+        return logabsdet if sign.item() > 0 else torch.tensor(float('-inf'))
+    
+    def _predict_block(self):
+        """P_SS <- A_SS P_SS A_SS^T + Q_SS"""
+        self.P_active = torch.matmul(torch.matmul(self.A_active, self.P_active), self.A_active.T) + self.Q_active
+    
+    def _update_block(self, y: torch.Tensor) -> torch.Tensor:
+        """Measurement update of the active block; returns the state correction K y"""
+        H = self.H_active
+        P_pred = self.P_active
+        S = torch.matmul(torch.matmul(H, P_pred), H.T) + self.R
+        K = torch.matmul(torch.matmul(P_pred, H.T), torch.inverse(S))
+        
+        self.P_active = torch.matmul(self.eye_active - torch.matmul(K, H), P_pred)
+        return torch.matmul(K, y)
+    
+    def _covariance_trace(self) -> float:
+        if self.active_idx is None:
+            return super()._covariance_trace()
+        return self.p_diag.sum().item()
+    
+    def _covariance_logdet(self) -> float:
+        if self.active_idx is None:
+            if self.steady_state_locked:
+                return self._steady_logdet
+            return super()._covariance_logdet()
+        # Block-diagonal: the block's log det plus the log variances elsewhere
+        # (p_diag mirrors the block's diagonal, which is subtracted back out)
+        log_diag = torch.log(self.p_diag)
+        return (self._block_logdet() + log_diag.sum() - log_diag[self.active_idx].sum()).item()
+
+class SquareRootKalmanFilter(StructuredKalmanFilter):
+    """
+    Square-root (Cholesky factor) Kalman Filter
+    
+    Carries a lower-triangular L with P_SS = L L^T instead of P_SS itself.
+    Both the time and the measurement update are orthogonal (QR)
+    transformations of a pre-array, so the implied covariance is
+    symmetric and positive semi-definite by construction and the
+    conditioning of L is the square root of that of P. The gain is applied
+    with a triangular solve; no matrix is ever inverted.
+    """
+    
+    def __init__(
+        self,
+        state_dim: int,
+        observation_dim: int,
+        dt: float = 1.0,
+        max_active_fraction: float = 1.0,
+        steady_state: bool = False,
+        steady_state_tol: float = 1e-6
+    ):
+        self.L_active: Optional[torch.Tensor] = None  # P[S, S] = L L^T
+        super().__init__(state_dim, observation_dim, dt, max_active_fraction, steady_state, steady_state_tol)
+    
+    def _cache_blocks(self):
+        super()._cache_blocks()
+        self.Q_sqrt_active = torch.linalg.cholesky(self.Q_active)
+        self.R_sqrt = torch.linalg.cholesky(self.R)
+    
+    def _set_block(self, P_block: torch.Tensor):
+        self.L_active = torch.linalg.cholesky(P_block)
+    
+    def _block_covariance(self) -> torch.Tensor:
+        return torch.matmul(self.L_active, self.L_active.T)
+    
+    def _block_diagonal(self) -> torch.Tensor:
+        return (self.L_active * self.L_active).sum(dim=1)
+    
+    def _block_logdet(self) -> torch.Tensor:
+        return 2.0 * torch.log(torch.diagonal(self.L_active).abs()).sum()
+    
+    def _predict_block(self):
+        """[(A L)^T; Q^T/2] = Q_r R  ->  L_pred = R^T"""
+        pre = torch.cat([torch.matmul(self.A_active, self.L_active).T, self.Q_sqrt_active.T], dim=0)
+        self.L_active = torch.linalg.qr(pre, mode='r').R.T
+    
+    def _update_block(self, y: torch.Tensor) -> torch.Tensor:
+        """
+        Triangularise [[R^1/2, H L], [0, L]] to [[S^1/2, 0], [K S^1/2, L_new]]
+        
+        Returns:
+            State correction K y = (K S^1/2) (S^1/2)^-1 y
+        """
+        m = self.observation_dim
+        k = len(self.active_idx)
+        
+        pre = torch.zeros(m + k, m + k, dtype=self.L_active.dtype)
+        pre[:m, :m] = self.R_sqrt
+        pre[:m, m:] = torch.matmul(self.H_active, self.L_active)
+        pre[m:, m:] = self.L_active
+        post = torch.linalg.qr(pre.T, mode='r').R.T
+        
+        S_sqrt = post[:m, :m]
+        K_bar = post[m:, :m]
+        self.L_active = post[m:, m:]
+        
+        innovation = torch.linalg.solve_triangular(S_sqrt, y.unsqueeze(1), upper=False)
+        return torch.matmul(K_bar, innovation).squeeze(1)
+
+class InformationKalmanFilter(StructuredKalmanFilter):
+    """
+    Information-form Kalman Filter
+    
+    Carries the information matrix Y = P_SS^-1 (and its Cholesky factor).
+    The measurement update is additive, Y <- Y + H^T R^-1 H, with
+    H^T R^-1 H cached per model, and the state correction comes from a
+    Cholesky solve against Y. The time update goes through P with
+    Cholesky inverses; explicit inverses of S are never formed.
+    """
+    
+    def __init__(
+        self,
+        state_dim: int,
+        observation_dim: int,
+        dt: float = 1.0,
+        max_active_fraction: float = 1.0,
+        steady_state: bool = False,
+        steady_state_tol: float = 1e-6
+    ):
+        self.Y_active: Optional[torch.Tensor] = None       # P[S, S]^-1
+        self.Y_chol: Optional[torch.Tensor] = None         # Y = Y_chol Y_chol^T
+        super().__init__(state_dim, observation_dim, dt, max_active_fraction, steady_state, steady_state_tol)
+    
+    def _cache_blocks(self):
+        super()._cache_blocks()
+        # H^T R^-1 from a Cholesky solve against R
+        R_chol = torch.linalg.cholesky(self.R)
+        self.HtRinv = torch.cholesky_solve(self.H_active, R_chol).T
+        self.HtRinvH = torch.matmul(self.HtRinv, self.H_active)
+    
+    def _load_information(self, Y: torch.Tensor):
+        self.Y_active = Y
+        self.Y_chol = torch.linalg.cholesky(Y)
+    
+    def _set_block(self, P_block: torch.Tensor):
+        self._load_information(torch.cholesky_inverse(torch.linalg.cholesky(P_block)))
+    
+    def _block_covariance(self) -> torch.Tensor:
+        return torch.cholesky_inverse(self.Y_chol)
+    
+    def _block_logdet(self) -> torch.Tensor:
+        return -2.0 * torch.log(torch.diagonal(self.Y_chol)).sum()
+    
+    def _predict_block(self):
+        P = self._block_covariance()
+        P_pred = torch.matmul(torch.matmul(self.A_active, P), self.A_active.T) + self.Q_active
+        self._load_information(torch.cholesky_inverse(torch.linalg.cholesky(P_pred)))
+    
+    def _update_block(self, y: torch.Tensor) -> torch.Tensor:
+        """Y <- Y + H^T R^-1 H; returns K y = Y^-1 H^T R^-1 y"""
+        self._load_information(self.Y_active + self.HtRinvH)
+        return torch.cholesky_solve(torch.matmul(self.HtRinv, y).unsqueeze(1), self.Y_chol).squeeze(1)
+
+# Kalman variants selectable through error_model.method
+KALMAN_VARIANTS = {
+    ConvergenceMethod.KALMAN_FILTER: StructuredKalmanFilter,
+    ConvergenceMethod.SQUARE_ROOT_KALMAN: SquareRootKalmanFilter,
+    ConvergenceMethod.INFORMATION_FILTER: InformationKalmanFilter
+}
+
+class KalmanFilterBank:
+    """
+    Bank of independent Kalman filters stepped together
+    
+    Holds stacked state [n, d], covariance [n, d, d] and per-filter model
+    matrices, and advances every filter with one set of batched
+    torch.linalg calls. Filters (or single observation components) without
+    an observation this tick are masked: they are predicted but not
+    updated. The gain comes from a Cholesky solve and the covariance uses
+    the Joseph form, so P stays symmetric positive definite.
+    
+    By default each filter is a local linear trend: the first state is the
+    level, the second its rate of change, and the first observation_dim
+    states are observed.
+    """
+    
+    def __init__(
+        self,
+        n_filters: int,
+        state_dim: int,
+        observation_dim: int,
+        dt: float = 1.0,
+        process_noise: float = 0.01,
+        measurement_noise: float = 0.1,
+        initial_variance: float = 1.0,
+        names: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            n_filters: Number of filters n
+            state_dim: State dimension d of each filter
+            observation_dim: Observation dimension m of each filter
+            dt: Time step
+            process_noise: Diagonal of Q
+            measurement_noise: Diagonal of R
+            initial_variance: Diagonal of the initial P
+            names: Optional filter names, one per filter, for observe()/estimates()
+        """
+        if names is not None and len(names) != n_filters:
+            raise ValueError(f"Expected {n_filters} names, got {len(names)}")
+        
+        self.n_filters = n_filters
+        self.state_dim = state_dim
+        self.observation_dim = observation_dim
+        self.dt = dt
+        self.names = list(names) if names is not None else None
+        
+        def stacked(matrix: torch.Tensor) -> torch.Tensor:
+            return matrix.expand(n_filters, *matrix.shape).clone()
+        
+        A = torch.eye(state_dim, dtype=torch.float32)
+        if state_dim > 1:
+            A[0, 1] = dt  # Level-trend relationship
+        
+        H = torch.zeros(observation_dim, state_dim, dtype=torch.float32)
+        H[:, :observation_dim] = torch.eye(observation_dim, dtype=torch.float32)
+        
+        self.A = stacked(A)
+        self.B = torch.zeros(n_filters, state_dim, observation_dim, dtype=torch.float32)
+        self.H = stacked(H)
+        self.Q = stacked(torch.eye(state_dim, dtype=torch.float32) * process_noise)
+        self.R = stacked(torch.eye(observation_dim, dtype=torch.float32) * measurement_noise)
+        
+        self.x_est = torch.zeros(n_filters, state_dim, dtype=torch.float32)
+        self.P = stacked(torch.eye(state_dim, dtype=torch.float32) * initial_variance)
+        self._initial_variance = initial_variance
+        
+        self._eye = torch.eye(state_dim, dtype=torch.float32)
+        self.steps = 0
+        self.observation_counts = torch.zeros(n_filters, dtype=torch.long)
+        
+        logger.info(f"Initialized Kalman Filter Bank: {n_filters} x {state_dim}D state, {observation_dim}D observations")
+    
+    def step(
+        self,
+        z: torch.Tensor,
+        u: Optional[torch.Tensor] = None,
+        mask: Optional[torch.Tensor] = None
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Advance every filter by one tick
+        
+        Args:
+            z: Observations [n, m]; NaN entries count as missing
+            u: Control inputs [n, m]
+            mask: Observed filters [n] or observed components [n, m]
+        
+        Returns:
+            x_est: Updated state estimates [n, d]
+            error_vectors: H x_est - z per filter [n, m], zero where masked
+        """
+        n, m = self.n_filters, self.observation_dim
+        z = z.reshape(n, m).to(torch.float32)
+        
+        observed = torch.isfinite(z)
+        if mask is not None:
+            mask = mask.to(torch.bool)
+            observed &= mask.reshape(n, 1) if mask.dim() == 1 else mask
+        
+        # Predict
+        x_pred = torch.bmm(self.A, self.x_est.unsqueeze(2)).squeeze(2)
+        if u is not None:
+            x_pred = x_pred + torch.bmm(self.B, u.reshape(n, m, 1).to(torch.float32)).squeeze(2)
+        P_pred = torch.bmm(torch.bmm(self.A, self.P), self.A.transpose(1, 2)) + self.Q
+        
+        # Missing components get a zero observation row and no cross-noise,
+        # so their gain column is exactly zero
+        weights = observed.to(torch.float32)
+        H = self.H * weights.unsqueeze(2)
+        pair = weights.unsqueeze(2) * weights.unsqueeze(1)
+        R = self.R * pair + torch.diag_embed(torch.diagonal(self.R, dim1=1, dim2=2) * (1.0 - weights))
+        
+        y = torch.where(observed, z - torch.bmm(H, x_pred.unsqueeze(2)).squeeze(2), torch.zeros_like(z))
+        
+        # Gain: K^T = S^-1 H P_pred (S and P_pred symmetric)
+        HP = torch.bmm(H, P_pred)
+        S = torch.bmm(HP, H.transpose(1, 2)) + R
+        K = torch.cholesky_solve(HP, torch.linalg.cholesky(S)).transpose(1, 2)
+        
+        # Update (Joseph form)
+        self.x_est = x_pred + torch.bmm(K, y.unsqueeze(2)).squeeze(2)
+        I_KH = self._eye - torch.bmm(K, H)
+        self.P = (
+            torch.bmm(torch.bmm(I_KH, P_pred), I_KH.transpose(1, 2))
+            + torch.bmm(torch.bmm(K, R), K.transpose(1, 2))
         )
         
-        return error_state, control_signal
+        self.steps += 1
+        self.observation_counts += observed.any(dim=1).to(torch.long)
+        
+        error_vectors = torch.bmm(self.H, self.x_est.unsqueeze(2)).squeeze(2) - z
+        return self.x_est, torch.where(observed, error_vectors, torch.zeros_like(error_vectors))
+    
+    def reset(self, indices: Optional[torch.Tensor] = None):
+        """Reset the state and covariance of some (default: all) filters"""
+        if indices is None:
+            indices = torch.arange(self.n_filters)
+        self.x_est[indices] = 0.0
+        self.P[indices] = self._eye * self._initial_variance
+        self.observation_counts[indices] = 0
+    
+    def variances(self) -> torch.Tensor:
+        """Marginal state variances [n, d]"""
+        return torch.diagonal(self.P, dim1=1, dim2=2)
+    
+    # Named scalar filters (observation_dim == 1)
+    
+    def observe(self, values: Dict[str, Optional[float]]) -> Dict[str, float]:
+        """
+        Step the named filters with one scalar observation each
+        
+        Missing or None values are masked for this tick; unknown keys
+        are ignored.
+        
+        Returns:
+            Filtered level per name
+        """
+        z = torch.full((self.n_filters, 1), float('nan'), dtype=torch.float32)
+        for i, name in enumerate(self.names):
+            value = values.get(name)
+            if value is not None:
+                z[i, 0] = float(value)
+        
+        x_est, _ = self.step(z)
+        return dict(zip(self.names, x_est[:, 0].tolist()))
+    
+    def estimates(self) -> Dict[str, Dict[str, float]]:
+        """Filtered level (and trend) per named filter, skipping never-observed filters"""
+        levels = self.x_est[:, 0].tolist()
+        trends = self.x_est[:, 1].tolist() if self.state_dim > 1 else None
+        variances = self.P[:, 0, 0].tolist()
+        counts = self.observation_counts.tolist()
+        
+        estimates = {}
+        for i, name in enumerate(self.names):
+            if counts[i] == 0:
+                continue
+            estimate = {'level': levels[i], 'variance': variances[i], 'observations': counts[i]}
+            if trends is not None:
+                estimate['trend'] = trends[i]
+            estimates[name] = estimate
+        return estimates
+
+class EnsembleKalmanFilter:
+    """
+    Ensemble Kalman Filter (ETKF) for nonlinear state dynamics
+    
+    Uncertainty is carried by N members as an [N, d] matrix instead of a
+    d x d covariance. The forecast pushes all members through the state
+    transition in one batched call (the kernel's state_space_step when
+    attached), so LayerNorm/GELU nonlinearity is propagated rather than
+    linearised. The analysis is the ensemble transform update in the
+    N-dimensional ensemble space: O(N^2 d + N^3) per step, with the
+    observation noise R = r I applied elementwise.
+    
+    The represented covariance is the ensemble covariance plus a
+    process-noise floor, P = X'^T X' / (N - 1) + q I; its log-determinant
+    comes from the matrix determinant lemma on the N x N Gram matrix.
+    """
+    
+    def __init__(
+        self,
+        state_dim: int,
+        ensemble_size: int = 64,
+        observation_dim: Optional[int] = None,
+        process_noise: float = 0.01,
+        measurement_noise: float = 0.1,
+        initial_variance: float = 1.0,
+        inflation: float = 1.02,
+        dynamics: Optional[Callable[[torch.Tensor, Any], torch.Tensor]] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            state_dim: State dimension d
+            ensemble_size: Number of members N
+            observation_dim: Leading state components observed (default: all)
+            process_noise: Variance q of the additive forecast noise
+            measurement_noise: Variance r of the observation noise
+            initial_variance: Spread of the initial ensemble
+            inflation: Multiplicative anomaly inflation before each analysis
+            dynamics: Batched transition f(members [N, d], input) -> [N, d];
+                identity (random walk) if None
+            seed: Seed for the ensemble and forecast noise
+        """
+        if ensemble_size < 2:
+            raise ValueError("ensemble_size must be at least 2")
+        
+        self.state_dim = state_dim
+        self.ensemble_size = ensemble_size
+        self.observation_dim = observation_dim or state_dim
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.inflation = inflation
+        self.dynamics = dynamics
+        
+        self._generator = torch.Generator().manual_seed(seed)
+        self.members = torch.randn(ensemble_size, state_dim, generator=self._generator) * initial_variance ** 0.5
+        self.x_est = self.members.mean(dim=0)
+        
+        logger.info(f"Initialized Ensemble Kalman Filter: {ensemble_size} members, {state_dim}D state")
+    
+    def forecast(self, dynamics_input: Any = None):
+        """Propagate every member through the dynamics in one batched call"""
+        members = self.members
+        if self.dynamics is not None:
+            members = self.dynamics(members, dynamics_input)
+        noise = torch.randn(members.shape, generator=self._generator) * self.process_noise ** 0.5
+        self.members = members + noise
+    
+    def analyse(self, z: torch.Tensor):
+        """
+        ETKF analysis against observation z of the leading observation_dim states
+        
+        Returns:
+            Ensemble-space Gram eigenvalues, reused for the log-determinant
+        """
+        N = self.ensemble_size
+        m = self.observation_dim
+        
+        mean = self.members.mean(dim=0)
+        anomalies = (self.members - mean) * self.inflation  # X' [N, d]
+        
+        # Observation-space anomalies and innovation (H selects the leading m states)
+        Y = anomalies[:, :m]
+        innovation = z - mean[:m]
+        
+        # (N - 1) I + Y R^-1 Y^T, decomposed once
+        gram = torch.matmul(Y, Y.T) / self.measurement_noise
+        eigenvalues, eigenvectors = torch.linalg.eigh(gram + (N - 1) * torch.eye(N, dtype=gram.dtype))
+        
+        # Mean weights and the symmetric square-root transform
+        projected = torch.matmul(eigenvectors.T, torch.matmul(Y, innovation) / self.measurement_noise)
+        w_mean = torch.matmul(eigenvectors, projected / eigenvalues)
+        W = torch.matmul(eigenvectors * torch.sqrt((N - 1) / eigenvalues), eigenvectors.T)
+        
+        # Members: mean + (w_mean + W_i)^T X'
+        self.members = mean + torch.matmul((W + w_mean.unsqueeze(1)).T, anomalies)
+        self.x_est = self.members.mean(dim=0)
+    
+    def _covariance_stats(self) -> Tuple[float, float]:
+        """trace and log det of P = X'^T X' / (N - 1) + q I, via the N x N Gram matrix"""
+        N = self.ensemble_size
+        anomalies = (self.members - self.x_est) / (N - 1) ** 0.5
+        gram = torch.matmul(anomalies, anomalies.T)
+        
+        q = self.process_noise
+        trace = torch.trace(gram).item() + q * self.state_dim
+        
+        # det(q I_d + X'^T X') = q^d det(I_N + X' X'^T / q)
+        sign, logabsdet = torch.linalg.slogdet(torch.eye(N, dtype=gram.dtype) + gram / q)
+        logdet = self.state_dim * math.log(q) + logabsdet.item()
+        return trace, logdet
+    
+    def step(self, z: torch.Tensor, dynamics_input: Any = None) -> Tuple[ErrorState, ControlSignal]:
+        """
+        Forecast + analysis
+        
+        Args:
+            z: Observation of the leading observation_dim states
+            dynamics_input: Passed to the dynamics (e.g. the kernel input x_t)
+        
+        Returns:
+            error_state: Current error state
+            control_signal: Control signal for convergence
+        """
+        z = z.reshape(-1)[:self.observation_dim].to(torch.float32)
+        self.forecast(dynamics_input)
+        self.analyse(z)
+        
+        covariance_trace, covariance_logdet = self._covariance_stats()
+        return filter_outputs(self.x_est[:self.observation_dim] - z, covariance_trace, covariance_logdet)
 
 class PIDController:
     """
@@ -287,6 +1195,138 @@ class PIDController:
             convergence_action=action
         )
 
+class PIDBank:
+    """
+    Bank of independent PID controllers, one per error channel
+    
+    Gains, integrals and previous errors are [n] tensors and every channel
+    is stepped with a handful of elementwise ops. Includes
+    
+    - clamped anti-windup: the integral is clamped to +-integral_limit,
+      and when output_limit saturates a channel its integral is frozen
+      while the error would push it further into saturation
+    - derivative filtering: first-order low-pass on the error derivative
+      (time constant derivative_tau), and no derivative kick on the
+      first step
+    """
+    
+    def __init__(
+        self,
+        n_channels: int,
+        kp: Any = 1.0,
+        ki: Any = 0.1,
+        kd: Any = 0.05,
+        integral_limit: Optional[float] = 10.0,
+        output_limit: Optional[float] = None,
+        derivative_tau: float = 0.5
+    ):
+        """
+        Args:
+            n_channels: Number of error channels n
+            kp, ki, kd: Gains, scalars or per-channel sequences/tensors of length n
+            integral_limit: Clamp for the integral state (None disables)
+            output_limit: Clamp for the control output (None disables)
+            derivative_tau: Derivative low-pass time constant (0 disables filtering)
+        """
+        self.n_channels = n_channels
+        self.kp = self._gain(kp)
+        self.ki = self._gain(ki)
+        self.kd = self._gain(kd)
+        self.integral_limit = integral_limit
+        self.output_limit = output_limit
+        self.derivative_tau = derivative_tau
+        
+        self.reset()
+        
+        logger.info(f"Initialized PID Bank: {n_channels} channels")
+    
+    def _gain(self, value: Any) -> torch.Tensor:
+        gain = torch.as_tensor(value, dtype=torch.float32)
+        return gain.expand(self.n_channels).clone()
+    
+    def reset(self):
+        """Clear integrals, previous errors and derivative filters"""
+        self.integral = torch.zeros(self.n_channels, dtype=torch.float32)
+        self.prev_error = torch.zeros(self.n_channels, dtype=torch.float32)
+        self.derivative = torch.zeros(self.n_channels, dtype=torch.float32)
+        self.output = torch.zeros(self.n_channels, dtype=torch.float32)
+        self.initialized = False
+    
+    def step(self, errors: Any, dt: float = 1.0) -> torch.Tensor:
+        """
+        Step every channel
+        
+        Args:
+            errors: Current errors [n] (tensor, array or sequence)
+            dt: Time step
+        
+        Returns:
+            Control outputs [n]
+        """
+        errors = torch.as_tensor(errors, dtype=torch.float32).reshape(self.n_channels)
+        
+        # Derivative with first-order filtering; no kick on the first step
+        if self.initialized:
+            raw = (errors - self.prev_error) / dt
+            alpha = self.derivative_tau / (self.derivative_tau + dt)
+            self.derivative = alpha * self.derivative + (1.0 - alpha) * raw
+        self.prev_error = errors
+        
+        # Integral with clamping
+        integral = self.integral + errors * dt
+        if self.integral_limit is not None:
+            integral = integral.clamp(-self.integral_limit, self.integral_limit)
+        
+        output = self.kp * errors + self.ki * integral + self.kd * self.derivative
+        
+        if self.output_limit is not None:
+            # Conditional integration: hold the integral on channels that
+            # saturate with the error pushing further into saturation
+            saturated = output.abs() > self.output_limit
+            winding = saturated & (torch.sign(errors) == torch.sign(output))
+            integral = torch.where(winding, self.integral, integral)
+            output = (self.kp * errors + self.ki * integral + self.kd * self.derivative).clamp(
+                -self.output_limit, self.output_limit
+            )
+        
+        self.integral = integral
+        self.output = output
+        self.initialized = True
+        return output
+    
+    def control_signal(self, errors: Any, dt: float = 1.0) -> ControlSignal:
+        """
+        Step every channel and summarise the outputs as one ControlSignal
+        
+        The correction is the PID output vector: its norm is the
+        magnitude and its unit vector the direction.
+        """
+        errors = torch.as_tensor(errors, dtype=torch.float32).reshape(self.n_channels)
+        output = self.step(errors, dt)
+        
+        correction_magnitude = torch.norm(output).item()
+        if correction_magnitude > 0:
+            correction_direction = output / correction_magnitude
+        else:
+            correction_direction = torch.zeros_like(output)
+        
+        error_magnitude = torch.norm(errors).item()
+        confidence = min(1.0, 1.0 / (1.0 + error_magnitude))
+        
+        if error_magnitude < 0.01:
+            action = "converged"
+        elif error_magnitude < 0.1:
+            action = "fine_tuning"
+        else:
+            action = "normal_correction"
+        
+        return ControlSignal(
+            correction_magnitude=correction_magnitude,
+            correction_direction=correction_direction,
+            confidence=confidence,
+            convergence_action=action
+        )
+
 class AdaptiveErrorModel:
     """
     Adaptive Error Model that switches between methods based on error characteristics
@@ -294,26 +1334,99 @@ class AdaptiveErrorModel:
     This is the intelligent coordinator that decides which convergence method to use
     """
     
-    def __init__(self, state_dim: int, method: ConvergenceMethod = ConvergenceMethod.KALMAN_FILTER):
+    def __init__(
+        self,
+        state_dim: int,
+        method: ConvergenceMethod = ConvergenceMethod.KALMAN_FILTER,
+        steady_state: bool = False,
+        ensemble_size: int = 64,
+        selection: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            state_dim: Dimension of the state being corrected
+            method: Initial convergence method
+            steady_state: Use the fixed steady-state gain on the Kalman path
+            ensemble_size: Members of the ensemble filter (ADAPTIVE)
+            selection: Cost-aware selection settings (latency_budget_ms,
+                convergence_target, hysteresis, min_samples, dwell_steps,
+                telemetry_alpha); without a latency budget the heuristic
+                selector is used unchanged
+        """
         self.state_dim = state_dim
         self.method = method
         
+        # Kalman variant used whenever the Kalman path is selected
+        self.kalman_method = method if method in KALMAN_VARIANTS else ConvergenceMethod.KALMAN_FILTER
+        
         # Initialize convergence methods
-        self.kalman_filter = KalmanFilter(state_dim, min(state_dim, 2))
+        self.kalman_filter = KALMAN_VARIANTS[self.kalman_method](
+            state_dim, min(state_dim, 2), steady_state=steady_state
+        )
         self.pid_controller = PIDController()
         
-        # Performance tracking
-        self.performance_history = []
-        self.method_switches = 0
+        # PID variant used whenever the PID path is selected: the scalar
+        # controller on |error|, or one PID per error dimension
+        self.pid_method = method if method == ConvergenceMethod.PID_BANK else ConvergenceMethod.PID
+        self.pid_bank = PIDBank(state_dim) if self.pid_method == ConvergenceMethod.PID_BANK else None
+        
+        # Ensemble filter for the nonlinear kernel dynamics (ADAPTIVE)
+        self.ensemble_filter = EnsembleKalmanFilter(state_dim, ensemble_size)
         
         # Adaptation parameters
         self.adaptation_window = 100
+        self.characteristics_window = 10
         self.switch_threshold = 0.1
         
+        # Performance tracking - O(1) sliding-window statistics
+        self.performance_stats = SlidingWindowStats(self.adaptation_window)
+        self.recent_stats = SlidingWindowStats(self.characteristics_window)
+        self.performance_history = self.performance_stats.values
+        self.method_switches = 0
+        
+        # Cost-aware selection: per-method latency / error-reduction telemetry
+        selection = selection or {}
+        self.latency_budget_ms = selection.get('latency_budget_ms')
+        self.convergence_target = selection.get('convergence_target', 0.0)
+        self.switch_threshold = selection.get('hysteresis', self.switch_threshold)
+        self.min_samples = selection.get('min_samples', 5)
+        self.dwell_steps = selection.get('dwell_steps', 20)
+        self.telemetry_alpha = selection.get('telemetry_alpha', 0.1)
+        self.candidate_methods = (self.pid_method, self.kalman_method, ConvergenceMethod.ADAPTIVE)
+        self.telemetry: Dict[ConvergenceMethod, MethodTelemetry] = {}
+        self.steps_since_switch = 0
+        self.switch_log = deque(maxlen=20)
+        self.estimated_savings_ms = 0.0
+        self._last_error: Optional[float] = None
+        self._last_method: Optional[ConvergenceMethod] = None
+        
         logger.info(f"Initialized Adaptive Error Model using {method.value}")
     
-    def analyze_error_characteristics(self, error_history: List[float]) -> Dict[str, float]:
-        """Analyze error characteristics to determine best method"""
+    def set_dynamics(self, dynamics: Callable[[torch.Tensor, Any], torch.Tensor]):
+        """
+        Attach the state transition used by the ensemble filter
+        
+        Args:
+            dynamics: Batched f(members [N, d], dynamics_input) -> [N, d]
+        """
+        self.ensemble_filter.dynamics = dynamics
+    
+    def analyze_error_characteristics(self, error_history: Optional[List[float]] = None) -> Dict[str, float]:
+        """
+        Analyze error characteristics to determine best method
+        
+        Without an explicit history the streaming window statistics are
+        used (O(1)); an explicit list is analysed directly.
+        """
+        if error_history is None:
+            if len(self.recent_stats) < self.characteristics_window:
+                return {"noise_level": 0.0, "drift_rate": 0.0, "complexity": 0.0}
+            return {
+                "noise_level": self.recent_stats.variance,
+                "drift_rate": abs(self.recent_stats.slope),
+                "complexity": self.recent_stats.diff_std
+            }
+        
         if len(error_history) < 10:
             return {"noise_level": 0.0, "drift_rate": 0.0, "complexity": 0.0}
         
@@ -351,11 +1464,78 @@ class AdaptiveErrorModel:
             # Standard case
             return ConvergenceMethod.KALMAN_FILTER
     
+    def _resolve_method(self, method: ConvergenceMethod) -> ConvergenceMethod:
+        """Map the generic Kalman / PID choices onto the configured variants"""
+        if method == ConvergenceMethod.KALMAN_FILTER:
+            return self.kalman_method
+        if method == ConvergenceMethod.PID:
+            return self.pid_method
+        return method
+    
+    def _method_estimate(self, method: ConvergenceMethod) -> Tuple[float, Optional[float]]:
+        """
+        (latency_ms, error_reduction) from telemetry
+        
+        Methods with fewer than `min_samples` steps report zero latency and
+        no reduction estimate, so they are tried before being ruled out.
+        """
+        telemetry = self.telemetry.get(method)
+        if telemetry is None or telemetry.steps < self.min_samples:
+            return 0.0, None
+        reduction = telemetry.error_reduction if telemetry.reduction_samples >= self.min_samples else None
+        return telemetry.latency_ms, reduction
+    
+    def _meets_constraints(self, method: ConvergenceMethod) -> bool:
+        latency, reduction = self._method_estimate(method)
+        return latency <= self.latency_budget_ms and (reduction is None or reduction >= self.convergence_target)
+    
+    def select_cost_aware_method(self, preferred: ConvergenceMethod) -> ConvergenceMethod:
+        """
+        Cheapest method that fits the latency budget and convergence target
+        
+        Among methods meeting both constraints the cheapest wins, with the
+        heuristic `preferred` method kept when its latency is within the
+        hysteresis band of the cheapest. If none meets the target, the best
+        reducer within budget is used, else the cheapest overall. The
+        current method is kept for `dwell_steps` after a switch and, while
+        it still meets the constraints, until an alternative is cheaper by
+        more than the hysteresis fraction.
+        
+        Args:
+            preferred: Method chosen by the noise/drift heuristics
+        
+        Returns:
+            Method to run next
+        """
+        estimates = {method: self._method_estimate(method) for method in self.candidate_methods}
+        feasible = [method for method in self.candidate_methods if self._meets_constraints(method)]
+        
+        if feasible:
+            best = min(feasible, key=lambda method: estimates[method][0])
+            if preferred in feasible and estimates[preferred][0] <= (1.0 + self.switch_threshold) * estimates[best][0]:
+                best = preferred
+        else:
+            within_budget = [m for m in self.candidate_methods if estimates[m][0] <= self.latency_budget_ms]
+            if within_budget:
+                best = max(within_budget, key=lambda method: estimates[method][1] or 0.0)
+            else:
+                best = min(self.candidate_methods, key=lambda method: estimates[method][0])
+        
+        current = self.method
+        if best == current or current not in estimates or not self._meets_constraints(current):
+            return best
+        if self.steps_since_switch < self.dwell_steps:
+            return current
+        if estimates[best][0] > (1.0 - self.switch_threshold) * estimates[current][0]:
+            return current
+        return best
+    
     def step(
         self, 
         current_state: torch.Tensor, 
         target_state: torch.Tensor, 
-        control_input: Optional[torch.Tensor] = None
+        control_input: Optional[torch.Tensor] = None,
+        dynamics_input: Any = None
     ) -> Tuple[ErrorState, ControlSignal]:
         """
         Main error model step with adaptive method selection
@@ -364,6 +1544,7 @@ class AdaptiveErrorModel:
             current_state: Current system state
             target_state: Target/desired state
             control_input: External control input
+            dynamics_input: Input to the attached dynamics (ensemble filter)
             
         Returns:
             error_state: Current error state
@@ -373,23 +1554,69 @@ class AdaptiveErrorModel:
         error_vector = target_state - current_state
         error_magnitude = torch.norm(error_vector).item()
         
-        # Update performance history
-        self.performance_history.append(error_magnitude)
-        if len(self.performance_history) > self.adaptation_window:
-            self.performance_history.pop(0)
+        # Update performance statistics
+        self.performance_stats.push(error_magnitude)
+        self.recent_stats.push(error_magnitude)
+        
+        # Credit the error change since the last step to the method that ran
+        if self._last_method is not None and self._last_error > 0:
+            self.telemetry[self._last_method].record_reduction(
+                (self._last_error - error_magnitude) / self._last_error, self.telemetry_alpha
+            )
         
         # Select optimal method
-        if len(self.performance_history) >= 10:
-            error_chars = self.analyze_error_characteristics(self.performance_history)
-            optimal_method = self.select_optimal_method(error_chars)
+        preferred = None
+        if len(self.recent_stats) >= self.characteristics_window:
+            error_chars = self.analyze_error_characteristics()
+            preferred = self._resolve_method(self.select_optimal_method(error_chars))
+            if self.latency_budget_ms is None:
+                optimal_method = preferred
+            else:
+                optimal_method = self.select_cost_aware_method(preferred)
             
             if optimal_method != self.method:
+                self.switch_log.append({
+                    "step": self.performance_stats.total_pushes,
+                    "from": self.method.value,
+                    "to": optimal_method.value,
+                    "latency_delta_ms": self._method_estimate(optimal_method)[0] - self._method_estimate(self.method)[0]
+                })
                 self.method = optimal_method
                 self.method_switches += 1
+                self.steps_since_switch = 0
                 logger.info(f"Switched convergence method to {optimal_method.value}")
+        self.steps_since_switch += 1
+        
+        started = time.perf_counter()
+        error_state, control_signal = self._apply_method(
+            current_state, error_vector, error_magnitude, control_input, dynamics_input
+        )
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        
+        telemetry = self.telemetry.get(self.method)
+        if telemetry is None:
+            telemetry = self.telemetry[self.method] = MethodTelemetry()
+        telemetry.record_latency(latency_ms, self.telemetry_alpha)
+        
+        # Savings against running the heuristic's choice, once it has been measured
+        if preferred is not None and preferred != self.method and preferred in self.telemetry:
+            self.estimated_savings_ms += self.telemetry[preferred].latency_ms - latency_ms
         
-        # Apply selected method
-        if self.method == ConvergenceMethod.KALMAN_FILTER:
+        self._last_error = error_magnitude
+        self._last_method = self.method
+        
+        return error_state, control_signal
+    
+    def _apply_method(
+        self,
+        current_state: torch.Tensor,
+        error_vector: torch.Tensor,
+        error_magnitude: float,
+        control_input: Optional[torch.Tensor],
+        dynamics_input: Any
+    ) -> Tuple[ErrorState, ControlSignal]:
+        """Run the currently selected convergence method"""
+        if self.method in KALMAN_VARIANTS:
             observation = current_state[:self.kalman_filter.observation_dim]
             if control_input is None:
                 control_input = torch.zeros(self.kalman_filter.observation_dim)
@@ -409,7 +1636,22 @@ class AdaptiveErrorModel:
             error_state.stability_indicator = control_signal.confidence
             error_state.divergence_risk = max(0.0, error_magnitude - control_signal.confidence)
             
-        else:  # ADAPTIVE or other
+        elif self.method == ConvergenceMethod.PID_BANK:
+            # Per-dimension PID on the full error vector in one call
+            control_signal = self.pid_bank.control_signal(error_vector)
+            error_state = ErrorState(
+                error_magnitude=error_magnitude,
+                error_vector=error_vector,
+                convergence_rate=control_signal.confidence,
+                stability_indicator=control_signal.confidence,
+                divergence_risk=max(0.0, error_magnitude - control_signal.confidence)
+            )
+        
+        elif self.method == ConvergenceMethod.ADAPTIVE:
+            # Ensemble Kalman filter through the nonlinear state dynamics
+            error_state, control_signal = self.ensemble_filter.step(current_state, dynamics_input)
+        
+        else:  # GRADIENT_DESCENT or other
             # Fallback to Kalman Filter
             observation = current_state[:min(len(current_state), 2)]
             if control_input is None:
@@ -421,19 +1663,56 @@ class AdaptiveErrorModel:
     
     def get_performance_metrics(self) -> Dict[str, float]:
         """Get performance metrics for monitoring"""
-        if not self.performance_history:
+        stats = self.performance_stats
+        if not len(stats):
             return {"avg_error": 0.0, "min_error": 0.0, "max_error": 0.0, "stability": 0.0}
         
-        errors = self.performance_history
         return {
-            "avg_error": np.mean(errors),
-            "min_error": np.min(errors),
-            "max_error": np.max(errors),
-            "stability": 1.0 - np.std(errors),
+            "avg_error": stats.mean,
+            "min_error": stats.min,
+            "max_error": stats.max,
+            "stability": 1.0 - stats.std,
             "method_switches": self.method_switches,
-            "current_method": self.method.value
+            "current_method": self.method.value,
+            "latency_budget_ms": self.latency_budget_ms,
+            "estimated_savings_ms": self.estimated_savings_ms,
+            "recent_switches": list(self.switch_log),
+            "method_telemetry": {method.value: telemetry.summary() for method, telemetry in self.telemetry.items()}
         }
 
+def canonical_digest(*parts: Any) -> Optional[str]:
+    """
+    Stable digest of JSON-like values (key order does not matter)
+    
+    Returns None when the values have no canonical JSON form.
+    """
+    try:
+        canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+def canonical_key(*parts: Any) -> Optional[Tuple]:
+    """
+    Hashable key equal for equal inputs, for in-process caches
+    
+    Scalars and flat dicts of scalars are keyed directly (type-tagged, so
+    1, 1.0 and True differ; dict order does not matter). Anything nested
+    falls back to canonical_digest. Returns None when neither applies.
+    """
+    key = []
+    for part in parts:
+        if part.__class__ in _SCALAR_TYPES:
+            key.append((part.__class__, part))
+        elif part.__class__ is dict and all(value.__class__ in _SCALAR_TYPES for value in part.values()):
+            key.append(frozenset((name, value.__class__, value) for name, value in part.items()))
+        else:
+            digest = canonical_digest(*parts)
+            return ("digest", digest) if digest is not None else None
+    return tuple(key)
+
 class SovereignDirectiveValidator:
     """
     Validates and enforces Sovereign Directives
@@ -441,20 +1720,94 @@ class SovereignDirectiveValidator:
     This ensures that the Lex Node stays aligned with the user's axioms and directives
     """
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, base_dir: Optional[Path] = None):
+        """
+        Args:
+            config: The `sovereign` configuration block
+            base_dir: Directory the Axiom Hive path is relative to (the config file's)
+        """
         self.config = config
         self.sovereign_state = None
-        self.directive_history = []
-        self.compliance_scores = []
         
-        # Load sovereign axioms (in production, this would load from files)
-        self.sovereign_axioms = self.load_sovereign_axioms()
+        # Optional, bounded history of successful validations
+        self.record_history = config.get("record_history", True)
+        history_limit = config.get("history_limit", 1000)
+        self.directive_history = deque(maxlen=history_limit)
+        self.compliance_scores = deque(maxlen=history_limit)
+        
+        # LRU cache of results keyed by the canonical inputs and axiom-set version
+        self.cache_size = config.get("validation_cache_size", 1024)
+        self.validation_cache: OrderedDict = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Running compliance statistics (Welford), so status reads stay O(1)
+        self.compliance_count = 0
+        self.compliance_mean = 0.0
+        self.compliance_m2 = 0.0
+        self.compliance_min = 1.0
+        self.compliance_max = 1.0
+        
+        # Compile the sovereign axioms, from the Axiom Hive directory when
+        # one is configured (hot-swapped when its files change)
+        self.axiom_engine = None
+        hive_config = config.get("axiom_hive")
+        self.axiom_hive = (
+            AxiomHive.from_config(hive_config, base_dir, on_swap=self._install_engine) if hive_config else None
+        )  # None also when the configured directory is missing
+        if self.axiom_hive is not None:
+            self._install_engine(self.axiom_hive.load())
+        else:
+            self.sovereign_axioms = self.load_sovereign_axioms()
         
         logger.info("Initialized Sovereign Directive Validator")
     
+    @property
+    def sovereign_axioms(self) -> List[Dict]:
+        return self.axiom_engine.axioms
+    
+    @sovereign_axioms.setter
+    def sovereign_axioms(self, axioms: List[Dict]):
+        """Replace the axiom set and recompile the engine"""
+        version = self.axiom_engine.version + 1 if self.axiom_engine is not None else 0
+        self.axiom_engine = AxiomEngine(axioms, version)
+        self.validation_cache.clear()
+    
+    def _install_engine(self, engine: AxiomEngine):
+        """
+        Make a compiled axiom set live
+        
+        Called from the Axiom Hive watcher thread, so this is one reference
+        assignment: the cache is keyed by engine version, and entries of the
+        previous set simply age out instead of being cleared under readers.
+        """
+        engine.version = self.axiom_engine.version + 1 if self.axiom_engine is not None else 0
+        self.axiom_engine = engine
+    
+    def _cached(self, key: Optional[Tuple], compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Look up `key` in the LRU cache, computing and storing on a miss
+        
+        Returns a copy, so callers may modify the result. A None key (inputs
+        without a canonical form) bypasses the cache.
+        """
+        if key is None or self.cache_size <= 0:
+            return compute()
+        
+        cache = self.validation_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            result = cache[key] = compute()
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return copy_validation_result(result)
+    
     def load_sovereign_axioms(self) -> List[Dict]:
-        """Load sovereign axioms from configuration"""
-        # In production, this would load from JSON files
+        """Built-in sovereign axioms, used when no `axiom_hive` directory is configured"""
         return [
             {
                 "id": "financial_discipline",
@@ -502,51 +1855,80 @@ class SovereignDirectiveValidator:
         
         # Check signature validity (simplified)
         if not self.verify_signature(directive):
-            return {
-                "valid": False,
-                "reason": "invalid_signature",
-                "compliance_score": 0.0,
-                "required_corrections": []
-            }
+            return self._invalid_signature()
+        
+        # Check compliance with sovereign axioms (compiled; only axioms the
+        # directive can trigger are evaluated, stopping at the first
+        # mandatory violation). Identical inputs are served from the cache.
+        threshold = self.config.get("compliance_threshold", 0.95)
+        inputs = canonical_key(command, parameters, context)
+        engine = self.axiom_engine  # one set for the whole validation, even across a hot swap
+        key = ("directive", engine.version, threshold, inputs) if inputs is not None else None
+        result = self._cached(key, lambda: engine.evaluate(command, parameters, threshold))
+        if result["valid"]:
+            self._record_validation(directive, result["compliance_score"], timestamp)
+        
+        return result
+    
+    def validate_batch(
+        self,
+        directives: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate many directives at once
         
-        # Check compliance with sovereign axioms
-        compliance_results = []
-        required_corrections = []
+        Numeric parameters the axioms read are extracted into NumPy columns
+        and each rule is evaluated as one vectorised comparison across the
+        batch. Results and recorded history are the same as calling
+        validate_directive on each directive in order.
         
-        for axiom in self.sovereign_axioms:
-            compliance = self.check_axiom_compliance(command, parameters, axiom)
-            compliance_results.append(compliance)
-            
-            if compliance["score"] < self.config.get("compliance_threshold", 0.95):
-                if axiom["mandatory"]:
-                    return {
-                        "valid": False,
-                        "reason": f"violates_mandatory_axiom_{axiom['id']}",
-                        "compliance_score": compliance["score"],
-                        "required_corrections": [axiom["rule"]]
-                    }
-                else:
-                    required_corrections.append(compliance["suggestion"])
-        
-        # Compute overall compliance score
-        total_score = sum(r["score"] * r["weight"] for r in compliance_results)
-        total_weight = sum(r["weight"] for r in compliance_results)
-        overall_score = total_score / total_weight if total_weight > 0 else 1.0
-        
-        # Record validation
-        self.compliance_scores.append(overall_score)
+        Args:
+            directives: BARK directives to validate
+            contexts: Optional per-directive context (unused, as in the scalar path)
+        
+        Returns:
+            validation_results: One validation result per directive
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(directives)
+        rows = []
+        for i, directive in enumerate(directives):
+            if self.verify_signature(directive):
+                rows.append(i)
+            else:
+                results[i] = self._invalid_signature()
+        
+        evaluated = self.axiom_engine.evaluate_batch(
+            [directives[i].get("command", "") for i in rows],
+            [directives[i].get("parameters", {}) for i in rows],
+            self.config.get("compliance_threshold", 0.95)
+        )
+        for i, result in zip(rows, evaluated):
+            results[i] = result
+            if result["valid"]:
+                self._record_validation(directives[i], result["compliance_score"], directives[i].get("timestamp", ""))
+        
+        return results
+    
+    def _invalid_signature(self) -> Dict[str, Any]:
+        return {
+            "valid": False,
+            "reason": "invalid_signature",
+            "compliance_score": 0.0,
+            "required_corrections": []
+        }
+    
+    def _record_validation(self, directive: Dict[str, Any], score: float, timestamp: str):
+        """Record a successful validation into the statistics and, if enabled, the history"""
+        self._record_compliance(score)
+        if not self.record_history:
+            return
+        self.compliance_scores.append(score)
         self.directive_history.append({
             "directive": directive,
-            "compliance_score": overall_score,
+            "compliance_score": score,
             "timestamp": timestamp
         })
-        
-        return {
-            "valid": True,
-            "compliance_score": overall_score,
-            "required_corrections": required_corrections,
-            "axiom_compliance": compliance_results
-        }
     
     def verify_signature(self, directive: Dict[str, Any]) -> bool:
         """
@@ -567,6 +1949,10 @@ class SovereignDirectiveValidator:
         """
         Check compliance with a specific sovereign axiom
         
+        Uncompiled reference path; validate_directive uses the compiled
+        AxiomEngine, which gives the same per-axiom results. Repeated checks
+        are served from the validation cache.
+        
         Args:
             command: The command from the directive
             parameters: The parameters from the directive
@@ -575,6 +1961,11 @@ class SovereignDirectiveValidator:
         Returns:
             compliance_result: Result of compliance check
         """
+        inputs = canonical_key(command, parameters, axiom)
+        key = ("axiom", inputs) if inputs is not None else None
+        return self._cached(key, lambda: self._check_axiom_compliance(command, parameters, axiom))
+    
+    def _check_axiom_compliance(self, command: str, parameters: Dict, axiom: Dict) -> Dict[str, Any]:
         axiom_type = axiom["type"]
         rule = axiom["rule"]
         weight = axiom["weight"]
@@ -645,21 +2036,62 @@ class SovereignDirectiveValidator:
             alpha = 0.1
             self.sovereign_state = alpha * avg_compliance + (1 - alpha) * self.sovereign_state
     
+    def _record_compliance(self, score: float):
+        """Fold a compliance score into the running statistics"""
+        if self.compliance_count == 0:
+            self.compliance_min = self.compliance_max = score
+        else:
+            self.compliance_min = min(self.compliance_min, score)
+            self.compliance_max = max(self.compliance_max, score)
+        
+        self.compliance_count += 1
+        delta = score - self.compliance_mean
+        self.compliance_mean += delta / self.compliance_count
+        self.compliance_m2 += delta * (score - self.compliance_mean)
+    
     def get_compliance_statistics(self) -> Dict[str, float]:
         """Get statistics about compliance performance"""
-        if not self.compliance_scores:
+        if self.compliance_count == 0:
             return {"avg_compliance": 1.0, "min_compliance": 1.0, "max_compliance": 1.0}
         
         return {
-            "avg_compliance": np.mean(self.compliance_scores),
-            "min_compliance": np.min(self.compliance_scores),
-            "max_compliance": np.max(self.compliance_scores),
-            "compliance_variance": np.var(self.compliance_scores),
-            "total_directives_validated": len(self.compliance_scores)
+            "avg_compliance": self.compliance_mean,
+            "min_compliance": self.compliance_min,
+            "max_compliance": self.compliance_max,
+            "compliance_variance": self.compliance_m2 / self.compliance_count,
+            "total_directives_validated": self.compliance_count,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses
         }
 
 # Example usage and testing
 if __name__ == "__main__":
+    # Kalman variants must match the dense filter on identical input streams
+    def assert_parity(dense, variant, dense_error, variant_error, name, atol=1e-5, rtol=1e-4):
+        assert torch.allclose(dense.x_est, variant.x_est, atol=atol), f"{name}: state estimate differs"
+        assert torch.allclose(dense.P, variant.P, atol=atol), f"{name}: covariance differs"
+        for field_name in ("error_magnitude", "convergence_rate", "covariance_logdet"):
+            a, b = getattr(dense_error, field_name), getattr(variant_error, field_name)
+            assert a == b or abs(a - b) <= rtol * max(1.0, abs(a), abs(b)), f"{name}: {field_name} {a} != {b}"
+    
+    for state_dim in (8, 64):
+        generator = torch.Generator().manual_seed(state_dim)
+        inputs = [(torch.randn(2, generator=generator), torch.randn(2, generator=generator)) for _ in range(200)]
+        dense = KalmanFilter(state_dim, 2)
+        variants = {
+            "structured": StructuredKalmanFilter(state_dim, 2),
+            "square_root": SquareRootKalmanFilter(state_dim, 2),
+            "information": InformationKalmanFilter(state_dim, 2),
+            "steady_state": StructuredKalmanFilter(state_dim, 2, steady_state=True)
+        }
+        for u, z in inputs:
+            dense_error, _ = dense.step(u, z)
+            variant_errors = {name: kf.step(u, z)[0] for name, kf in variants.items()}
+        for name, kf in variants.items():
+            assert_parity(dense, kf, dense_error, variant_errors[name], f"{name} (state_dim={state_dim})")
+        assert variants["steady_state"].steady_state_locked, "steady-state gain was never reached"
+    print("Kalman variants match the dense filter")
+    
     # Test the Error Model
     error_model = AdaptiveErrorModel(state_dim=4096)
     
@@ -671,8 +2103,9 @@ if __name__ == "__main__":
         error_state, control_signal = error_model.step(current_state, target_state)
         print(f"Step {i+1}: Error={error_state.error_magnitude:.4f}, Action={control_signal.convergence_action}")
         
-        # Simulate state correction
-        current_state = current_state + control_signal.correction_direction * control_signal.correction_magnitude
+        # Simulate state correction (the direction spans the observed components)
+        observed = control_signal.correction_direction.numel()
+        current_state[:observed] += control_signal.correction_direction * control_signal.correction_magnitude
     
     # Test Sovereign Directive Validator
     config = {"compliance_threshold": 0.95}
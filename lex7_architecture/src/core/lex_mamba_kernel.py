@@ -138,8 +138,12 @@ class LexMambaKernel(nn.Module):
         S = torch.matmul(torch.matmul(self.C, self.Q), self.C.T) + self.R
         K = torch.matmul(torch.matmul(self.Q, self.C.T), torch.inverse(S))
         
-        # Error correction
-        error_correction = torch.matmul(K, error)
+        # Inference divergence is one value per batch row; spread it over the output dims
+        if error.shape[-1] != y_pred.shape[-1]:
+            error = error.expand_as(y_pred)
+        
+        # Error correction (row-vector convention, as in state_space_step)
+        error_correction = torch.matmul(error, K.T)
         
         return error_correction
     
@@ -13,6 +13,8 @@ import logging
 import asyncio
 import json
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -24,8 +26,22 @@ from .error_model import (
     SovereignDirectiveValidator, 
     ConvergenceMethod,
     ErrorState,
-    ControlSignal
+    ControlSignal,
+    KalmanFilterBank
 )
+from ..communication.bark_protocol import BARKDirective, BARKResponse, BARKMessage, MessageType
+from ..communication.admission_control import (
+    CoDelAdmissionController,
+    AdmissionDecision,
+    RejectionReason,
+    priority_value
+)
+from .directive_pipeline import DirectivePipeline, DirectiveWorkItem
+from .response_codec import VectorHandle, encode_response, decode_response
+from .node_snapshot import NodeSnapshot, SnapshotPublisher
+from .directive_dispatcher import DirectiveDispatcher
+from .axiom_hive import AxiomHive
+from .node_fork import NodeFork, SimulationResult, fork_copy
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +73,27 @@ class LexResponse:
     error_state: Dict[str, Any]
     processing_time: float
     metadata: Dict[str, Any]
+    error_vector: Optional[VectorHandle] = None  # Lazy handle (compact mode only)
+    
+    def to_bytes(self, include_vector: bool = False) -> bytes:
+        """Encode to the compact binary form (see response_codec)"""
+        return encode_response(
+            self.status,
+            self.directive_id,
+            self.correction,
+            self.confidence,
+            self.convergence_achieved,
+            self.error_state,
+            self.processing_time,
+            self.metadata,
+            error_vector=self.error_vector,
+            include_vector=include_vector
+        )
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'LexResponse':
+        """Decode from the compact binary form"""
+        return cls(**decode_response(data))
 
 class LexNode:
     """
@@ -82,15 +119,22 @@ class LexNode:
         self.config = self.load_config(config_path)
         self.state = NodeState.INITIALIZING
         self.state_history = []
-        self.directive_history = []
         
         # Initialize core components
         self.kernel = LexNodeKernel(config_path)
+        error_config = self.config.get('error_model', {})
         self.error_model = AdaptiveErrorModel(
             state_dim=self.config['model']['state_dim'],
-            method=ConvergenceMethod.KALMAN_FILTER
+            method=ConvergenceMethod(error_config.get('method', 'kalman_filter')),
+            steady_state=error_config.get('steady_state', False),
+            ensemble_size=error_config.get('ensemble_size', 64),
+            selection=error_config.get('selection')
         )
-        self.validator = SovereignDirectiveValidator(self.config['sovereign'])
+        self.error_model.set_dynamics(self._ensemble_dynamics)
+        # Error model metrics as of the last committed directive; snapshots
+        # publish this copy, never the live model a pipeline thread may be stepping
+        self.error_model_metrics = self.error_model.get_performance_metrics()
+        self.validator = SovereignDirectiveValidator(self.config['sovereign'], Path(config_path).parent)
         
         # Runtime state
         self.current_state = None
@@ -98,9 +142,34 @@ class LexNode:
         self.convergence_history = []
         self.performance_metrics = {}
         
+        # Admission control / load shedding
+        admission_config = self.config.get('admission', {})
+        self.admission = CoDelAdmissionController.from_config(admission_config)
+        self.max_directive_history = admission_config.get('max_directive_history', 10000)
+        self.directive_history = deque(maxlen=self.max_directive_history)
+        self.inflight_directives = 0
+        
+        # Optional pipelined execution (see start_pipeline)
+        self.execution_mode = self.config['lex_node'].get('execution_mode', 'serial')
+        
+        # compact: scalar error summaries + lazy vector handle; full: asdict(error_state)
+        self.response_mode = self.config['lex_node'].get('response_mode', 'full')
+        self.pipeline: Optional[DirectivePipeline] = None
+        
+        # Immutable status snapshots, republished after each directive/batch
+        self.snapshots = SnapshotPublisher(node_id)
+        
+        # Command -> handler dispatch for BARK directives (see register_directive_handler)
+        self.dispatcher = DirectiveDispatcher.from_config(
+            self.config.get('dispatcher', {}),
+            validator=self.validator
+        )
+        
         # Initialize the node
         self._initialize()
         
+        self.register_status_section('node', self._build_status)
+        
         logger.info(f"Lex Node {node_id} initialized successfully")
     
     def _initialize(self):
@@ -167,6 +236,9 @@ class LexNode:
         4. Compute error correction
         5. Update state and return correction
         
+        In pipelined execution mode the steps run as overlapping stages
+        (see DirectivePipeline); the serial path below runs them back to back.
+        
         Args:
             directive: BARK directive to process
             context: Additional context for processing
@@ -174,107 +246,560 @@ class LexNode:
         Returns:
             LexResponse: Complete response with correction signal
         """
-        start_time = time.time()
-        directive_id = directive.get('id', f"dir_{int(time.time())}")
+        if self.pipeline is None and self.execution_mode == 'pipelined':
+            await self.start_pipeline()
+        if self.pipeline is not None:
+            return await self.pipeline.submit(directive, context)
+        
+        # Step 0: Admission control - refuse work early instead of queueing it
+        item = self._begin_directive(directive, context)
+        if item.response is not None:
+            return item.response
         
         try:
-            self.state = NodeState.PROCESSING
-            
             # Step 1: Validate directive against sovereign axioms
-            validation_result = self.validator.validate_directive(directive, context)
-            
-            if not validation_result['valid']:
-                return LexResponse(
-                    status='refused',
-                    directive_id=directive_id,
-                    correction={
-                        'action': 'refuse_directive',
-                        'reason': validation_result['reason'],
-                        'required_corrections': validation_result.get('required_corrections', [])
-                    },
-                    confidence=0.0,
-                    convergence_achieved=False,
-                    error_state={'validation_failed': True},
-                    processing_time=time.time() - start_time,
-                    metadata={'validation_result': validation_result}
-                )
-            
-            # Step 2: Convert directive to tensor input
-            x_t = self._directive_to_state_input(directive, validation_result)
+            self._stage_validate(item)
             
-            # Step 3: Process through Lex-Mamba kernel
-            h_t, y_pred, error_signal = self.kernel.kernel.forward(
-                x_t, 
-                self.current_state
-            )
+            if item.response is None:
+                # Step 2: Convert directive to tensor input
+                self._stage_tensorise(item)
+                
+                # Step 3: Process through Lex-Mamba kernel
+                self._stage_kernel(item)
+                
+                # Step 4: Apply error model for convergence
+                self._stage_error_model(item)
+                
+                # Step 5: Generate final correction
+                self._stage_correction(item)
             
-            # Step 4: Apply error model for convergence
-            error_state, control_signal = self.error_model.step(
-                h_t, 
-                self.target_state
+            # Step 6: Record metrics and history
+            return self._stage_commit(item)
+        
+        except Exception as e:
+            return self._error_response(item, e)
+        
+        finally:
+            self._end_directive(item)
+            self.publish_snapshot()
+    
+    async def process_directives(
+        self,
+        directives: List[Dict[str, Any]],
+        context: Optional[Dict] = None
+    ) -> List[LexResponse]:
+        """Process a batch of directives, pipelined when the pipeline is enabled"""
+        if self.pipeline is None and self.execution_mode == 'pipelined':
+            await self.start_pipeline()
+        if self.pipeline is not None:
+            return await self.pipeline.process_many(directives, context)
+        
+        return [await self.process_directive(directive, context) for directive in directives]
+    
+    # BARK directive dispatch
+    
+    def register_directive_handler(self, command: str, handler, **options) -> int:
+        """
+        Register a handler for a BARK directive command
+        
+        Args:
+            command: Directive command string
+            handler: `handler(directive, message)` returning a BARKResponse
+            **options: timeout, cacheable, validate (see DirectiveDispatcher.register)
+        
+        Returns:
+            The interned command id
+        """
+        return self.dispatcher.register(command, handler, **options)
+    
+    async def dispatch_directive(
+        self,
+        directive,
+        message: Optional[BARKMessage] = None
+    ) -> BARKResponse:
+        """
+        Route a BARK directive to its registered handler
+        
+        Commands without a handler go through the Error-State Model
+        (process_directive) and the LexResponse is wrapped as a BARKResponse.
+        
+        Args:
+            directive: BARKDirective (or directive dict)
+            message: The carrying BARK message, if any
+        
+        Returns:
+            BARKResponse
+        """
+        if isinstance(directive, dict):
+            directive = BARKDirective(
+                directive_id=directive.get('id', f"dir_{int(time.time())}"),
+                command=directive.get('command', ''),
+                parameters=directive.get('parameters', {}),
+                context=directive.get('context', {}),
+                timeout=directive.get('timeout', 30.0)
             )
-            
-            # Step 5: Generate final correction
-            correction = self._generate_final_correction(
-                y_pred, 
-                error_signal, 
-                control_signal, 
-                validation_result
+        
+        if self.dispatcher.get_handler(directive.command) is not None:
+            return await self.dispatcher.dispatch(directive, message)
+        
+        lex_response = await self.process_directive({
+            'id': directive.directive_id,
+            'command': directive.command,
+            'parameters': directive.parameters,
+            'context': directive.context,
+            'timeout': directive.timeout,
+            'signature': (message.signature if message is not None else None) or 'bark_verified',
+            'timestamp': message.timestamp if message is not None else time.time(),
+            'priority': message.priority if message is not None else None
+        }, directive.context)
+        
+        return BARKResponse(
+            response_id=f"lex_{directive.directive_id}",
+            directive_id=directive.directive_id,
+            status=lex_response.status,
+            result={
+                'correction': lex_response.correction,
+                'confidence': lex_response.confidence,
+                'convergence_achieved': lex_response.convergence_achieved,
+                'error_state': lex_response.error_state,
+                'metadata': lex_response.metadata
+            },
+            processing_time=lex_response.processing_time,
+            retry_after=lex_response.metadata.get('retry_after')
+        )
+    
+    def attach_protocol(self, bark):
+        """Serve directives arriving on a BARKProtocol instance and reply to the sender"""
+        async def handle_directive_message(message: BARKMessage):
+            directive = BARKDirective(**message.payload['directive'])
+            response = await self.dispatch_directive(directive, message)
+            if response is not None:
+                await bark.send_message(response.to_message(self.node_id, message.sender_id))
+        
+        bark.register_message_handler(MessageType.DIRECTIVE, handle_directive_message)
+    
+    def get_handler_metrics(self) -> Dict[str, Any]:
+        """Per-handler latency/error histograms and the slowest handlers"""
+        metrics = self.dispatcher.get_metrics()
+        metrics['slowest'] = self.dispatcher.slowest_handlers()
+        return metrics
+    
+    async def start_pipeline(self):
+        """Switch to pipelined execution and start the stage workers"""
+        if self.pipeline is None:
+            pipeline_config = self.config.get('pipeline', {})
+            # Below this size a worker-thread hop costs more than the torch stage saves
+            offload_torch = (
+                pipeline_config.get('offload_torch', True)
+                and self.config['model']['state_dim'] >= pipeline_config.get('offload_min_state_dim', 1024)
             )
-            
-            # Step 6: Update persistent state
-            self.current_state = h_t
-            
-            # Record metrics
-            processing_time = time.time() - start_time
-            self._update_metrics(validation_result, error_state, control_signal, processing_time)
-            
-            # Check convergence
-            converged = error_state.error_magnitude < self.config['lex_node']['convergence_threshold']
-            if converged:
-                self.state = NodeState.CONVERGED
-            else:
-                self.state = NodeState.READY
-            
-            # Store in history
-            self.directive_history.append({
-                'directive_id': directive_id,
-                'directive': directive,
-                'validation_result': validation_result,
-                'error_magnitude': error_state.error_magnitude,
-                'processing_time': processing_time,
-                'timestamp': time.time()
-            })
-            
-            return LexResponse(
-                status='success',
-                directive_id=directive_id,
-                correction=correction,
-                confidence=control_signal.confidence,
-                convergence_achieved=converged,
-                error_state=asdict(error_state),
-                processing_time=processing_time,
-                metadata={
-                    'validation_compliance': validation_result['compliance_score'],
-                    'control_action': control_signal.convergence_action,
-                    'node_id': self.node_id
-                }
+            self.pipeline = DirectivePipeline(
+                self,
+                queue_size=pipeline_config.get('queue_size', 64),
+                correction_workers=pipeline_config.get('correction_workers', 2),
+                offload_torch=offload_torch
             )
+        await self.pipeline.start()
+    
+    async def stop_pipeline(self):
+        """Drain the pipeline and return to serial execution"""
+        if self.pipeline is not None:
+            await self.pipeline.stop()
+            self.pipeline = None
+    
+    def axiom_hives(self) -> List[AxiomHive]:
+        """Axiom Hive directories this node loads axioms from"""
+        return [hive for hive in (self.validator.axiom_hive,) if hive is not None]
+    
+    async def start_axiom_watch(self):
+        """Hot-swap axiom sets when their Axiom Hive files change"""
+        for hive in self.axiom_hives():
+            await hive.start()
+    
+    async def stop_axiom_watch(self):
+        for hive in self.axiom_hives():
+            await hive.stop()
+    
+    # What-if simulation on forked state
+    
+    def fork(self) -> NodeFork:
+        """
+        Copy-on-write snapshot of current_state, the error model and histories
+        
+        Costs a copy of the error model's Python-side state only; tensors
+        are shared until either side replaces them. The live node is not
+        affected by anything done to the fork.
+        """
+        shared = [
+            (tensor, tensor._version)
+            for tensor in (self.current_state, self.target_state) if tensor is not None
+        ]
+        return NodeFork(
+            current_state=self.current_state,
+            target_state=self.target_state,
+            error_model=fork_copy(self.error_model, shared),
+            axiom_engine=self.validator.axiom_engine,
+            directive_history=list(self.directive_history),
+            convergence_history=list(self.convergence_history),
+            shared_tensors=shared
+        )
+    
+    def simulate(
+        self,
+        actions: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict]]] = None,
+        fork: Optional[NodeFork] = None
+    ) -> List[SimulationResult]:
+        """
+        Project the outcome of N candidate actions, each taken from the same state
+        
+        Compliance is evaluated for the whole batch at once, the kernel
+        advances all N candidate states in one batched call, and each
+        candidate steps its own branch of the forked error model. Nothing
+        is recorded on the live node: state, error model, validation
+        history, metrics and the global RNG stream are left as they were.
+        
+        Args:
+            actions: Directives ({'command', 'parameters'}) or bare actions,
+                which are evaluated as `validate_action` directives
+            contexts: Optional per-action context
+            fork: State to simulate from (default: a fresh fork of this node)
+        
+        Returns:
+            results: One SimulationResult per action, in order
+        
+        Raises:
+            CopyOnWriteError: A step wrote a tensor shared with the live node in place
+        """
+        if not actions:
+            return []
+        fork = fork if fork is not None else self.fork()
+        contexts = contexts if contexts is not None else [None] * len(actions)
+        directives = [self._action_directive(action, context) for action, context in zip(actions, contexts)]
+        
+        validations = fork.axiom_engine.evaluate_batch(
+            [directive.get('command', '') for directive in directives],
+            [directive.get('parameters', {}) for directive in directives],
+            self.validator.config.get('compliance_threshold', 0.95)
+        )
+        projections = self._project_actions(fork, actions, contexts)
+        
+        stats = fork.error_model.performance_stats
+        last_error = stats.values[-1] if len(stats) else None
+        threshold = self.config['lex_node']['convergence_threshold']
+        
+        results = []
+        # Private RNG stream: the input encoding draws exploration noise
+        with torch.random.fork_rng(devices=[]), torch.no_grad():
+            x_t = torch.cat([
+                self._directive_to_state_input(directive, validation)
+                for directive, validation in zip(directives, validations)
+            ])
+            h_prev = fork.current_state.reshape(1, -1).expand(len(directives), -1)
+            h_t, _, _ = self.kernel.kernel.forward(x_t, h_prev)
+            fork.check_shared_writes("Simulation kernel step")
+            distances = torch.norm(fork.target_state - h_t, dim=1).tolist()
             
-        except Exception as e:
-            logger.error(f"Error processing directive {directive_id}: {e}")
-            self.state = NodeState.ERROR
-            
-            return LexResponse(
-                status='error',
-                directive_id=directive_id,
-                correction={'error': str(e)},
+            for i, validation in enumerate(validations):
+                branch = fork.branch()
+                error_state, control_signal = branch.error_model.step(
+                    h_t[i], fork.target_state, dynamics_input=x_t[i:i + 1]
+                )
+                # Stop at the first offending branch, before later ones build on a corrupted state
+                branch.check_shared_writes(f"Simulation branch {i}")
+                results.append(SimulationResult(
+                    action=actions[i],
+                    valid=validation['valid'],
+                    compliance_score=validation['compliance_score'],
+                    projected_error=error_state.error_magnitude,
+                    error_delta=error_state.error_magnitude - last_error if last_error is not None else None,
+                    state_distance=distances[i],
+                    confidence=control_signal.confidence,
+                    converged=error_state.error_magnitude < threshold,
+                    control_action=control_signal.convergence_action,
+                    reason=validation.get('reason'),
+                    projections=projections[i]
+                ))
+        
+        return results
+    
+    def _action_directive(self, action: Dict[str, Any], context: Optional[Dict]) -> Dict[str, Any]:
+        """A candidate as a directive - as-is if it already is one, else as validate_action does"""
+        if 'command' in action:
+            return action
+        return {
+            'command': 'validate_action',
+            'parameters': {'action': action, 'context': context or {}},
+            'signature': 'local_signature'
+        }
+    
+    def _project_actions(
+        self,
+        fork: NodeFork,
+        actions: List[Dict[str, Any]],
+        contexts: List[Optional[Dict]]
+    ) -> List[Dict[str, Any]]:
+        """Node-specific projections per action (e.g. runway); none at the core node"""
+        return [{} for _ in actions]
+    
+    # Processing stages - shared by the serial path and DirectivePipeline
+    
+    def _begin_directive(
+        self,
+        directive: Dict[str, Any],
+        context: Optional[Dict] = None,
+        seq: int = 0
+    ) -> DirectiveWorkItem:
+        """Admit a directive and create its work item"""
+        start_time = time.time()
+        item = DirectiveWorkItem(
+            seq=seq,
+            directive=directive,
+            context=context,
+            directive_id=directive.get('id', f"dir_{int(start_time)}"),
+            start_time=start_time
+        )
+        
+        decision = self._admit_directive(directive, start_time)
+        if not decision.admitted:
+            self._record_shed(decision)
+            item.response = self._rejected_response(item, decision)
+            return item
+        
+        self.inflight_directives += 1
+        self.state = NodeState.PROCESSING
+        return item
+    
+    def _admit_dequeued(self, item: DirectiveWorkItem, queue_size: int):
+        """
+        CoDel check for a work item taken off the pipeline's first stage queue
+        
+        Args:
+            item: The dequeued work item (stamped with `enqueued_at` by submit)
+            queue_size: Items still waiting in that queue
+        """
+        now = time.time()
+        drop = self.admission.on_dequeue(
+            sojourn=max(0.0, now - item.enqueued_at),
+            priority=priority_value(item.directive.get('priority')),
+            queue_size=queue_size,
+            now=now
+        )
+        if drop:
+            decision = AdmissionDecision.reject(RejectionReason.OVERLOADED, self.admission.retry_after_hint())
+            self._record_shed(decision)
+            item.response = self._rejected_response(item, decision)
+    
+    def _rejected_response(self, item: DirectiveWorkItem, decision: AdmissionDecision) -> LexResponse:
+        """Response for a directive refused by admission control"""
+        return LexResponse(
+            status='rejected',
+            directive_id=item.directive_id,
+            correction={
+                'action': 'retry_later',
+                'reason': decision.reason.value,
+                'retry_after': decision.retry_after
+            },
+            confidence=0.0,
+            convergence_achieved=False,
+            error_state={'admission_rejected': True},
+            processing_time=time.time() - item.start_time,
+            metadata={'retry_after': decision.retry_after, 'node_id': self.node_id}
+        )
+    
+    def _end_directive(self, item: DirectiveWorkItem):
+        """Release the admission slot held by a directive"""
+        self.inflight_directives -= 1
+    
+    def _stage_validate(self, item: DirectiveWorkItem):
+        """Validate directive against sovereign axioms"""
+        validation_result = self.validator.validate_directive(item.directive, item.context)
+        item.validation_result = validation_result
+        
+        if not validation_result['valid']:
+            item.response = LexResponse(
+                status='refused',
+                directive_id=item.directive_id,
+                correction={
+                    'action': 'refuse_directive',
+                    'reason': validation_result['reason'],
+                    'required_corrections': validation_result.get('required_corrections', [])
+                },
                 confidence=0.0,
                 convergence_achieved=False,
-                error_state={'exception': str(e)},
-                processing_time=time.time() - start_time,
-                metadata={'error_type': type(e).__name__}
+                error_state={'validation_failed': True},
+                processing_time=time.time() - item.start_time,
+                metadata={'validation_result': validation_result}
+            )
+    
+    def _stage_tensorise(self, item: DirectiveWorkItem):
+        """Convert directive to tensor input"""
+        item.x_t = self._directive_to_state_input(item.directive, item.validation_result)
+    
+    def _stage_kernel(self, item: DirectiveWorkItem):
+        """Process through Lex-Mamba kernel and advance the persistent state"""
+        # Inference only - no autograd graph (thread-local, so set inside the stage)
+        with torch.no_grad():
+            h_t, y_pred, error_signal = self.kernel.kernel.forward(
+                item.x_t, 
+                self.current_state
             )
+        item.h_t, item.y_pred, item.error_signal = h_t, y_pred, error_signal
+        
+        # Update persistent state (kernel stage runs in submission order)
+        self.current_state = h_t
+    
+    def _ensemble_dynamics(self, members: torch.Tensor, x_t: Optional[torch.Tensor]) -> torch.Tensor:
+        """Push ensemble members through the kernel's state update in one batched call"""
+        if x_t is None:
+            return members
+        with torch.no_grad():
+            # x_t is [1, input_dim]; its projection broadcasts across the members
+            return self.kernel.kernel.state_space_step(x_t.reshape(1, -1), members)
+    
+    def _stage_error_model(self, item: DirectiveWorkItem):
+        """Apply error model for convergence"""
+        item.error_state, item.control_signal = self.error_model.step(
+            item.h_t.reshape(-1), 
+            self.target_state,
+            dynamics_input=item.x_t
+        )
+        # Taken on the thread that stepped the model, so it is consistent
+        item.error_model_metrics = self.error_model.get_performance_metrics()
+    
+    def _stage_correction(self, item: DirectiveWorkItem):
+        """Generate final correction"""
+        item.correction = self._generate_final_correction(
+            item.y_pred, 
+            item.error_signal, 
+            item.control_signal, 
+            item.validation_result
+        )
+    
+    def _stage_commit(self, item: DirectiveWorkItem) -> LexResponse:
+        """Record metrics and history, and build the response"""
+        if item.response is not None:
+            return item.response
+        
+        validation_result = item.validation_result
+        error_state = item.error_state
+        control_signal = item.control_signal
+        
+        # Record metrics
+        processing_time = time.time() - item.start_time
+        self._update_metrics(validation_result, error_state, control_signal, processing_time)
+        self.error_model_metrics = item.error_model_metrics
+        
+        # Check convergence
+        converged = error_state.error_magnitude < self.config['lex_node']['convergence_threshold']
+        if converged:
+            self.state = NodeState.CONVERGED
+        else:
+            self.state = NodeState.READY
+        
+        # Store in history (bounded deque - the oldest entry drops off in O(1))
+        self.directive_history.append({
+            'directive_id': item.directive_id,
+            'directive': item.directive,
+            'validation_result': validation_result,
+            'error_magnitude': error_state.error_magnitude,
+            'processing_time': processing_time,
+            'timestamp': time.time()
+        })
+        
+        if self.response_mode == 'compact':
+            error_state_data = error_state.summary()
+            error_vector = VectorHandle(error_state.error_vector)
+        else:
+            error_state_data = asdict(error_state)
+            error_vector = None
+        
+        return LexResponse(
+            status='success',
+            directive_id=item.directive_id,
+            correction=item.correction,
+            confidence=control_signal.confidence,
+            convergence_achieved=converged,
+            error_state=error_state_data,
+            processing_time=processing_time,
+            metadata={
+                'validation_compliance': validation_result['compliance_score'],
+                'control_action': control_signal.convergence_action,
+                'node_id': self.node_id
+            },
+            error_vector=error_vector
+        )
+    
+    def _error_response(self, item: DirectiveWorkItem, e: Exception) -> LexResponse:
+        """Build the response for a directive that failed in any stage"""
+        logger.error(f"Error processing directive {item.directive_id}: {e}")
+        self.state = NodeState.ERROR
+        
+        return LexResponse(
+            status='error',
+            directive_id=item.directive_id,
+            correction={'error': str(e)},
+            confidence=0.0,
+            convergence_achieved=False,
+            error_state={'exception': str(e)},
+            processing_time=time.time() - item.start_time,
+            metadata={'error_type': type(e).__name__}
+        )
+    
+    def _directive_deadline(self, directive: Dict[str, Any]) -> Optional[float]:
+        """Absolute deadline of a directive, if it carries one"""
+        if directive.get('deadline') is not None:
+            return float(directive['deadline'])
+        
+        timestamp = directive.get('timestamp')
+        timeout = directive.get('timeout')
+        if timeout is not None and isinstance(timestamp, (int, float)):
+            return float(timestamp) + float(timeout)
+        
+        return None
+    
+    def _admit_directive(self, directive: Dict[str, Any], now: float) -> AdmissionDecision:
+        """
+        Admission check for a directive
+        
+        Rejects expired directives, directives that cannot meet their deadline,
+        and low-priority work while the node is overloaded. The serial path
+        has no queue of its own (delay shedding happens at the BARK incoming
+        queue); in pipelined mode the first stage feeds its queue delay into
+        the CoDel state (see _admit_dequeued).
+        """
+        return self.admission.admit(
+            priority=priority_value(directive.get('priority')),
+            queue_size=self.inflight_directives,
+            deadline=self._directive_deadline(directive),
+            now=now
+        )
+    
+    def _ensure_metrics(self):
+        """Initialize metrics if needed"""
+        if not self.performance_metrics:
+            self.performance_metrics = {
+                'total_directives': 0,
+                'successful_directives': 0,
+                'refused_directives': 0,
+                'shed_directives': 0,
+                'shed_by_reason': {},
+                'avg_processing_time': 0.0,
+                'avg_error_magnitude': 0.0,
+                'avg_confidence': 0.0,
+                'convergence_rate': 0.0,
+                'compliance_scores': []
+            }
+    
+    def _record_shed(self, decision: AdmissionDecision):
+        """Count a directive shed by admission control"""
+        self._ensure_metrics()
+        self.performance_metrics['shed_directives'] += 1
+        
+        by_reason = self.performance_metrics['shed_by_reason']
+        by_reason[decision.reason.value] = by_reason.get(decision.reason.value, 0) + 1
+        
+        logger.debug(f"Shed directive ({decision.reason.value}), retry after {decision.retry_after:.3f}s")
     
     def _directive_to_state_input(
         self, 
@@ -397,17 +922,7 @@ class LexNode:
         """Update performance metrics"""
         
         # Initialize metrics if needed
-        if not self.performance_metrics:
-            self.performance_metrics = {
-                'total_directives': 0,
-                'successful_directives': 0,
-                'refused_directives': 0,
-                'avg_processing_time': 0.0,
-                'avg_error_magnitude': 0.0,
-                'avg_confidence': 0.0,
-                'convergence_rate': 0.0,
-                'compliance_scores': []
-            }
+        self._ensure_metrics()
         
         # Update counters
         self.performance_metrics['total_directives'] += 1
@@ -441,19 +956,71 @@ class LexNode:
             self.performance_metrics['compliance_scores'].pop(0)
         
         # Compute convergence rate
-        converged_count = sum(1 for resp in self.directive_history[-100:] 
+        converged_count = sum(1 for resp in islice(reversed(self.directive_history), 100) 
                             if resp.get('error_magnitude', 1.0) < 0.01)
-        self.performance_metrics['convergence_rate'] = converged_count / min(len(self.directive_history), 100)
+        self.performance_metrics['convergence_rate'] = converged_count / max(1, min(len(self.directive_history), 100))
+    
+    def create_metric_filters(self, names: List[str]) -> KalmanFilterBank:
+        """
+        Level/trend filter bank for a set of scalar domain metrics
+        
+        Args:
+            names: Metric names, one filter each
+        
+        Returns:
+            KalmanFilterBank stepped with observe({name: value})
+        """
+        error_config = self.config.get('error_model', {})
+        return KalmanFilterBank(
+            len(names),
+            state_dim=2,
+            observation_dim=1,
+            process_noise=error_config.get('state_noise', 0.01),
+            measurement_noise=error_config.get('measurement_noise', 0.1),
+            initial_variance=1e6,  # Diffuse prior: the first observation sets the level
+            names=names
+        )
+    
+    # Status snapshots - written only by the directive path, read lock-free
+    
+    def register_status_section(self, name: str, builder):
+        """
+        Add a section to the published status snapshot
+        
+        Args:
+            name: Section name, read back with snapshot().section(name)
+            builder: Callable returning the section's status dict from live state
+        """
+        self.snapshots.register_section(name, builder)
+        self.publish_snapshot()
+    
+    def publish_snapshot(self) -> NodeSnapshot:
+        """Publish a fresh snapshot of the node (call from the directive path only)"""
+        return self.snapshots.publish(self.state.value, self.current_state)
+    
+    def snapshot(self) -> NodeSnapshot:
+        """The latest published snapshot; never blocks and never changes under the reader"""
+        return self.snapshots.current
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current node status and metrics"""
+        """Get current node status and metrics (from the latest snapshot)"""
+        snapshot = self.snapshots.current
+        status = snapshot.section('node')
+        status['snapshot'] = {'version': snapshot.version, 'timestamp': snapshot.timestamp}
+        return status
+    
+    def _build_status(self) -> Dict[str, Any]:
+        """Node status from live state - runs on the writer side when publishing"""
         return {
             'node_id': self.node_id,
             'state': self.state.value,
             'metrics': self.performance_metrics,
+            'admission': self.admission.get_metrics(),
+            'pipeline': self.pipeline.get_metrics() if self.pipeline is not None else None,
             'directive_history_size': len(self.directive_history),
             'sovereign_compliance': self.validator.get_compliance_statistics(),
-            'error_model_performance': self.error_model.get_performance_metrics(),
+            'error_model_performance': self.error_model_metrics,
+            'snapshots': self.snapshots.get_metrics(),
             'config': {
                 'model_type': self.config['model']['architecture'],
                 'state_dim': self.config['model']['state_dim'],
@@ -475,7 +1042,7 @@ class LexNode:
         additional_state = {
             'current_state': self.current_state,
             'performance_metrics': self.performance_metrics,
-            'directive_history': self.directive_history[-100:],  # Keep last 100
+            'directive_history': list(islice(self.directive_history, max(0, len(self.directive_history) - 100), None)),  # Keep last 100
             'node_id': self.node_id,
             'timestamp': time.time()
         }
@@ -488,11 +1055,16 @@ class LexNode:
         """Gracefully shutdown the Lex Node"""
         logger.info(f"Shutting down Lex Node {self.node_id}...")
         
+        # Drain in-flight directives
+        await self.stop_pipeline()
+        await self.stop_axiom_watch()
+        
         # Save state
         self.save_state()
         
         # Update state
         self.state = NodeState.SHUTDOWN
+        self.publish_snapshot()
         
         logger.info(f"Lex Node {self.node_id} shutdown complete")
     
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+NODE FORK - Copy-on-write snapshots of Lex Node state for what-if simulation
+A fork shares every tensor with the live node instead of copying it. The
+node and its error model only ever replace state tensors (x = f(x), never
+x[...] = ...), so the two sides diverge by reassignment and neither sees
+the other's writes. Only the small Python-side state - statistics windows,
+telemetry, PID integrators, RNG generators - is copied. Tensor version
+counters are recorded at fork time, so an in-place write on a shared
+tensor by either side is detectable (NodeFork.shared_writes)
+"""
+
+import copy
+import types
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+_IMMUTABLE = frozenset({int, float, bool, str, bytes, complex, type(None), range, frozenset})
+
+# Shared as-is: code, types and modules (weights are read-only during simulation)
+_SHARED = (
+    types.FunctionType, types.BuiltinFunctionType, types.MethodType, types.ModuleType,
+    type, nn.Module, Enum
+)
+
+class CopyOnWriteError(RuntimeError):
+    """A shared tensor was written in place, so the fork leaked into the live node"""
+
+def fork_copy(
+    value: Any,
+    shared: Optional[List[Tuple[torch.Tensor, int]]] = None,
+    memo: Optional[Dict[int, Any]] = None
+) -> Any:
+    """
+    Structural copy that shares tensors
+    
+    Containers and plain objects are copied recursively, tensors are shared
+    (and recorded with their version counter in `shared`), torch generators
+    are cloned so the copy draws the same stream without advancing the
+    original's, and code/modules are shared.
+    
+    Args:
+        value: Object graph to copy
+        shared: Receives (tensor, version) for every shared tensor
+        memo: id -> copy, preserves aliasing and cycles
+    
+    Returns:
+        The copy
+    """
+    if type(value) in _IMMUTABLE:
+        return value
+    if memo is None:
+        memo = {}
+    key = id(value)
+    if key in memo:
+        return memo[key]
+    
+    if isinstance(value, torch.Tensor):
+        if shared is not None:
+            shared.append((value, value._version))
+        result = value
+    elif isinstance(value, _SHARED) or callable(value) and not hasattr(value, '__dict__'):
+        result = value
+    elif isinstance(value, torch.Generator):
+        result = torch.Generator()
+        result.set_state(value.get_state())
+    elif isinstance(value, np.ndarray):
+        result = value.copy()
+    elif isinstance(value, (list, deque)):
+        if _IMMUTABLE.issuperset(map(type, value)):
+            # Fast path for scalar histories
+            result = copy.copy(value)
+        else:
+            result = copy.copy(value)
+            memo[key] = result
+            for i, item in enumerate(value):
+                result[i] = fork_copy(item, shared, memo)
+    elif isinstance(value, dict):
+        result = copy.copy(value)
+        memo[key] = result
+        for name, item in value.items():
+            result[name] = fork_copy(item, shared, memo)
+    elif isinstance(value, (tuple, set)):
+        result = type(value)(fork_copy(item, shared, memo) for item in value)
+    else:
+        # Plain object (incl. slotted dataclasses): shallow copy, then its attributes
+        result = copy.copy(value)
+        memo[key] = result
+        for name, item in _attributes(value):
+            setattr(result, name, fork_copy(item, shared, memo))
+    
+    memo[key] = result
+    return result
+
+def _attributes(value: Any):
+    if hasattr(value, '__dict__'):
+        yield from list(vars(value).items())
+    for cls in type(value).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if name not in ('__dict__', '__weakref__') and hasattr(value, name):
+                yield name, getattr(value, name)
+
+@dataclass(slots=True)
+class NodeFork:
+    """
+    Copy-on-write snapshot of the state a directive advances
+    
+    `current_state` / `target_state` are the live tensors, shared.
+    `error_model` is a fork_copy of the live model. History lists are
+    copied, their entries are shared (they are never modified after being
+    recorded). `sections` holds node-specific state (e.g. 'wealth').
+    """
+    current_state: Optional[torch.Tensor]
+    target_state: Optional[torch.Tensor]
+    error_model: Any
+    axiom_engine: Any
+    directive_history: List[Dict[str, Any]]
+    convergence_history: List[Any]
+    sections: Dict[str, Any] = field(default_factory=dict)
+    shared_tensors: List[Tuple[torch.Tensor, int]] = field(default_factory=list)
+    
+    def branch(self) -> 'NodeFork':
+        """A fork of this fork, for one candidate of a batch"""
+        shared = []
+        return NodeFork(
+            current_state=self.current_state,
+            target_state=self.target_state,
+            error_model=fork_copy(self.error_model, shared),
+            axiom_engine=self.axiom_engine,
+            directive_history=self.directive_history,
+            convergence_history=self.convergence_history,
+            sections=fork_copy(self.sections, shared),
+            shared_tensors=shared
+        )
+    
+    def shared_writes(self) -> int:
+        """Shared tensors written in place since the fork - 0 unless some component breaks copy-on-write"""
+        return sum(1 for tensor, version in self.shared_tensors if tensor._version != version)
+    
+    def check_shared_writes(self, where: str):
+        """Raise CopyOnWriteError if any shared tensor has been written in place"""
+        writes = self.shared_writes()
+        if writes:
+            raise CopyOnWriteError(f"{where} wrote {writes} shared tensors in place; live state may be affected")
+
+@dataclass(slots=True)
+class SimulationResult:
+    """Projected outcome of one candidate action"""
+    action: Dict[str, Any]
+    valid: bool
+    compliance_score: float
+    projected_error: float
+    error_delta: Optional[float]  # vs the last recorded error; None without history
+    state_distance: float  # |target - h| of the projected state
+    confidence: float
+    converged: bool
+    control_action: str
+    reason: Optional[str] = None
+    projections: Dict[str, Any] = field(default_factory=dict)  # node-specific (e.g. runway)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'action': self.action,
+            'valid': self.valid,
+            'compliance_score': self.compliance_score,
+            'projected_error': self.projected_error,
+            'error_delta': self.error_delta,
+            'state_distance': self.state_distance,
+            'confidence': self.confidence,
+            'converged': self.converged,
+            'control_action': self.control_action,
+            'reason': self.reason,
+            **self.projections
+        }
\ No newline at end of file
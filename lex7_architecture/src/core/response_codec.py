@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+RESPONSE CODEC - Compact binary encoding for Lex Node responses
+Encodes LexResponse fields as a fixed struct header plus compact JSON
+sections, with the error vector carried only on request via a lazy handle
+"""
+
+import json
+import struct
+from typing import Dict, Any, Optional
+
+import numpy as np
+import torch
+
+RESPONSE_MAGIC = b"LXR1"
+
+# magic, status code, flags, confidence, processing_time, directive_id length
+_HEADER = struct.Struct("!4sBBddH")
+# correction, error_state, metadata section lengths
+_SECTIONS = struct.Struct("!III")
+# vector element count
+_VECTOR = struct.Struct("!I")
+
+_FLAG_CONVERGED = 0x01
+_FLAG_VECTOR = 0x02
+
+STATUS_CODES = {'success': 0, 'refused': 1, 'error': 2, 'rejected': 3}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+_STATUS_OTHER = 255
+
+def _json_bytes(value: Any) -> bytes:
+    """Compact JSON; numpy/torch scalars are coerced to float"""
+    return json.dumps(value, separators=(',', ':'), default=float).encode('utf-8')
+
+class VectorHandle:
+    """
+    Lazily materialised handle to a tensor carried alongside a response
+    
+    Holds a reference to the (detached) tensor. Nothing is copied or
+    converted until `materialize()` / `to_bytes()` is called.
+    """
+    
+    __slots__ = ('_tensor', '_raw')
+    
+    def __init__(self, tensor: Optional[torch.Tensor] = None, raw: Optional[memoryview] = None):
+        self._tensor = tensor.detach() if tensor is not None else None
+        self._raw = raw
+    
+    def __len__(self) -> int:
+        if self._tensor is not None:
+            return self._tensor.numel()
+        return len(self._raw) // 4 if self._raw is not None else 0
+    
+    def tensor(self) -> torch.Tensor:
+        """The vector as a float32 tensor"""
+        if self._tensor is None:
+            raw = self._raw if self._raw is not None else b""
+            self._tensor = torch.from_numpy(np.frombuffer(raw, dtype='<f4').astype(np.float32))
+            self._raw = None
+        return self._tensor
+    
+    def materialize(self) -> list:
+        """The vector as a Python list"""
+        return self.tensor().reshape(-1).tolist()
+    
+    def to_bytes(self) -> bytes:
+        """Raw little-endian float32 bytes"""
+        if self._tensor is None and self._raw is not None:
+            return bytes(self._raw)
+        return self.tensor().reshape(-1).to(torch.float32).numpy().astype('<f4', copy=False).tobytes()
+    
+    def __repr__(self) -> str:
+        return f"VectorHandle(dim={len(self)})"
+
+def encode_response(
+    status: str,
+    directive_id: str,
+    correction: Dict[str, Any],
+    confidence: float,
+    convergence_achieved: bool,
+    error_state: Dict[str, Any],
+    processing_time: float,
+    metadata: Dict[str, Any],
+    error_vector: Optional[VectorHandle] = None,
+    include_vector: bool = False
+) -> bytes:
+    """
+    Encode response fields into the compact binary form
+    
+    Layout: header struct | directive_id | [status name] | section lengths |
+    correction JSON | error_state JSON | metadata JSON | [count | float32 LE vector]
+    """
+    status_code = STATUS_CODES.get(status, _STATUS_OTHER)
+    flags = _FLAG_CONVERGED if convergence_achieved else 0
+    if include_vector and error_vector is not None:
+        flags |= _FLAG_VECTOR
+    
+    directive_bytes = directive_id.encode('utf-8')
+    parts = [
+        _HEADER.pack(RESPONSE_MAGIC, status_code, flags, float(confidence), float(processing_time), len(directive_bytes)),
+        directive_bytes
+    ]
+    
+    if status_code == _STATUS_OTHER:
+        status_bytes = status.encode('utf-8')
+        parts.append(struct.pack("!H", len(status_bytes)))
+        parts.append(status_bytes)
+    
+    correction_bytes = _json_bytes(correction)
+    error_state_bytes = _json_bytes(error_state)
+    metadata_bytes = _json_bytes(metadata)
+    parts.append(_SECTIONS.pack(len(correction_bytes), len(error_state_bytes), len(metadata_bytes)))
+    parts.extend((correction_bytes, error_state_bytes, metadata_bytes))
+    
+    if flags & _FLAG_VECTOR:
+        vector_bytes = error_vector.to_bytes()
+        parts.append(_VECTOR.pack(len(vector_bytes) // 4))
+        parts.append(vector_bytes)
+    
+    return b"".join(parts)
+
+def decode_response(data: bytes) -> Dict[str, Any]:
+    """
+    Decode the compact binary form back into response fields
+    
+    The error vector (if present) is returned as a VectorHandle over the
+    input buffer; it is only converted when materialised.
+    """
+    view = memoryview(data)
+    magic, status_code, flags, confidence, processing_time, id_len = _HEADER.unpack_from(view, 0)
+    if magic != RESPONSE_MAGIC:
+        raise ValueError("Not a compact Lex response")
+    
+    offset = _HEADER.size
+    directive_id = str(view[offset:offset + id_len], 'utf-8')
+    offset += id_len
+    
+    if status_code == _STATUS_OTHER:
+        (status_len,) = struct.unpack_from("!H", view, offset)
+        offset += 2
+        status = str(view[offset:offset + status_len], 'utf-8')
+        offset += status_len
+    else:
+        status = STATUS_NAMES[status_code]
+    
+    sections = _SECTIONS.unpack_from(view, offset)
+    offset += _SECTIONS.size
+    
+    decoded = []
+    for length in sections:
+        decoded.append(json.loads(view[offset:offset + length].tobytes()))
+        offset += length
+    correction, error_state, metadata = decoded
+    
+    error_vector = None
+    if flags & _FLAG_VECTOR:
+        (count,) = _VECTOR.unpack_from(view, offset)
+        offset += _VECTOR.size
+        error_vector = VectorHandle(raw=view[offset:offset + count * 4])
+    
+    return {
+        'status': status,
+        'directive_id': directive_id,
+        'correction': correction,
+        'confidence': confidence,
+        'convergence_achieved': bool(flags & _FLAG_CONVERGED),
+        'error_state': error_state,
+        'processing_time': processing_time,
+        'metadata': metadata,
+        'error_vector': error_vector
+    }
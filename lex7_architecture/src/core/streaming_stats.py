@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+STREAMING STATS - O(1) sliding-window statistics
+Keeps mean/variance (sliding Welford), least-squares slope (running
+sums), first-difference spread and min/max over the last N values, so
+error characteristics cost the same per step regardless of window size
+"""
+
+from collections import deque
+from typing import Dict, Optional
+
+class _WindowMoments:
+    """Sliding-window mean and population variance (Welford with removal)"""
+    
+    __slots__ = ('count', 'mean', 'm2')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def replace(self, old: float, new: float):
+        """Remove `old` and add `new` with the count unchanged"""
+        mean = self.mean + (new - old) / self.count
+        self.m2 += (new - old) * (new - mean + old - self.mean)
+        self.mean = mean
+    
+    def reset(self, values):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        for value in values:
+            self.add(value)
+    
+    @property
+    def variance(self) -> float:
+        return max(0.0, self.m2 / self.count) if self.count > 1 else 0.0
+
+class SlidingWindowStats:
+    """
+    Statistics over the last `window` values, updated in O(1) per push
+    
+    - mean / variance / std: sliding Welford update
+    - slope: least-squares slope against sample index, from running sums
+    - diff_std: std of first differences (a second Welford window)
+    - min / max: monotonic deques (amortised O(1))
+    
+    Running sums that subtract removed values drift slowly, so every
+    `window` pushes they are rebuilt from the buffer - O(window) once per
+    window, still O(1) amortised. Variances are population (ddof=0), as
+    numpy's var/std.
+    """
+    
+    def __init__(self, window: int):
+        """
+        Args:
+            window: Number of most recent values covered
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        
+        self.window = window
+        self.values: deque = deque()
+        self.total_pushes = 0
+        
+        self._moments = _WindowMoments()
+        self._diffs = _WindowMoments()
+        self._sum_iy = 0.0     # sum(i * y_i), i = 0..n-1 within the window
+        self._mins: deque = deque()  # (index, value), increasing values
+        self._maxs: deque = deque()  # (index, value), decreasing values
+        self._since_resync = 0
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def push(self, value: float):
+        """Add a value, evicting the oldest once the window is full"""
+        value = float(value)
+        values = self.values
+        previous = values[-1] if values else None
+        
+        if len(values) < self.window:
+            n = len(values)
+            self._sum_iy += n * value
+            values.append(value)
+            self._moments.add(value)
+            if previous is not None:
+                self._diffs.add(value - previous)
+        else:
+            old = values.popleft()
+            # Remaining samples shift one index down
+            self._sum_iy -= self._moments.mean * self._moments.count - old
+            self._sum_iy += (self.window - 1) * value
+            values.append(value)
+            self._moments.replace(old, value)
+            self._diffs.replace(values[0] - old, value - previous)
+        
+        index = self.total_pushes
+        self.total_pushes += 1
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((index, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((index, value))
+        oldest = self.total_pushes - len(values)
+        if self._mins[0][0] < oldest:
+            self._mins.popleft()
+        if self._maxs[0][0] < oldest:
+            self._maxs.popleft()
+        
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._resync()
+    
+    def _resync(self):
+        """Rebuild the running sums from the buffer"""
+        values = list(self.values)
+        self._moments.reset(values)
+        self._diffs.reset(b - a for a, b in zip(values, values[1:]))
+        self._sum_iy = sum(i * y for i, y in enumerate(values))
+        self._since_resync = 0
+    
+    @property
+    def mean(self) -> float:
+        return self._moments.mean if self.values else 0.0
+    
+    @property
+    def variance(self) -> float:
+        return self._moments.variance
+    
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+    
+    @property
+    def slope(self) -> float:
+        """Least-squares slope of value against sample index"""
+        n = len(self.values)
+        if n < 2:
+            return 0.0
+        sum_i = n * (n - 1) / 2.0
+        sum_ii = (n - 1) * n * (2 * n - 1) / 6.0
+        sum_y = self._moments.mean * n
+        return (n * self._sum_iy - sum_i * sum_y) / (n * sum_ii - sum_i * sum_i)
+    
+    @property
+    def diff_std(self) -> float:
+        """Population std of first differences"""
+        return self._diffs.variance ** 0.5
+    
+    @property
+    def min(self) -> Optional[float]:
+        return self._mins[0][1] if self._mins else None
+    
+    @property
+    def max(self) -> Optional[float]:
+        return self._maxs[0][1] if self._maxs else None
+    
+    def summary(self) -> Dict[str, float]:
+        """All window statistics"""
+        return {
+            'count': len(self.values),
+            'mean': self.mean,
+            'variance': self.variance,
+            'std': self.std,
+            'slope': self.slope,
+            'diff_std': self.diff_std,
+            'min': self.min if self.min is not None else 0.0,
+            'max': self.max if self.max is not None else 0.0
+        }
+
+# Example usage and testing
+if __name__ == "__main__":
+    import numpy as np
+    
+    stats = SlidingWindowStats(10)
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=1000).cumsum()
+    for value in values:
+        stats.push(value)
+    
+    recent = values[-10:]
+    print(f"Streaming: {stats.summary()}")
+    print(
+        f"numpy:     var={np.var(recent):.6f} slope={np.polyfit(range(10), recent, 1)[0]:.6f} "
+        f"diff_std={np.std(np.diff(recent)):.6f} min={recent.min():.6f} max={recent.max():.6f}"
+    )
\ No newline at end of file
@@ -11,7 +11,7 @@ import asyncio
 import time
 import json
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 import logging
 
@@ -77,9 +77,17 @@ class LexVitalityNode(LexNode):
         self.health_thresholds = self._initialize_health_thresholds()
         self.vitality_model = None
         
+        # Smoothed level/trend per metric, all filters stepped together
+        self.metric_filters = self.create_metric_filters(
+            [field.name for field in fields(VitalityMetrics) if field.name != 'timestamp']
+        )
+        
         # Register vitality-specific directive handlers
         self._register_vitality_handlers()
         
+        # Publish vitality status through the node snapshot
+        self.register_status_section('vitality', self._build_vitality_status)
+        
         logger.info(f"Lex Vitality Node {node_id} initialized")
     
     def _initialize_health_thresholds(self) -> Dict[str, Dict[str, float]]:
@@ -150,11 +158,14 @@ class LexVitalityNode(LexNode):
             # Update vitality metrics
             self.current_vitality = VitalityMetrics(**processed_data)
             self.vitality_history.append(self.current_vitality)
+            self.metric_filters.observe(self.current_vitality.to_dict())
             
             # Limit history size
             if len(self.vitality_history) > 1000:
                 self.vitality_history.pop(0)
             
+            self.publish_snapshot()
+            
             # Generate immediate recommendations if needed
             recommendations = await self._generate_immediate_recommendations()
             
@@ -661,11 +672,225 @@ class LexVitalityNode(LexNode):
         
         return analysis
     
+    async def _handle_update_vitality_metrics(self, directive: BARKDirective, message):
+        """Handle direct updates to vitality metrics (no kernel pass)"""
+        try:
+            updates = directive.parameters.get('metrics', {})
+            
+            # Merge known fields into a new metrics record
+            current = self.current_vitality.to_dict()
+            current.update({k: v for k, v in updates.items() if k in current and k != 'timestamp'})
+            current['timestamp'] = time.time()
+            
+            self.current_vitality = VitalityMetrics(**current)
+            self.vitality_history.append(self.current_vitality)
+            self.metric_filters.observe(self.current_vitality.to_dict())
+            
+            if len(self.vitality_history) > 1000:
+                self.vitality_history.pop(0)
+            
+            self.publish_snapshot()
+            
+            response = BARKResponse(
+                response_id=f"vitality_update_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="success",
+                result={
+                    'current_metrics': self.current_vitality.to_dict(),
+                    'vitality_score': self._calculate_overall_vitality_score()
+                }
+            )
+        
+        except Exception as e:
+            response = BARKResponse(
+                response_id=f"vitality_update_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="error",
+                result={'error': str(e)}
+            )
+        
+        return response
+    
+    async def _handle_optimize_sleep_schedule(self, directive: BARKDirective, message):
+        """Plan a gradual adjustment toward the optimal sleep duration"""
+        try:
+            thresholds = self.health_thresholds['sleep']
+            current_hours = directive.parameters.get('sleep_hours', self.current_vitality.sleep_hours)
+            if current_hours is None:
+                current_hours = thresholds['minimum_hours']
+            target_hours = directive.parameters.get('target_hours', thresholds['optimal_hours'])
+            
+            # Shift by at most 15 minutes per night
+            deficit = target_hours - current_hours
+            nights_to_target = int(np.ceil(abs(deficit) / 0.25)) if abs(deficit) > 0 else 0
+            
+            recommendations = []
+            if current_hours < thresholds['minimum_hours']:
+                recommendations.append("Move bedtime 15 minutes earlier each night until target is reached")
+            elif current_hours > thresholds['maximum_hours']:
+                recommendations.append("Keep a fixed wake time and reduce time in bed gradually")
+            recommendations.append("Keep sleep and wake times consistent, including weekends")
+            
+            stress_level = self.current_vitality.stress_level
+            if stress_level is not None and stress_level > self.health_thresholds['stress']['moderate_max']:
+                recommendations.append("Add a wind-down routine - elevated stress is limiting sleep quality")
+            
+            response = BARKResponse(
+                response_id=f"sleep_schedule_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="success",
+                result={
+                    'current_hours': current_hours,
+                    'target_hours': target_hours,
+                    'nightly_adjustment_minutes': 15 if deficit else 0,
+                    'nights_to_target': nights_to_target,
+                    'recommendations': recommendations
+                }
+            )
+        
+        except Exception as e:
+            response = BARKResponse(
+                response_id=f"sleep_schedule_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="error",
+                result={'error': str(e)}
+            )
+        
+        return response
+    
+    async def _handle_plan_exercise_routine(self, directive: BARKDirective, message):
+        """Plan a weekly exercise routine scaled to recovery"""
+        try:
+            thresholds = self.health_thresholds['exercise']
+            days_per_week = max(1, min(7, directive.parameters.get('days_per_week', 5)))
+            weekly_target = directive.parameters.get('weekly_minutes', thresholds['target_minutes'])
+            
+            # Scale intensity with recovery (1-10)
+            recovery = self.current_vitality.recovery_score or 5.0
+            if recovery < 4:
+                intensity = 'low'
+                weekly_target *= 0.6
+            elif recovery < 7:
+                intensity = 'moderate'
+            else:
+                intensity = 'high'
+            
+            weekly_target = min(weekly_target, thresholds['maximum_minutes'])
+            session_minutes = weekly_target / days_per_week
+            
+            response = BARKResponse(
+                response_id=f"exercise_plan_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="success",
+                result={
+                    'weekly_minutes': weekly_target,
+                    'days_per_week': days_per_week,
+                    'session_minutes': session_minutes,
+                    'intensity': intensity,
+                    'recovery_score': recovery
+                }
+            )
+        
+        except Exception as e:
+            response = BARKResponse(
+                response_id=f"exercise_plan_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="error",
+                result={'error': str(e)}
+            )
+        
+        return response
+    
+    async def _handle_validate_health_action(self, directive: BARKDirective, message):
+        """Validate a proposed action against health thresholds"""
+        try:
+            action = directive.parameters.get('action', {})
+            metrics = self.current_vitality.to_dict()
+            violations = []
+            warnings = []
+            
+            # Projected values after the action
+            sleep_hours = (metrics.get('sleep_hours') or self.health_thresholds['sleep']['optimal_hours']) + action.get('sleep_hours_delta', 0)
+            stress_level = (metrics.get('stress_level') or 5.0) + action.get('stress_delta', 0)
+            exercise_minutes = action.get('exercise_minutes', 0)
+            
+            if sleep_hours < self.health_thresholds['sleep']['minimum_hours']:
+                violations.append(f"Projected sleep {sleep_hours:.1f}h is below the minimum")
+            if stress_level > self.health_thresholds['stress']['high_max'] * 0.8:
+                violations.append(f"Projected stress level {stress_level:.1f} is too high")
+            if exercise_minutes > self.health_thresholds['exercise']['maximum_minutes']:
+                warnings.append("Exercise volume exceeds the weekly maximum")
+            if (metrics.get('recovery_score') or 10.0) < 4 and exercise_minutes > 0:
+                warnings.append("Recovery is low - prefer light activity")
+            
+            response = BARKResponse(
+                response_id=f"health_validation_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="success",
+                result={
+                    'approved': not violations,
+                    'violations': violations,
+                    'warnings': warnings
+                }
+            )
+        
+        except Exception as e:
+            response = BARKResponse(
+                response_id=f"health_validation_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="error",
+                result={'error': str(e)}
+            )
+        
+        return response
+    
+    async def _handle_assess_recovery_status(self, directive: BARKDirective, message):
+        """Assess recovery from the latest metrics and recent trend"""
+        try:
+            recovery = self.current_vitality.recovery_score
+            recent = [v.recovery_score for v in self.vitality_history[-14:] if v.recovery_score is not None]
+            
+            if recovery is None:
+                status = 'unknown'
+            elif recovery >= 7:
+                status = 'recovered'
+            elif recovery >= 4:
+                status = 'partial'
+            else:
+                status = 'needs_rest'
+            
+            response = BARKResponse(
+                response_id=f"recovery_status_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="success",
+                result={
+                    'recovery_score': recovery,
+                    'status': status,
+                    'trend': self._calculate_trend(recent),
+                    'energy_level': self.current_vitality.energy_level
+                }
+            )
+        
+        except Exception as e:
+            response = BARKResponse(
+                response_id=f"recovery_status_{directive.directive_id}",
+                directive_id=directive.directive_id,
+                status="error",
+                result={'error': str(e)}
+            )
+        
+        return response
+    
     def get_vitality_status(self) -> Dict[str, Any]:
-        """Get current vitality status"""
+        """Get current vitality status (from the latest snapshot)"""
+        return self.snapshot().section('vitality')
+    
+    def _build_vitality_status(self) -> Dict[str, Any]:
+        """Vitality status from live state, built when a snapshot is published"""
         return {
             'node_id': self.node_id,
             'current_metrics': self.current_vitality.to_dict(),
+            'filtered_metrics': self.metric_filters.estimates(),
             'health_thresholds': self.health_thresholds,
             'data_history_size': len(self.vitality_history),
             'recommendations_count': len(self.optimization_cache),